@@ -0,0 +1,85 @@
+"""
+Tests de la signature par lots (racine de Merkle des hachages de messages).
+"""
+
+from tp1.batch import BatchProof, BatchSign
+from tp1.hashes import BLAKE2S
+from tp1.lamport import Lamport, Message, Sig
+
+
+class TestBatchSign:
+    def test_all_sizes(self):
+        """
+        Chaque membre est accepté, pour des lots de toutes les formes (tailles impaires comprises).
+        """
+        for size in (1, 2, 3, 5, 8, 13):
+            sk, pk = Lamport.generate_keys()
+            msgs = [Message.from_str(f"Lot {size} : {i}") for i in range(size)]
+            proofs = BatchSign.sign_batch(msgs, sk)
+            assert all(p.sig is proofs[0].sig for p in proofs)
+            for msg, proof in zip(msgs, proofs):
+                assert len(proof.path) <= (size - 1).bit_length()
+                assert BatchSign.verify_batch_member(msg, pk, proof)
+
+    def test_rejects(self):
+        sk, pk = Lamport.generate_keys()
+        msgs = [Message.from_str(str(i)) for i in range(6)]
+        proofs = BatchSign.sign_batch(msgs, sk)
+
+        # Autre message, autre position, autre taille, chemin tronqué, autre clé.
+        assert not BatchSign.verify_batch_member(Message.from_str("7"), pk, proofs[0])
+        assert not BatchSign.verify_batch_member(msgs[1], pk, proofs[0])
+        resized = BatchProof(5, 7, proofs[5].path, proofs[5].sig)
+        assert not BatchSign.verify_batch_member(msgs[5], pk, resized)
+        truncated = BatchProof(0, 6, proofs[0].path[:-1], proofs[0].sig)
+        assert not BatchSign.verify_batch_member(msgs[0], pk, truncated)
+        _, other_pk = Lamport.generate_keys()
+        assert not BatchSign.verify_batch_member(msgs[0], other_pk, proofs[0])
+
+    def test_cached_root(self, monkeypatch):
+        """
+        La signature de la racine n'est vérifiée qu'une fois pour tout le lot.
+        """
+        sk, pk = Lamport.generate_keys()
+        msgs = [Message.from_str(f"Cache {i}") for i in range(10)]
+        proofs = BatchSign.sign_batch(msgs, sk)
+
+        calls = []
+        verify = Lamport.verify
+        monkeypatch.setattr(
+            Lamport, "verify", lambda *args: calls.append(1) or verify(*args)
+        )
+        for msg, proof in zip(msgs, proofs):
+            assert BatchSign.verify_batch_member(msg, pk, proof)
+        assert len(calls) == 1
+
+    def test_serialization(self):
+        sk, pk = Lamport.generate_keys(BLAKE2S)
+        msgs = [Message.from_str(str(i)) for i in range(3)]
+        proof = BatchSign.sign_batch(msgs, sk)[2]
+        decoded = BatchProof.from_hex(proof.to_hex())
+        assert decoded.path == proof.path and decoded.sig == proof.sig
+        assert BatchSign.verify_batch_member(msgs[2], pk, decoded)
+
+    def test_members(self):
+        """
+        verify_batch_members donne le même résultat que verify_batch_member, membre par membre.
+        """
+        sk, pk = Lamport.generate_keys()
+        msgs = [Message.from_str(f"Membres {i}") for i in range(7)]
+        proofs = BatchSign.sign_batch(msgs, sk)
+        msgs[3] = Message.from_str("Intrus")
+        expected = [i != 3 for i in range(7)]
+        assert BatchSign.verify_batch_members(msgs, pk, proofs) == expected
+
+    def test_failure_not_cached(self):
+        """
+        Une preuve dont la signature est invalide n'empêche pas d'accepter ensuite
+        la bonne signature de la même racine.
+        """
+        sk, pk = Lamport.generate_keys()
+        msgs = [Message.from_str(f"Échec {i}") for i in range(4)]
+        proofs = BatchSign.sign_batch(msgs, sk)
+        forged = BatchProof(0, 4, proofs[0].path, Sig.from_bytes(bytes(Sig.SIZE)))
+        assert not BatchSign.verify_batch_member(msgs[0], pk, forged)
+        assert BatchSign.verify_batch_member(msgs[0], pk, proofs[0])
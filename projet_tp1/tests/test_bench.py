@@ -0,0 +1,42 @@
+"""
+Tests du banc d'essai tp1.bench.
+"""
+
+import json
+
+from tp1.bench import BENCHMARKS, compare, main, run
+
+
+class TestBench:
+    def test_run_all(self):
+        """
+        Chaque mesure produit un débit et des percentiles ordonnés.
+        """
+        results = run(repeat=3)
+        assert set(results) == set(BENCHMARKS)
+        for stats in results.values():
+            assert stats["ops_per_sec"] > 0
+            assert stats["p50_us"] <= stats["p90_us"] <= stats["p99_us"]
+
+    def test_compare(self):
+        """
+        Seules les baisses de débit au-delà du seuil sont signalées.
+        """
+        baseline = {"sign": {"ops_per_sec": 1000}, "verify": {"ops_per_sec": 1000}}
+        results = {"sign": {"ops_per_sec": 900}, "verify": {"ops_per_sec": 700}}
+        regressions = compare(results, baseline, threshold=0.2)
+        assert len(regressions) == 1
+        assert regressions[0].startswith("verify")
+
+    def test_cli_baseline(self, tmp_path):
+        """
+        La ligne de commande écrit du JSON et échoue face à une référence inatteignable.
+        """
+        output = tmp_path / "bench.json"
+        assert main(["sig_to_hex", "--repeat", "3", "--json", str(output)]) == 0
+        results = json.loads(output.read_text())
+        assert "sig_to_hex" in results
+
+        results["sig_to_hex"]["ops_per_sec"] *= 1000
+        output.write_text(json.dumps(results))
+        assert main(["sig_to_hex", "--repeat", "3", "--baseline", str(output)]) == 1
@@ -0,0 +1,93 @@
+"""
+Tests de l'index des pré-images révélées.
+"""
+
+import io
+import math
+
+from tp1 import signatures
+from tp1.hashes import BLAKE2S
+from tp1.coverage import CoverageIndex
+from tp1.forge import coverage_masks
+from tp1.lamport import Lamport, Message, PublicKey, Sig
+
+
+def _provided():
+    """
+    Retourne les 5 paires (message, signature) fournies.
+    """
+    return [
+        (Message.from_str(str(k)), Sig.from_hex(getattr(signatures, f"hex_sig_{k}")))
+        for k in range(1, 6)
+    ]
+
+
+def _lines():
+    return [(str(k), sig) for k, (_, sig) in enumerate(_provided(), start=1)]
+
+
+class TestCoverageIndex:
+    def test_provided_signatures(self):
+        """
+        Les pré-images retenues sont celles de la clé publique fournie, et les masques
+        sont ceux de forge.coverage_masks.
+        """
+        pk = PublicKey.from_hex(signatures.hex_pub_key)
+        index = CoverageIndex(pk)
+        assert index.add_many(_provided()) == 5
+
+        assert index.masks == coverage_masks(index.known)
+        for b, row in enumerate((index.sk.zero_pre, index.sk.one_pre)):
+            expected = (pk.zero_hash, pk.one_hash)[b]
+            for i in index.known[b]:
+                assert row[i].hash_data() == bytes(expected[i].data)
+
+        report = index.report()
+        assert report["coverage"] == (256 + report["free_bits"]) / 512
+        assert report["expected_attempts"] == 2.0 ** (256 - report["free_bits"])
+
+    def test_rejects_bad_signature(self):
+        pk = PublicKey.from_hex(signatures.hex_pub_key)
+        index = CoverageIndex(pk)
+        assert not index.add(Message.from_str("6"), Sig.from_hex(signatures.hex_sig_1))
+        assert index.rejected == 1 and index.coverage() == 0.0
+
+    def test_incremental(self):
+        """
+        Une seule signature fixe chaque position ; un même message n'ajoute rien.
+        """
+        sk, _ = Lamport.generate_keys()
+        msg = Message.from_str("Une fois")
+        index = CoverageIndex()
+        index.add(msg, Lamport.sign(msg, sk))
+        assert index.coverage() == 0.5
+        assert index.free_bits() == 0
+        assert index.expected_attempts() == 2.0**256
+
+        index.add(msg, Lamport.sign(msg, sk))
+        assert index.coverage() == 0.5 and index.signatures == 2
+
+    def test_stream(self):
+        """
+        Une signature par ligne : la signature en hexadécimal, puis le message.
+        """
+        stream = io.StringIO(
+            "".join(f"{sig.to_hex()} {msg_str}\n" for msg_str, sig in _lines())
+        )
+        index = CoverageIndex(PublicKey.from_hex(signatures.hex_pub_key))
+        assert index.add_stream(stream) == 5
+        assert index.masks == coverage_masks(index.known)
+
+    def test_backend(self):
+        """
+        La clé reconstituée utilise la fonction de hachage de la clé publique.
+        """
+        sk, pk = Lamport.generate_keys(BLAKE2S)
+        msg = Message.from_str("blake2s", BLAKE2S)
+        index = CoverageIndex(pk)
+        assert index.add(msg, Lamport.sign(msg, sk))
+        assert index.sk.backend is BLAKE2S
+        assert Lamport.verify(msg, pk, Lamport.sign(msg, index.sk))
+
+    def test_empty(self):
+        assert CoverageIndex().expected_attempts() == math.inf
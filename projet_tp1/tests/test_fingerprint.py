@@ -0,0 +1,45 @@
+"""
+Tests des empreintes de clé publique et des signatures étendues.
+"""
+
+from tp1.lamport import ExtendedSig, Lamport, Message, PublicKeyFingerprint
+
+
+class TestFingerprint:
+    def test_good_sig(self):
+        """
+        Une signature étendue se vérifie avec l'empreinte comme avec la clé complète.
+        """
+        msg = Message.from_str("Empreinte")
+        sk, pk = Lamport.generate_keys()
+        fingerprint = pk.fingerprint()
+        assert len(fingerprint.to_bytes()) == 32
+
+        sig = Lamport.sign_extended(msg, sk)
+        assert Lamport.rebuild_public_key(msg, sig) == pk
+        assert Lamport.verify(msg, fingerprint, sig)
+        assert Lamport.verify(msg, pk, sig)
+        assert sig.sig() == Lamport.sign(msg, sk)
+
+    def test_bad_sig(self):
+        """
+        Une signature étendue modifiée, ou une signature ordinaire, est refusée avec une empreinte.
+        """
+        msg = Message.from_str("Mauvaise empreinte")
+        sk, pk = Lamport.generate_keys()
+        fingerprint = pk.fingerprint()
+
+        assert not Lamport.verify(msg, fingerprint, Lamport.sign(msg, sk))
+
+        sig = Lamport.sign_extended(msg, sk)
+        assert not Lamport.verify(Message.from_str("Autre"), fingerprint, sig)
+
+        sig.complement[42] = bytes(32)
+        assert not Lamport.verify(msg, fingerprint, sig)
+
+    def test_serialization(self):
+        msg = Message.from_str("Hexadécimal")
+        sk, pk = Lamport.generate_seeded_keys()
+        fingerprint = PublicKeyFingerprint.from_hex(pk.fingerprint().to_hex())
+        sig = ExtendedSig.from_hex(Lamport.sign_extended(msg, sk).to_hex())
+        assert Lamport.verify(msg, fingerprint, sig)
@@ -4,9 +4,34 @@ valide à partir de la clé publique `hex_pub_key` codée en dur.
 Si ce test réussit avec les autres tests, cela signifie que la falsification a fonctionné.
 """
 
-from tp1.lamport import Lamport, Message, PublicKey
+import pytest
+
+from tp1.lamport import Lamport, Message, PublicKey, Sig
 from tp1.signatures import hex_pub_key
-from tp1.forge import forge
+from tp1 import signatures
+from tp1.forge import (
+    candidate,
+    coverage_masks,
+    forge,
+    is_forgeable,
+    revealed_preimages,
+    search,
+)
+
+
+def _known():
+    """
+    Retourne les pré-images révélées par les 5 signatures fournies.
+    """
+    return revealed_preimages(
+        [
+            (
+                Message.from_str(str(k)),
+                Sig.from_hex(getattr(signatures, f"hex_sig_{k}")),
+            )
+            for k in range(1, 6)
+        ]
+    )
 
 
 class TestForgery:
@@ -14,12 +39,8 @@ class TestForgery:
         # Obtention de la clé publique.
         pk = PublicKey.from_hex(hex_pub_key)
 
-        # Notez que ce test appelle la fonction forge(), ce qui peut prendre un certain temps.
-        # Une façon de rendre cela beaucoup plus rapide est qu'une fois que vous avez réussi
-        # à contrefaire une signature, vous pouvez modifier le code dans forge() pour qu'il démarre
-        # juste avant qu'il n'atteigne la falsification, de sorte que l'exécution de forge() soit très rapide.
-        # Le fait que vous sachiez commencer à environ 15 000 comme nombre d'itérations
-        # est une bonne preuve que vous avez déjà fait le travail du processeur auparavant.
+        # La recherche part toujours du compteur 0 et parcourt les plages dans l'ordre :
+        # le message trouvé est donc le même à chaque exécution.
         forged_string, forged_sig = forge()
 
         # Assurez-vous que le message pour la signature falsifiée contient le mot "contrefait".
@@ -35,3 +56,61 @@ class TestForgery:
         forged_msg = Message.from_str(forged_string)
         worked = Lamport.verify(forged_msg, pk, forged_sig)
         assert worked
+
+    def test_parallel_matches_sequential(self):
+        """
+        Le compteur trouvé ne dépend pas du nombre de processus.
+        """
+        _, known = _known()
+        sequential = search("Mon message contrefait", known, workers=1)
+        parallel = search("Mon message contrefait", known, workers=2)
+        assert sequential.nonce == parallel.nonce
+        assert sequential.searched == sequential.nonce + 1
+
+    def test_checkpoint_resume(self, tmp_path):
+        """
+        Une recherche reprise à partir d'un point de contrôle retrouve la même solution
+        sans refaire le travail déjà enregistré.
+        """
+        _, known = _known()
+        checkpoint = str(tmp_path / "forge.json")
+
+        first = search(
+            "Mon message contrefait", known, workers=1, checkpoint=checkpoint
+        )
+        resumed = search(
+            "Mon message contrefait", known, workers=1, checkpoint=checkpoint
+        )
+        assert resumed.nonce == first.nonce
+        assert resumed.searched == 1
+
+        # Un autre préfixe ne réutilise pas le point de contrôle.
+        other = search(
+            "Autre message contrefait", known, workers=1, checkpoint=checkpoint
+        )
+        assert other.searched == other.nonce + 1
+        assert "contrefait" in candidate("Autre message contrefait", other.nonce)
+
+    def test_uncovered_position(self):
+        """
+        Sans pré-image connue à une position, la recherche échoue au lieu de tourner
+        indéfiniment.
+        """
+        _, known = _known()
+        reduced = (known[0] - {7}, known[1] - {7})
+        with pytest.raises(ValueError, match=r"\[7\]"):
+            search("Mon message contrefait", reduced, workers=2)
+
+    def test_masks_match_bitwise_check(self):
+        """
+        Le test par masques accepte exactement les hachages dont chaque bit
+        a une pré-image connue.
+        """
+        _, known = _known()
+        masks = coverage_masks(known)
+        for n in range(2000):
+            digest = Message.from_str(candidate("Masques", n)).data
+            bits = [digest[i // 8] >> (7 - (i % 8)) & 1 for i in range(256)]
+            expected = all(i in known[b] for i, b in enumerate(bits))
+            assert is_forgeable(digest, masks) == expected
+        assert is_forgeable(Message.from_str("1").data, masks)
@@ -0,0 +1,40 @@
+"""
+Tests de la génération de clés en lot Lamport.generate_keys_many.
+"""
+
+import itertools
+
+from tp1.lamport import Lamport, Message
+
+
+class TestGenerateKeysMany:
+    def test_count_and_validity(self):
+        """
+        Le nombre de paires demandé est produit et chacune permet de signer.
+        """
+        pairs = list(Lamport.generate_keys_many(10, batch_size=4))
+        assert len(pairs) == 10
+
+        msg = Message.from_str("Lot")
+        for sk, pk in pairs:
+            assert Lamport.verify(msg, pk, Lamport.sign(msg, sk))
+
+        # Toutes les clés secrètes sont différentes.
+        assert len({sk.to_bytes() for sk, _ in pairs}) == 10
+
+    def test_unbounded_stream(self):
+        """
+        Sans nombre fixé, le générateur produit des clés à la demande.
+        """
+        stream = Lamport.generate_keys_many(batch_size=3)
+        assert len(list(itertools.islice(stream, 7))) == 7
+
+    def test_process_pool(self):
+        """
+        Les lots générés par d'autres processus sont également valides.
+        """
+        msg = Message.from_str("Processus")
+        pairs = list(Lamport.generate_keys_many(9, batch_size=2, workers=2))
+        assert len(pairs) == 9
+        for sk, pk in pairs:
+            assert Lamport.verify(msg, pk, Lamport.sign(msg, sk))
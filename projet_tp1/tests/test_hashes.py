@@ -0,0 +1,67 @@
+"""
+Tests des fonctions de hachage interchangeables.
+"""
+
+import pytest
+
+from tp1.hashes import BACKENDS, BLAKE2B, SHA256, get_backend
+from tp1.lamport import (
+    ExtendedSig,
+    Lamport,
+    Message,
+    PublicKey,
+    PublicKeyFingerprint,
+    SeedSecretKey,
+    Sig,
+)
+from tp1.signatures import hex_pub_key
+
+
+class TestHashes:
+    def test_all_backends(self):
+        """
+        Chaque fonction de hachage signe et vérifie, y compris après sérialisation.
+        """
+        for backend in BACKENDS.values():
+            msg = Message.from_str("Fonction", backend)
+            sk, pk = Lamport.generate_keys(backend)
+            sig = Lamport.sign(msg, sk)
+            assert Lamport.verify(msg, pk, sig)
+
+            pk = PublicKey.from_hex(pk.to_hex())
+            sig = Sig.from_bytes(sig.to_bytes())
+            assert pk.backend is backend and sig.backend is backend
+            assert Lamport.verify(msg, pk, sig)
+
+    def test_serialized_form(self):
+        """
+        sha256 conserve le format historique ; les autres ajoutent un identifiant d'un octet.
+        """
+        assert PublicKey.from_hex(hex_pub_key).to_hex() == hex_pub_key
+
+        sk, pk = Lamport.generate_keys(BLAKE2B)
+        assert len(pk.to_bytes()) == PublicKey.SIZE + 1
+        assert pk.to_bytes()[0] == BLAKE2B.ident
+
+        seed_sk = SeedSecretKey(bytes(32), BLAKE2B)
+        assert SeedSecretKey.from_hex(seed_sk.to_hex()).backend is BLAKE2B
+
+        fingerprint = PublicKeyFingerprint.from_hex(pk.fingerprint().to_hex())
+        assert fingerprint.backend is BLAKE2B
+
+        msg = Message.from_str("Empreinte", BLAKE2B)
+        sig = ExtendedSig.from_hex(Lamport.sign_extended(msg, sk).to_hex())
+        assert Lamport.verify(msg, fingerprint, sig)
+
+    def test_mismatched_backend(self):
+        """
+        Une signature produite avec une autre fonction de hachage est refusée.
+        """
+        msg = Message.from_str("Mélange")
+        sk, _ = Lamport.generate_keys(BLAKE2B)
+        _, pk = Lamport.generate_keys(SHA256)
+        assert not Lamport.verify(msg, pk, Lamport.sign(msg, sk))
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            get_backend("md5")
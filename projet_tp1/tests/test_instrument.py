@@ -0,0 +1,67 @@
+"""
+Tests de l'instrumentation facultative tp1.instrument.
+"""
+
+from tp1 import instrument
+from tp1.hashes import SHA256
+from tp1.lamport import Lamport, Message, Sig
+from tp1.signatures import hex_sig_1
+
+
+class TestInstrument:
+    def test_disabled_by_default(self):
+        """
+        Sans activation, rien n'est enregistré et les fonctions de hachage sont intactes.
+        """
+        instrument.reset()
+        Lamport.generate_keys()
+        assert instrument.snapshot() == {}
+        assert "digest" not in vars(SHA256)
+
+    def test_counts_and_timings(self):
+        """
+        Les hachages de chaque opération sont comptés et chaque appel est mesuré.
+        """
+        msg = Message.from_str("Instrumentation")
+        sk, pk = Lamport.generate_keys()
+        sig = Lamport.sign(msg, sk)
+
+        with instrument.instrumented():
+            Lamport.generate_keys()
+            Lamport.verify(msg, pk, sig)
+            Lamport.verify(msg, pk, sig)
+            Sig.from_hex(hex_sig_1)
+        report = instrument.snapshot()
+
+        assert report["generate_keys"]["calls"] == 1
+        assert report["generate_keys"]["hashes"] == 512
+        assert report["generate_keys"]["hashed_bytes"] == 512 * 32
+        assert report["verify"]["calls"] == 2
+        assert report["verify"]["hashes"] == 2 * 256
+        assert sum(report["verify"]["histogram_us"].values()) == 2
+        assert report["Sig.from_hex"]["calls"] == 1
+
+        # À la sortie du bloc, l'instrumentation est retirée.
+        assert not instrument.is_enabled()
+        assert "digest" not in vars(SHA256)
+
+        assert "verify" in instrument.format_report(report)
+
+    def test_reset(self):
+        with instrument.instrumented():
+            Lamport.generate_keys()
+        instrument.reset()
+        assert instrument.snapshot() == {}
+
+    def test_seeded_keys(self):
+        """
+        Les pré-images dérivées d'une graine sont comptées, bien qu'elles soient hachées
+        à partir de copies d'états.
+        """
+        msg = Message.from_str("Graine")
+        sk, _ = Lamport.generate_seeded_keys()
+        with instrument.instrumented():
+            Lamport.sign(msg, sk)
+        report = instrument.snapshot()
+        assert report["sign"]["hashes"] == 256
+        assert report["sign"]["hashed_bytes"] == 256 * 3
@@ -0,0 +1,112 @@
+"""
+Tests de la réserve de clés à usage unique et de son journal.
+"""
+
+import os
+import threading
+
+import pytest
+
+from tp1 import keypool
+from tp1.keypool import JOURNAL_FILE, KeyPool, read_journal
+from tp1.lamport import Lamport, Message
+
+
+class TestKeyPool:
+    def test_sign(self, tmp_path):
+        msg = Message.from_str("Réserve")
+        with KeyPool(str(tmp_path), high_water=4) as pool:
+            pk, sig = pool.sign(msg)
+            assert Lamport.verify(msg, pk, sig)
+            assert pool.ready() <= 4
+
+    def test_never_reused_after_restart(self, tmp_path):
+        """
+        Les clés remises avant un redémarrage ne sont jamais remises de nouveau.
+        """
+        with KeyPool(str(tmp_path), high_water=3) as pool:
+            before = [pool.take()[1] for _ in range(5)]
+        with KeyPool(str(tmp_path), high_water=3) as pool:
+            after = [pool.take()[1] for _ in range(5)]
+
+        keys = [pk.to_bytes() for pk in before + after]
+        assert len(set(keys)) == 10
+        used, torn = read_journal(os.path.join(tmp_path, JOURNAL_FILE))
+        assert used == list(range(10)) and torn == 0
+
+    def test_torn_journal(self, tmp_path):
+        """
+        Une inscription incomplète est retirée du journal et son numéro est sauté.
+        """
+        with KeyPool(str(tmp_path), high_water=2) as pool:
+            pool.take()
+        with open(os.path.join(tmp_path, JOURNAL_FILE), "ab") as f:
+            f.write(b"\x00\x00\x00")
+
+        with KeyPool(str(tmp_path), high_water=2) as pool:
+            pool.take()
+        used, torn = read_journal(os.path.join(tmp_path, JOURNAL_FILE))
+        assert used == [0, 2] and torn == 0
+
+    def test_closed(self, tmp_path):
+        pool = KeyPool(str(tmp_path), high_water=1)
+        pool.close()
+        with pytest.raises(ValueError):
+            pool.take()
+
+    def test_exclusive(self, tmp_path):
+        """
+        Une seule réserve à la fois peut utiliser un répertoire.
+        """
+        with KeyPool(str(tmp_path), high_water=1):
+            with pytest.raises(ValueError):
+                KeyPool(str(tmp_path), high_water=1)
+        with KeyPool(str(tmp_path), high_water=1) as pool:
+            pool.take()
+
+    def test_journal_directory_synced(self, tmp_path, monkeypatch):
+        """
+        Le répertoire est synchronisé à la création du journal, et seulement alors.
+        """
+        synced = []
+        monkeypatch.setattr(keypool, "_fsync_directory", synced.append)
+        with KeyPool(str(tmp_path), high_water=1):
+            pass
+        # Une fois pour la graine, une fois pour le journal.
+        assert synced == [str(tmp_path)] * 2
+
+        synced.clear()
+        with KeyPool(str(tmp_path), high_water=1):
+            pass
+        assert synced == []
+
+    def test_close_wakes_take(self, tmp_path, monkeypatch):
+        """
+        Un appel à take() qui attend une clé échoue lorsque la réserve est fermée.
+        """
+        gate = threading.Event()
+        derive = keypool._derive
+        monkeypatch.setattr(
+            keypool, "_derive", lambda seed, index: gate.wait() and derive(seed, index)
+        )
+        pool = KeyPool(str(tmp_path), high_water=1)
+
+        errors = []
+
+        def take():
+            try:
+                pool.take()
+            except ValueError as e:
+                errors.append(e)
+
+        taker = threading.Thread(target=take)
+        taker.start()
+        closer = threading.Thread(target=pool.close)
+        closer.start()
+        taker.join(timeout=5)
+        assert not taker.is_alive() and len(errors) == 1
+
+        # Le fil d'arrière-plan peut maintenant finir sa clé et s'arrêter.
+        gate.set()
+        closer.join(timeout=5)
+        assert not closer.is_alive()
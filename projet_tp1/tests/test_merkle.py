@@ -0,0 +1,77 @@
+"""
+Tests du schéma de signature de Merkle construit sur les clés de Lamport.
+"""
+
+from tp1.lamport import Message
+from tp1.merkle import Merkle, MerklePublicKey, MerkleSig, _hash_nodes, _leaf
+
+
+class TestMerkle:
+    def test_all_leaves(self):
+        """
+        Chaque feuille de l'arbre signe un message vérifiable, et le chemin
+        d'authentification produit par le parcours est celui de l'arbre complet.
+        """
+        sk, pk = Merkle.generate_keys(4, seed=bytes(32))
+
+        # Calcul de référence de tous les niveaux de l'arbre.
+        levels = [[_leaf(sk.seed, i) for i in range(16)]]
+        while len(levels[-1]) > 1:
+            nodes = levels[-1]
+            levels.append(
+                [
+                    _hash_nodes(nodes[2 * i], nodes[2 * i + 1])
+                    for i in range(len(nodes) // 2)
+                ]
+            )
+        assert levels[-1][0] == pk.root
+
+        for s in range(16):
+            msg = Message.from_str(f"Feuille {s}")
+            sig = Merkle.sign(msg, sk)
+            assert sig.index == s
+            assert sig.auth == [levels[h][(s >> h) ^ 1] for h in range(4)]
+            assert Merkle.verify(msg, pk, sig)
+
+        assert sk.remaining() == 0
+
+    def test_exhausted(self):
+        """
+        Une fois toutes les feuilles utilisées, la signature est refusée.
+        """
+        sk, _ = Merkle.generate_keys(1)
+        Merkle.sign(Message.from_str("a"), sk)
+        Merkle.sign(Message.from_str("b"), sk)
+        try:
+            Merkle.sign(Message.from_str("c"), sk)
+        except ValueError:
+            pass
+        else:
+            assert False
+
+    def test_bad_sig(self):
+        """
+        Une signature modifiée, ou appliquée à un autre message, est refusée.
+        """
+        sk, pk = Merkle.generate_keys(3)
+        msg = Message.from_str("Merkle")
+        Merkle.sign(Message.from_str("Premier"), sk)
+        sig = Merkle.sign(msg, sk)
+
+        assert not Merkle.verify(Message.from_str("Autre"), pk, sig)
+
+        sig.index = 0
+        assert not Merkle.verify(msg, pk, sig)
+
+    def test_serialization(self):
+        """
+        Les clés publiques et signatures survivent à un aller-retour hexadécimal.
+        """
+        sk, pk = Merkle.generate_keys(2)
+        msg = Message.from_str("Sérialisation")
+        sig = Merkle.sign(msg, sk)
+
+        pk = MerklePublicKey.from_hex(pk.to_hex())
+        sig = MerkleSig.from_hex(sig.to_hex())
+        assert len(pk.to_hex()) == 2 * 33
+        assert Merkle.verify(msg, pk, sig)
@@ -0,0 +1,52 @@
+"""
+Tests de la construction de messages à partir de fichiers, de flux et de tampons.
+"""
+
+import asyncio
+import io
+
+from tp1.hashes import BLAKE2B
+from tp1.lamport import Message
+
+
+class TestMessageSources:
+    def test_buffer_and_stream(self):
+        data = bytes(range(256)) * 1000
+        expected = Message(BLAKE2B.digest(data))
+
+        assert Message.from_buffer(memoryview(data), BLAKE2B).data == expected.data
+        stream = io.BytesIO(data)
+        assert (
+            Message.from_stream(stream, BLAKE2B, chunk_size=999).data == expected.data
+        )
+
+    def test_str_compatible(self):
+        """
+        Le contenu d'un fichier donne le même message que from_str sur le même texte.
+        """
+        text = "Chaîne de blocs"
+        assert Message.from_buffer(text.encode()).data == Message.from_str(text).data
+
+    def test_file(self, tmp_path):
+        data = b"contenu " * 100_000
+        path = tmp_path / "artefact.bin"
+        path.write_bytes(data)
+        (tmp_path / "vide").write_bytes(b"")
+
+        expected = Message.from_buffer(data).data
+        assert Message.from_file(path).data == expected
+        assert Message.from_file(path, chunk_size=4096).data == expected
+        assert Message.from_file(tmp_path / "vide").data == Message.from_str("").data
+
+    def test_file_async(self, tmp_path):
+        paths = []
+        for i in range(4):
+            path = tmp_path / f"f{i}"
+            path.write_bytes(str(i).encode() * 1000)
+            paths.append(path)
+
+        async def main():
+            return await asyncio.gather(*(Message.from_file_async(p) for p in paths))
+
+        messages = asyncio.run(main())
+        assert [m.data for m in messages] == [Message.from_file(p).data for p in paths]
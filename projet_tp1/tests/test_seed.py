@@ -0,0 +1,43 @@
+"""
+Tests des clés secrètes dérivées d'une graine.
+"""
+
+from tp1.lamport import Lamport, Message, SeedSecretKey
+
+
+class TestSeedSecretKey:
+    def test_good_sig(self):
+        """
+        Une clé dérivée d'une graine signe comme une clé secrète ordinaire.
+        """
+        msg = Message.from_str("Graine")
+        sk, pk = Lamport.generate_seeded_keys()
+        assert len(sk.to_bytes()) == 32
+
+        sig = Lamport.sign(msg, sk)
+        assert Lamport.verify(msg, pk, sig)
+        assert not Lamport.verify(Message.from_str("Autre"), pk, sig)
+
+    def test_expand(self):
+        """
+        La clé complète a les mêmes pré-images et signe à l'identique.
+        """
+        sk, pk = Lamport.generate_seeded_keys(bytes(range(32)))
+        full = sk.expand()
+        assert bytes(full.one_pre[7].data) == sk.one_pre[7].data
+        assert bytes(full.zero_pre[255].data) == sk.block(255, 0)
+
+        msg = Message.from_str("Expansion")
+        assert Lamport.sign(msg, full) == Lamport.sign(msg, sk)
+
+    def test_deterministic(self):
+        """
+        La même graine redonne la même clé publique, et la graine survit à un aller-retour.
+        """
+        seed = bytes(32)
+        _, pk_1 = Lamport.generate_seeded_keys(seed)
+        _, pk_2 = Lamport.generate_seeded_keys(seed)
+        assert pk_1 == pk_2
+
+        sk = SeedSecretKey.from_hex(SeedSecretKey(seed).to_hex())
+        assert sk.public_key() == pk_1
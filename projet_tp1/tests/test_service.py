@@ -0,0 +1,182 @@
+"""
+Tests du service local de signature et de vérification.
+"""
+
+import asyncio
+import os
+import tempfile
+
+import pytest
+
+from tp1.keypool import JOURNAL_FILE, KeyPool, read_journal
+from tp1.lamport import Lamport, Message
+from tp1.service import _LENGTH, SignatureService, ServiceClient
+
+
+def _run(scenario, **options):
+    """
+    Démarre un service TCP local, exécute scenario(service, client) puis arrête tout.
+    """
+
+    async def main():
+        service = SignatureService(workers=1, **options)
+        server = await service.start_tcp("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        client = await ServiceClient.connect_tcp("127.0.0.1", port)
+        try:
+            return await scenario(service, client)
+        finally:
+            await client.close()
+            await service.close()
+
+    return asyncio.run(main())
+
+
+class TestService:
+    def test_sign_and_verify(self):
+        """
+        Une signature produite par le service est acceptée, localement et par le service.
+        """
+
+        async def scenario(service, client):
+            msg = Message.from_str("Service")
+            pk, sig = await client.sign(msg)
+            assert Lamport.verify(msg, pk, sig)
+            assert await client.verify(msg, pk, sig)
+            assert not await client.verify(Message.from_str("Autre"), pk, sig)
+
+        _run(scenario)
+
+    def test_batching(self):
+        """
+        Des vérifications envoyées ensemble sont regroupées en un lot
+        et les résultats reviennent à la bonne requête.
+        """
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str("Lot")
+        sig = Lamport.sign(msg, sk)
+        messages = [msg if i % 2 else Message.from_str(f"Autre {i}") for i in range(8)]
+
+        async def scenario(service, client):
+            results = await asyncio.gather(
+                *(client.verify(m, pk, sig) for m in messages)
+            )
+            assert results == [bool(i % 2) for i in range(8)]
+            stats = await client.stats()
+            assert stats["verify"]["calls"] == 8
+            assert stats["verify_batches"]["calls"] < 8
+
+        _run(scenario, window=0.05)
+
+    def test_max_in_flight(self):
+        """
+        Avec une seule requête à la fois, les requêtes en rafale aboutissent quand même.
+        """
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str("Contre-pression")
+        sig = Lamport.sign(msg, sk)
+
+        async def scenario(service, client):
+            results = await asyncio.gather(
+                *(client.verify(msg, pk, sig) for _ in range(5))
+            )
+            assert results == [True] * 5
+            assert service.metrics()["verify_batches"]["calls"] == 5
+
+        _run(scenario, max_in_flight=1)
+
+    def test_idle_connection(self):
+        """
+        Une connexion ouverte qui n'envoie rien ne retient pas la seule place disponible.
+        """
+
+        async def scenario(service, client):
+            port = service._servers[0].sockets[0].getsockname()[1]
+            _, idle = await asyncio.open_connection("127.0.0.1", port)
+            try:
+                await asyncio.sleep(0.05)
+                for i in range(3):
+                    msg = Message.from_str(f"Inactive {i}")
+                    pk, sig = await asyncio.wait_for(client.sign(msg), timeout=5)
+                    assert Lamport.verify(msg, pk, sig)
+            finally:
+                idle.close()
+
+        _run(scenario, max_in_flight=1)
+
+    def test_error(self):
+        """
+        Une requête mal formée produit une erreur sans fermer la connexion.
+        """
+
+        async def scenario(service, client):
+            with pytest.raises(ValueError):
+                await client._request(2, b"trop court")
+            pk, sig = await client.sign(Message.from_str("Après l'erreur"))
+            assert Lamport.verify(Message.from_str("Après l'erreur"), pk, sig)
+
+        _run(scenario)
+
+    def test_short_frame(self):
+        """
+        Une trame trop courte pour contenir un en-tête ferme la connexion,
+        et les requêtes en cours échouent au lieu d'attendre indéfiniment.
+        """
+
+        async def scenario(service, client):
+            client._writer.write(_LENGTH.pack(2) + b"\x00\x00")
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(client.stats(), timeout=5)
+            with pytest.raises(ConnectionError):
+                await client.stats()
+
+        _run(scenario)
+
+    def test_close_with_open_connection(self):
+        """
+        L'arrêt du service interrompt les connexions encore ouvertes.
+        """
+
+        async def main():
+            service = SignatureService(workers=1)
+            server = await service.start_tcp("127.0.0.1", 0)
+            port = server.sockets[0].getsockname()[1]
+            client = await ServiceClient.connect_tcp("127.0.0.1", port)
+            await client.stats()
+            await asyncio.wait_for(service.close(), timeout=5)
+            with pytest.raises(ConnectionError):
+                await asyncio.wait_for(client.stats(), timeout=5)
+            await client.close()
+
+        asyncio.run(main())
+
+    @pytest.mark.skipif(not hasattr(asyncio, "start_unix_server"), reason="Unix")
+    def test_unix_socket(self):
+        async def main():
+            with tempfile.TemporaryDirectory() as directory:
+                path = os.path.join(directory, "tp1.sock")
+                service = SignatureService(workers=1)
+                await service.start_unix(path)
+                client = await ServiceClient.connect_unix(path)
+                msg = Message.from_str("Unix")
+                pk, sig = await client.sign(msg)
+                assert await client.verify(msg, pk, sig)
+                await client.close()
+                await service.close()
+
+        asyncio.run(main())
+
+    def test_key_pool(self, tmp_path):
+        """
+        Avec une réserve, les clés de signature viennent de la réserve.
+        """
+        with KeyPool(str(tmp_path), high_water=2) as pool:
+
+            async def scenario(service, client):
+                msg = Message.from_str("Réserve")
+                pk, sig = await client.sign(msg)
+                assert await client.verify(msg, pk, sig)
+
+            _run(scenario, key_pool=pool)
+        used, _ = read_journal(os.path.join(tmp_path, JOURNAL_FILE))
+        assert used == [0]
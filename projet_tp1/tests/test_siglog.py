@@ -0,0 +1,115 @@
+"""
+Tests du journal binaire de signatures et de son index.
+"""
+
+import os
+
+import pytest
+
+from tp1 import siglog
+from tp1.hashes import BLAKE2S
+from tp1.lamport import ExtendedSig, Lamport, Message
+from tp1.siglog import HEADER_SIZE, RECORD_SIZE, SignatureLog, SignatureLogWriter
+
+
+def _entries(n):
+    """
+    Produit n triplets (message, clé publique, signature) ; les messages se répètent
+    tous les 3 enregistrements, pour tester les hachages en double.
+    """
+    for i in range(n):
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str(f"Journal {i % 3}")
+        yield msg, pk, Lamport.sign(msg, sk)
+
+
+class TestSignatureLog:
+    def test_round_trip(self, tmp_path):
+        path = str(tmp_path / "sigs.log")
+        entries = list(_entries(7))
+        with SignatureLogWriter(path) as writer:
+            assert writer.extend(entries) == 7
+
+        with SignatureLog(path) as log:
+            assert len(log) == 7
+            for (msg, pk, sig), record in zip(entries, log):
+                assert bytes(record.digest) == msg.data
+                assert bytes(record.fingerprint) == pk.fingerprint().data
+                assert record.sig == sig
+                assert Lamport.verify(record.message(), pk, record.sig)
+
+            assert log.lookup(Message.from_str("Journal 1").data) == [1, 4]
+            assert log.lookup(Message.from_str("Absent").data) == []
+            assert log[6].sig == entries[6][2]
+
+    def test_append_after_reopen(self, tmp_path):
+        """
+        Un journal rouvert continue la numérotation et l'index.
+        """
+        path = str(tmp_path / "sigs.log")
+        with SignatureLogWriter(path) as writer:
+            writer.extend(_entries(2))
+        with SignatureLogWriter(path) as writer:
+            assert writer.append(*next(_entries(1))) == 2
+
+        with SignatureLog(path) as log:
+            assert log.lookup(Message.from_str("Journal 0").data) == [0, 2]
+
+    def test_index_growth(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(siglog, "MIN_CAPACITY", 2)
+        path = str(tmp_path / "sigs.log")
+        with SignatureLogWriter(path) as writer:
+            writer.extend(_entries(9))
+        with SignatureLog(path) as log:
+            assert log.lookup(Message.from_str("Journal 2").data) == [2, 5, 8]
+
+    def test_recovery(self, tmp_path):
+        """
+        Après une panne, l'écriture incomplète est retirée et l'index est reconstruit.
+        """
+        path = str(tmp_path / "sigs.log")
+        with SignatureLogWriter(path) as writer:
+            writer.extend(_entries(3))
+        with open(path, "ab") as f:
+            f.write(b"\x00" * 100)
+        os.remove(f"{path}.idx")
+
+        with SignatureLog(path) as log:
+            assert len(log) == 3
+            assert log.lookup(Message.from_str("Journal 0").data) == [0]
+
+        with SignatureLogWriter(path) as writer:
+            assert writer.append(*next(_entries(1))) == 3
+        assert os.path.getsize(path) == HEADER_SIZE + 4 * RECORD_SIZE
+
+    def test_backend(self, tmp_path):
+        path = str(tmp_path / "sigs.log")
+        sk, pk = Lamport.generate_keys(BLAKE2S)
+        msg = Message.from_str("blake2s", BLAKE2S)
+        with SignatureLogWriter(path, BLAKE2S) as writer:
+            writer.append(msg, pk, Lamport.sign(msg, sk))
+        with SignatureLog(path) as log:
+            assert Lamport.verify(msg, pk, log[0].sig)
+
+        with pytest.raises(ValueError):
+            SignatureLogWriter(path)
+
+    def test_extended(self, tmp_path):
+        """
+        D'une signature étendue, seule la signature ordinaire est écrite ;
+        l'enregistrement suivant reste aligné.
+        """
+        path = str(tmp_path / "sigs.log")
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str("Étendue")
+        extended = Lamport.sign_extended(msg, sk)
+        assert isinstance(extended, ExtendedSig)
+        entries = [(msg, pk, extended), *_entries(1)]
+        with SignatureLogWriter(path) as writer:
+            writer.extend(entries)
+        assert os.path.getsize(path) == HEADER_SIZE + 2 * RECORD_SIZE
+
+        with SignatureLog(path) as log:
+            for (msg, pk, _), record in zip(entries, log):
+                assert Lamport.verify(record.message(), pk, record.sig)
+            assert log[0].sig == extended.sig()
@@ -0,0 +1,34 @@
+"""
+Tests du chargement paresseux des données de signatures.py.
+"""
+
+import pytest
+
+from tp1 import signatures
+from tp1.lamport import Lamport, Message, PublicKey, Sig
+
+
+class TestSignatures:
+    def test_hex_compatible(self):
+        """
+        Les chaînes hexadécimales correspondent aux objets décodés.
+        """
+        assert len(signatures.hex_pub_key) == 2 * signatures.PUB_KEY_SIZE
+        assert PublicKey.from_hex(signatures.hex_pub_key) == signatures.pub_key
+        for k in range(1, 6):
+            sig = Sig.from_hex(getattr(signatures, f"hex_sig_{k}"))
+            assert sig == getattr(signatures, f"sig_{k}")
+
+    def test_decoded_objects(self):
+        """
+        Les objets décodés sont mis en cache et les signatures sont valides.
+        """
+        assert signatures.pub_key is signatures.pub_key
+        for k in range(1, 6):
+            sig = getattr(signatures, f"sig_{k}")
+            assert Lamport.verify(Message.from_str(str(k)), signatures.pub_key, sig)
+
+    def test_unknown_attribute(self):
+        with pytest.raises(AttributeError):
+            signatures.hex_sig_6
+        assert "hex_sig_5" in dir(signatures)
@@ -0,0 +1,67 @@
+"""
+Tests de la représentation contiguë des clés et des signatures.
+"""
+
+import pytest
+
+from tp1.lamport import Lamport, Message, PublicKey, SecretKey, Sig
+from tp1.signatures import hex_pub_key, hex_sig_1
+
+
+class TestTables:
+    def test_hex_round_trip(self):
+        """
+        from_hex suivi de to_hex doit redonner exactement la chaîne fournie.
+        """
+        assert PublicKey.from_hex(hex_pub_key).to_hex() == hex_pub_key
+        assert Sig.from_hex(hex_sig_1).to_hex() == hex_sig_1
+
+    def test_bytes_round_trip(self):
+        """
+        to_bytes et from_bytes sont inverses l'un de l'autre.
+        """
+        sk, pk = Lamport.generate_keys()
+        assert len(sk.to_bytes()) == 16384
+        assert SecretKey.from_bytes(sk.to_bytes()) == sk
+        assert PublicKey.from_bytes(pk.to_bytes()) == pk
+
+    def test_hashable(self):
+        """
+        Deux objets de même contenu sont égaux et ont le même hachage.
+        """
+        sk, pk = Lamport.generate_keys()
+        sig = Lamport.sign(Message.from_str("Ensemble"), sk)
+        assert {pk, PublicKey.from_bytes(pk.to_bytes())} == {pk}
+        assert len({sk, pk, sig, Sig.from_bytes(sig.to_bytes())}) == 3
+
+    def test_views_share_buffer(self):
+        """
+        Les blocs retournés par les rangées sont des vues sur le tampon de l'objet.
+        """
+        pk = PublicKey.from_hex(hex_pub_key)
+        buffer = bytearray(pk.to_bytes())
+        shared = PublicKey.from_buffer(buffer)
+
+        assert bytes(shared.one_hash[3].data) == bytes(pk.block(3, 1))
+
+        shared.one_hash[3] = bytes(32)
+        assert buffer[32 * 259 : 32 * 260] == bytes(32)
+
+    def test_rows_match_blocks(self):
+        """
+        Les accesseurs de rangées et de blocs respectent l'ordre gros-boutiste.
+        """
+        sk, _ = Lamport.generate_keys()
+        msg = Message.from_str("Rangées")
+        sig = Lamport.sign(msg, sk)
+        for i in range(256):
+            b = msg.data[i // 8] >> (7 - (i % 8)) & 1
+            row = sk.one_pre if b else sk.zero_pre
+            assert bytes(sig.preimage[i].data) == bytes(row[i].data)
+
+    def test_bad_length(self):
+        """
+        Un tampon de mauvaise taille est refusé.
+        """
+        with pytest.raises(ValueError):
+            Sig.from_bytes(bytes(100))
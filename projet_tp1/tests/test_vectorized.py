@@ -0,0 +1,73 @@
+"""
+Tests du chemin vectorisé facultatif (ignorés si NumPy n'est pas installé).
+"""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from tp1.hashes import BLAKE2S
+from tp1.lamport import Lamport, Message
+from tp1.vectorized import key_array, sign_array, verify_batch, verify_many
+
+
+class TestVectorized:
+    def test_sign_array(self):
+        """
+        La signature vectorisée est identique à celle de Lamport.sign.
+        """
+        sk, _ = Lamport.generate_keys()
+        msg = Message.from_str("Vectorisé")
+        expected = key_array(Lamport.sign(msg, sk))[0]
+        assert np.array_equal(sign_array(msg.data, key_array(sk)), expected)
+
+    def test_verify_batch_shared_key(self):
+        """
+        Plusieurs hachages vérifiés contre une même clé publique.
+        """
+        sk, pk = Lamport.generate_keys()
+        messages = [Message.from_str(f"Audit {i}") for i in range(4)]
+        sigs = np.stack([key_array(Lamport.sign(m, sk))[0] for m in messages])
+        # Le troisième message ne correspond pas à sa signature.
+        digests = [m.data for m in messages]
+        digests[2] = Message.from_str("Autre").data
+
+        result = verify_batch(digests, key_array(pk), sigs)
+        assert result.tolist() == [True, True, False, True]
+
+    def test_verify_many(self):
+        """
+        Même résultat que Lamport.verify_many, y compris avec des fonctions
+        de hachage mélangées.
+        """
+        items = []
+        for i in range(6):
+            backend = BLAKE2S if i == 4 else None
+            sk, pk = (
+                Lamport.generate_keys(backend) if backend else Lamport.generate_keys()
+            )
+            msg = Message.from_str(f"Lot {i}")
+            signed = msg if i % 3 else Message.from_str(f"Autre {i}")
+            items.append((msg, pk, Lamport.sign(signed, sk)))
+
+        expected = list(Lamport.verify_many(items, workers=1))
+        assert list(verify_many(items, chunk_size=4)) == expected
+
+    def test_verify_many_extended(self):
+        """
+        Les signatures étendues, avec une clé publique ou son empreinte,
+        donnent le même résultat que Lamport.verify_many.
+        """
+        items = []
+        for i in range(6):
+            sk, pk = Lamport.generate_keys()
+            msg = Message.from_str(f"Étendue {i}")
+            signed = msg if i % 3 else Message.from_str(f"Autre {i}")
+            extended = Lamport.sign_extended(signed, sk)
+            items.append((msg, pk if i % 2 else pk.fingerprint(), extended))
+        # Une empreinte avec une signature ordinaire est refusée.
+        items.append((msg, pk.fingerprint(), extended.sig()))
+
+        expected = list(Lamport.verify_many(items, workers=1))
+        assert expected == [bool(i % 3) for i in range(6)] + [False]
+        assert list(verify_many(items, chunk_size=4)) == expected
@@ -0,0 +1,50 @@
+"""
+Tests du moteur de vérification à travail constant.
+"""
+
+from tp1 import instrument
+from tp1.lamport import (
+    BLOCK_SIZE,
+    Lamport,
+    Message,
+    bit_layout,
+    select_blocks,
+    verify_blocks,
+)
+
+
+class TestVerifyEngine:
+    def test_layout(self):
+        """
+        Le bloc choisi à la position i est celui de la ligne donnée par le bit i.
+        """
+        data = Message.from_str("Disposition").data
+        layout = bit_layout(data)
+        for i, offset in enumerate(layout):
+            b = data[i // 8] >> (7 - (i % 8)) & 1
+            assert offset == BLOCK_SIZE * (b * 256 + i)
+
+    def test_expected_hashes(self):
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str("Attendus")
+        sig = Lamport.sign(msg, sk)
+        assert select_blocks(msg.data, sk._view) == sig.to_bytes()
+        assert verify_blocks(msg.data, pk._view, sig._view)
+
+    def test_constant_work(self):
+        """
+        Une signature fausse dès le premier bloc coûte autant de hachages qu'une bonne.
+        """
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str("Travail constant")
+        good = Lamport.sign(msg, sk)
+        bad = Lamport.sign(msg, sk)
+        bad.preimage[0] = bytes(BLOCK_SIZE)
+
+        counts = []
+        for sig, expected in ((good, True), (bad, False)):
+            with instrument.instrumented():
+                assert Lamport.verify(msg, pk, sig) == expected
+            counts.append(instrument.snapshot()["verify"]["hashes"])
+        instrument.reset()
+        assert counts == [256, 256]
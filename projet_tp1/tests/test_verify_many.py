@@ -0,0 +1,49 @@
+"""
+Tests de la vérification en lot Lamport.verify_many.
+"""
+
+from tp1.lamport import Lamport, Message
+
+
+def _triplets(n):
+    """
+    Produit n triplets (message, clé publique, signature) dont un sur trois
+    est signé sur un autre message et doit donc échouer.
+    """
+    for i in range(n):
+        sk, pk = Lamport.generate_keys()
+        msg = Message.from_str(f"Lot {i}")
+        signed = msg if i % 3 else Message.from_str(f"Autre {i}")
+        yield msg, pk, Lamport.sign(signed, sk)
+
+
+class TestVerifyMany:
+    def test_single_process(self):
+        """
+        Le chemin sans processus de travail conserve l'ordre d'entrée.
+        """
+        results = list(Lamport.verify_many(_triplets(10), workers=1, chunk_size=4))
+        assert results == [bool(i % 3) for i in range(10)]
+
+    def test_process_pool(self):
+        """
+        Plusieurs paquets répartis sur un groupe de processus, en flux.
+        """
+        results = list(Lamport.verify_many(_triplets(20), workers=2, chunk_size=3))
+        assert results == [bool(i % 3) for i in range(20)]
+
+    def test_empty(self):
+        assert list(Lamport.verify_many([], workers=2)) == []
+
+    def test_fingerprints(self):
+        """
+        Les empreintes et les signatures étendues passent aussi par les processus de travail.
+        """
+        items = []
+        for i in range(6):
+            sk, pk = Lamport.generate_keys()
+            msg = Message.from_str(f"Empreinte {i}")
+            signed = msg if i % 3 else Message.from_str(f"Autre {i}")
+            items.append((msg, pk.fingerprint(), Lamport.sign_extended(signed, sk)))
+        results = list(Lamport.verify_many(items, workers=2, chunk_size=2))
+        assert results == [bool(i % 3) for i in range(6)]
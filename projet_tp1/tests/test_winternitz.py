@@ -0,0 +1,72 @@
+"""
+Tests du schéma de signature à usage unique de Winternitz.
+"""
+
+from tp1.lamport import Message
+from tp1.winternitz import (
+    SUPPORTED_W,
+    Winternitz,
+    WinternitzPublicKey,
+    WinternitzSig,
+    digits,
+    lengths,
+)
+
+
+class TestWinternitz:
+    def test_good_sig(self):
+        """
+        Signe et vérifie pour chaque valeur de w.
+        """
+        msg = Message.from_str("Bon")
+        for w in SUPPORTED_W:
+            sk, pk = Winternitz.generate_keys(w)
+            sig = Winternitz.sign(msg, sk)
+            assert Winternitz.verify(msg, pk, sig)
+
+    def test_bad_sig(self):
+        """
+        Une signature modifiée ou appliquée à un autre message est refusée.
+        """
+        msg = Message.from_str("Mauvais")
+        sk, pk = Winternitz.generate_keys(16)
+        sig = Winternitz.sign(msg, sk)
+
+        assert not Winternitz.verify(Message.from_str("Pire"), pk, sig)
+
+        sig.block(5)[:] = bytes(32)
+        assert not Winternitz.verify(msg, pk, sig)
+
+    def test_digits(self):
+        """
+        Les chiffres sont lus du bit le plus significatif au moins significatif,
+        et la somme de contrôle complète le total à len1 * (w - 1).
+        """
+        data = bytes([0xAB]) * 32
+        assert digits(data, 16)[:4] == [0xA, 0xB, 0xA, 0xB]
+        assert digits(data, 2)[:8] == [1, 0, 1, 0, 1, 0, 1, 1]
+
+        len1, len2 = lengths(16)
+        result = digits(data, 16)
+        assert len(result) == len1 + len2
+        checksum = int("".join(f"{d:x}" for d in result[len1:]), 16)
+        assert checksum == sum(15 - d for d in result[:len1])
+
+    def test_sizes_and_serialization(self):
+        """
+        Avec w = 16, la signature fait 67 blocs et survit à un aller-retour hexadécimal.
+        """
+        msg = Message.from_str("Taille")
+        sk, pk = Winternitz.generate_keys(16)
+        sig = Winternitz.sign(msg, sk)
+        assert len(sig.to_bytes()) == 1 + 67 * 32
+
+        pk = WinternitzPublicKey.from_hex(pk.to_hex())
+        sig = WinternitzSig.from_hex(sig.to_hex())
+        assert Winternitz.verify(msg, pk, sig)
+
+    def test_mismatched_w(self):
+        msg = Message.from_str("w")
+        sk, _ = Winternitz.generate_keys(4)
+        _, pk = Winternitz.generate_keys(16)
+        assert not Winternitz.verify(msg, pk, Winternitz.sign(msg, sk))
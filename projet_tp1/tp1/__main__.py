@@ -9,11 +9,24 @@ Il peut également être utile de créer vos propres fonctions ou méthodes,
 notamment dans le fichier tp1/forge.py.
 """
 
+import argparse
+
+from tp1 import instrument
 from tp1.forge import forge
 from tp1.lamport import Lamport, Message
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m tp1")
+    parser.add_argument(
+        "--instrument",
+        action="store_true",
+        help="affiche à la fin le nombre de hachages et la durée de chaque opération",
+    )
+    args = parser.parse_args()
+    if args.instrument:
+        instrument.enable()
+
     # Définition du message.
     text_str = "Chaîne de blocs"
     print(text_str)
@@ -45,3 +58,6 @@ if __name__ == "__main__":
     forged_sig_hex = forged_sig.to_hex()
     print(f"Message falsifié : '{forged_msg}'")
     print(f"Signature falsifiée : {forged_sig_hex[:10]}...{forged_sig_hex[-10:]}")
+
+    if args.instrument:
+        print(instrument.format_report(instrument.snapshot()))
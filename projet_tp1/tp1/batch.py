@@ -0,0 +1,241 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Signature d'un lot de messages avec une seule clé de Lamport.
+
+Les hachages des N messages d'un lot sont les feuilles d'un arbre de Merkle, et seule la racine
+est signée, avec une clé à usage unique. Chaque message reçoit une preuve : la signature commune
+de la racine et son chemin d'inclusion de ceil(log2(N)) nœuds au plus.
+
+L'arbre suit la construction de RFC 6962 (Certificate Transparency) : les feuilles et les nœuds
+internes sont hachés avec des préfixes différents (0x00 et 0x01), si bien qu'un nœud interne ne
+peut pas passer pour une feuille, et lorsqu'un niveau a un nombre impair de nœuds, le dernier
+remonte tel quel au niveau suivant (il n'est pas dupliqué). Le message signé par Lamport est
+le hachage de la taille du lot suivie de la racine, ce qui lie chaque preuve à la taille du lot.
+
+Vérifier un membre coûte O(log N) hachages pour remonter à la racine. Les racines dont la
+signature a été acceptée sont mises en cache (BatchSign.CACHE_SIZE dernières racines, avec
+l'empreinte de la clé publique) : vérifier tous les membres d'un lot ne coûte qu'une vérification
+de Lamport, et verify_batch_members ne calcule l'empreinte qu'une fois pour tout le lot.
+"""
+
+from collections import OrderedDict
+from typing import Iterable, Self
+
+import threading
+
+from tp1.hashes import SHA256, HashBackend
+from tp1.lamport import (
+    BLOCK_SIZE,
+    Lamport,
+    Message,
+    PublicKey,
+    PublicKeyFingerprint,
+    SecretKey,
+    Sig,
+)
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def _hash_leaf(digest: bytes, backend: HashBackend = SHA256) -> bytes:
+    return backend.digest(_LEAF_PREFIX + digest)
+
+
+def _hash_nodes(left: bytes, right: bytes, backend: HashBackend = SHA256) -> bytes:
+    return backend.digest(_NODE_PREFIX + left + right)
+
+
+def _root_message(size: int, root: bytes, backend: HashBackend = SHA256) -> Message:
+    """
+    Retourne le message signé pour un lot : le hachage de sa taille et de sa racine.
+    """
+    return Message(backend.digest(size.to_bytes(4, "big") + root))
+
+
+class BatchProof:
+    """
+    La preuve d'un membre d'un lot : sa position, la taille du lot, son chemin
+    d'inclusion (du bas vers le haut) et la signature de Lamport de la racine.
+    """
+
+    def __init__(self, index: int, size: int, path: list[bytes], sig: Sig):
+        self.index = index
+        self.size = size
+        self.path = path
+        self.sig = sig
+
+    def root(self, msg: Message) -> bytes | None:
+        """
+        Retourne la racine obtenue en remontant le chemin depuis le message,
+        ou None si le chemin n'a pas la longueur attendue pour cette position.
+        """
+        backend = self.sig.backend
+        node = _hash_leaf(bytes(msg.data), backend)
+        index, width = self.index, self.size
+        path = iter(self.path)
+        while width > 1:
+            sibling = index ^ 1
+            if sibling < width:
+                other = next(path, None)
+                if other is None:
+                    return None
+                if index & 1:
+                    node = _hash_nodes(other, node, backend)
+                else:
+                    node = _hash_nodes(node, other, backend)
+            # Sinon, le nœud est le dernier d'un niveau impair et remonte tel quel.
+            index >>= 1
+            width = (width + 1) // 2
+        if next(path, None) is not None:
+            return None
+        return node
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Retourne une preuve à partir de sa forme binaire (voir to_bytes).
+        """
+        view = memoryview(data)
+        if len(view) < 9:
+            raise ValueError(f"Preuve de longueur {len(view)}, trop courte.")
+        index = int.from_bytes(view[:4], "big")
+        size = int.from_bytes(view[4:8], "big")
+        count = view[8]
+        offset = 9 + count * BLOCK_SIZE
+        path = [
+            bytes(view[9 + BLOCK_SIZE * h : 9 + BLOCK_SIZE * (h + 1)])
+            for h in range(count)
+        ]
+        return cls(index, size, path, Sig.from_bytes(view[offset:]))
+
+    def to_bytes(self) -> bytes:
+        """
+        Retourne la forme binaire de la preuve : la position et la taille du lot sur
+        4 octets chacune, la longueur du chemin sur un octet, le chemin, puis la signature.
+        """
+        return b"".join(
+            [
+                self.index.to_bytes(4, "big"),
+                self.size.to_bytes(4, "big"),
+                bytes([len(self.path)]),
+                *self.path,
+                self.sig.to_bytes(),
+            ]
+        )
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
+        """
+        Prend une chaîne de BatchProof.to_hex() et la transforme en preuve.
+        """
+        return cls.from_bytes(bytes.fromhex(s))
+
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale de la preuve.
+        """
+        return self.to_bytes().hex()
+
+
+class BatchSign:
+    # Nombre de vérifications de racines gardées en cache.
+    CACHE_SIZE = 1024
+
+    # Racines acceptées, indexées par (message signé, empreinte de la clé publique).
+    # Le cache est partagé entre les fils du service : chaque accès prend le verrou.
+    _cache: OrderedDict[tuple[bytes, bytes], None] = OrderedDict()
+    _lock = threading.Lock()
+
+    @classmethod
+    def sign_batch(cls, msgs: list[Message], sk: SecretKey) -> list[BatchProof]:
+        """
+        Signe un lot de messages avec la clé à usage unique `sk`.
+        Retourne la preuve de chaque message, dans l'ordre du lot.
+        """
+        size = len(msgs)
+        if not 0 < size < 1 << 32:
+            raise ValueError(f"Lot de {size} messages, au lieu de 1 à 2^32 - 1.")
+        backend = sk.backend
+
+        # Tous les niveaux de l'arbre, des feuilles à la racine.
+        levels = [[_hash_leaf(bytes(msg.data), backend) for msg in msgs]]
+        while len(levels[-1]) > 1:
+            level = levels[-1]
+            parents = [
+                _hash_nodes(level[i], level[i + 1], backend)
+                for i in range(0, len(level) - 1, 2)
+            ]
+            if len(level) % 2:
+                parents.append(level[-1])
+            levels.append(parents)
+
+        sig = Lamport.sign(_root_message(size, levels[-1][0], backend), sk)
+
+        proofs = []
+        for index in range(size):
+            path = []
+            position = index
+            for level in levels[:-1]:
+                if position ^ 1 < len(level):
+                    path.append(level[position ^ 1])
+                position >>= 1
+            proofs.append(BatchProof(index, size, path, sig))
+        return proofs
+
+    @classmethod
+    def verify_batch_member(
+        cls, msg: Message, pk: PublicKey, proof: BatchProof
+    ) -> bool:
+        """
+        Vérifie qu'un message fait partie d'un lot signé avec la clé publique `pk`.
+        """
+        return cls._verify_member(msg, pk, pk.fingerprint(), proof)
+
+    @classmethod
+    def verify_batch_members(
+        cls, msgs: Iterable[Message], pk: PublicKey, proofs: Iterable[BatchProof]
+    ) -> list[bool]:
+        """
+        Vérifie chaque paire (message, preuve) avec la même clé publique `pk`,
+        dont l'empreinte n'est calculée qu'une fois.
+        """
+        fingerprint = pk.fingerprint()
+        return [
+            cls._verify_member(msg, pk, fingerprint, proof)
+            for msg, proof in zip(msgs, proofs)
+        ]
+
+    @classmethod
+    def _verify_member(
+        cls,
+        msg: Message,
+        pk: PublicKey,
+        fingerprint: PublicKeyFingerprint,
+        proof: BatchProof,
+    ) -> bool:
+        if not 0 <= proof.index < proof.size:
+            return False
+        if pk.backend is not proof.sig.backend:
+            return False
+
+        root = proof.root(msg)
+        if root is None:
+            return False
+        root_msg = _root_message(proof.size, root, pk.backend)
+
+        # Une racine acceptée l'est pour toute signature : seul le succès est mis en cache,
+        # sinon une signature invalide masquerait la bonne.
+        key = (bytes(root_msg.data), fingerprint.data)
+        with cls._lock:
+            if key in cls._cache:
+                cls._cache.move_to_end(key)
+                return True
+        if not Lamport.verify(root_msg, pk, proof.sig):
+            return False
+        with cls._lock:
+            cls._cache[key] = None
+            if len(cls._cache) > cls.CACHE_SIZE:
+                cls._cache.popitem(last=False)
+        return True
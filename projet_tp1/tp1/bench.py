@@ -0,0 +1,208 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Banc d'essai des opérations coûteuses : génération de clés, signature, vérification,
+conversions hexadécimales et débit de la recherche de forge().
+
+Utilisation :
+    python -m tp1.bench                          # toutes les mesures
+    python -m tp1.bench verify sign --repeat 50  # seulement certaines mesures
+    python -m tp1.bench --json resultats.json    # enregistre les résultats
+    python -m tp1.bench --baseline resultats.json --threshold 0.2
+
+Chaque mesure est répétée `repeat` fois ; on affiche le nombre d'opérations par seconde
+(à partir de la médiane) et les percentiles 50, 90 et 99 de la durée d'une opération.
+Avec --baseline, le programme se termine avec le code 1 si une mesure est plus lente
+que la référence de plus de `threshold` (20 % par défaut).
+"""
+
+from typing import Callable
+
+import argparse
+import json
+import statistics
+import sys
+import time
+
+from tp1 import forge, signatures
+from tp1.hashes import SHA256
+from tp1.lamport import Lamport, Message, PublicKey, Sig
+
+# Nombre de candidats essayés par échantillon de la mesure "forge".
+FORGE_CANDIDATES = 2000
+
+
+def _setup_generate_keys() -> tuple[Callable, int]:
+    return Lamport.generate_keys, 1
+
+
+def _setup_sign() -> tuple[Callable, int]:
+    msg = Message.from_str("Banc d'essai")
+    sk, _ = Lamport.generate_keys()
+    return lambda: Lamport.sign(msg, sk), 1
+
+
+def _setup_verify() -> tuple[Callable, int]:
+    msg = Message.from_str("Banc d'essai")
+    sk, pk = Lamport.generate_keys()
+    sig = Lamport.sign(msg, sk)
+    return lambda: Lamport.verify(msg, pk, sig), 1
+
+
+def _setup_pk_from_hex() -> tuple[Callable, int]:
+    return lambda: PublicKey.from_hex(signatures.hex_pub_key), 1
+
+
+def _setup_pk_to_hex() -> tuple[Callable, int]:
+    pk = PublicKey.from_hex(signatures.hex_pub_key)
+    return pk.to_hex, 1
+
+
+def _setup_sig_from_hex() -> tuple[Callable, int]:
+    return lambda: Sig.from_hex(signatures.hex_sig_1), 1
+
+
+def _setup_sig_to_hex() -> tuple[Callable, int]:
+    sig = Sig.from_hex(signatures.hex_sig_1)
+    return sig.to_hex, 1
+
+
+def _setup_forge() -> tuple[Callable, int]:
+    # Des masques vides rejettent tous les candidats : chaque échantillon essaie
+    # exactement FORGE_CANDIDATES candidats, au même coût qu'un rejet réel.
+    forge._init_worker("Banc d'essai contrefait", (0, 0), SHA256)
+    return lambda: forge._search_range(0, FORGE_CANDIDATES), FORGE_CANDIDATES
+
+
+# Nom de la mesure -> fonction de préparation retournant (opération, nombre d'opérations par appel).
+BENCHMARKS: dict[str, Callable[[], tuple[Callable, int]]] = {
+    "generate_keys": _setup_generate_keys,
+    "sign": _setup_sign,
+    "verify": _setup_verify,
+    "pk_from_hex": _setup_pk_from_hex,
+    "pk_to_hex": _setup_pk_to_hex,
+    "sig_from_hex": _setup_sig_from_hex,
+    "sig_to_hex": _setup_sig_to_hex,
+    "forge": _setup_forge,
+}
+
+
+def _percentile(sorted_values: list[float], p: float) -> float:
+    """
+    Retourne le percentile p (entre 0 et 100) d'une liste triée, par interpolation linéaire.
+    """
+    position = (len(sorted_values) - 1) * p / 100
+    lo = int(position)
+    hi = min(lo + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (position - lo)
+
+
+def measure(f: Callable, ops_per_call: int = 1, repeat: int = 100) -> dict:
+    """
+    Appelle f `repeat` fois et retourne les statistiques d'une opération :
+    opérations par seconde et percentiles de durée, en microsecondes.
+    """
+    # Un appel de mise en route, hors mesure.
+    f()
+
+    durations = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        f()
+        durations.append((time.perf_counter() - start) / ops_per_call)
+    durations.sort()
+
+    return {
+        "ops_per_sec": 1 / statistics.median(durations),
+        "p50_us": _percentile(durations, 50) * 1e6,
+        "p90_us": _percentile(durations, 90) * 1e6,
+        "p99_us": _percentile(durations, 99) * 1e6,
+        "repeat": repeat,
+    }
+
+
+def run(names: list[str] | None = None, repeat: int = 100) -> dict[str, dict]:
+    """
+    Exécute les mesures demandées (toutes par défaut) et retourne leurs statistiques.
+    """
+    results = {}
+    for name in names or BENCHMARKS:
+        if name not in BENCHMARKS:
+            raise ValueError(
+                f"Mesure {name!r} inconnue, choisir parmi {list(BENCHMARKS)}."
+            )
+        f, ops_per_call = BENCHMARKS[name]()
+        results[name] = measure(f, ops_per_call, repeat)
+    return results
+
+
+def compare(
+    results: dict[str, dict], baseline: dict[str, dict], threshold: float = 0.2
+) -> list[str]:
+    """
+    Retourne une description de chaque mesure dont le débit a baissé de plus de
+    `threshold` (une fraction) par rapport à la référence.
+    """
+    regressions = []
+    for name, stats in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]["ops_per_sec"]
+        after = stats["ops_per_sec"]
+        if after < before * (1 - threshold):
+            regressions.append(
+                f"{name} : {after:.0f} op/s au lieu de {before:.0f} op/s "
+                f"({(after / before - 1) * 100:+.1f} %)"
+            )
+    return regressions
+
+
+def _print_table(results: dict[str, dict]) -> None:
+    table_headers = "Mesure        |     op/s     |  p50 (µs)  |  p90 (µs)  |  p99 (µs)"
+    print("-" * len(table_headers))
+    print(table_headers)
+    print("-" * len(table_headers))
+    for name, stats in results.items():
+        print(
+            f"{name:<14}|"
+            f"{stats['ops_per_sec']:^14.0f}|"
+            f"{stats['p50_us']:^12.2f}|"
+            f"{stats['p90_us']:^12.2f}|"
+            f"{stats['p99_us']:^11.2f}"
+        )
+    print("-" * len(table_headers))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m tp1.bench", description="Banc d'essai de tp1."
+    )
+    parser.add_argument(
+        "names", nargs="*", help=f"mesures à exécuter parmi {list(BENCHMARKS)}"
+    )
+    parser.add_argument("--repeat", type=int, default=100)
+    parser.add_argument("--json", help="fichier où enregistrer les résultats")
+    parser.add_argument("--baseline", help="résultats de référence (JSON)")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args(argv)
+
+    results = run(args.names, args.repeat)
+    _print_table(results)
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+        for regression in regressions:
+            print(f"Régression : {regression}")
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Index des pré-images révélées par les signatures d'une même clé publique.
+
+Chaque signature valide de Lamport révèle, pour chaque position i, la pré-image de la ligne
+donnée par le bit i du message. Lorsqu'une clé signe plusieurs messages, ces révélations
+s'accumulent : une position dont les deux pré-images sont connues est « libre » (un message
+forgé peut y avoir n'importe quel bit), une position dont une seule est connue impose son bit,
+et une position sans pré-image connue rend toute falsification impossible.
+
+L'index ne garde pas les signatures : seulement deux masques de 256 bits et la clé secrète
+partielle (16 Kio), si bien qu'il peut parcourir des journaux de signatures de n'importe quelle
+taille. Chaque signature ajoutée coûte O(1) opérations sur les masques, plus une copie
+de chaque bloc nouvellement révélé.
+
+Les masques suivent la convention de forge.coverage_masks : des entiers gros-boutistes où le bit 0
+du message est le bit de poids fort.
+
+Utilisation :
+    python -m tp1.coverage signatures.txt
+où chaque ligne du fichier est une signature en hexadécimal, un espace, puis le message signé.
+"""
+
+from typing import IO, Iterable
+
+import math
+import sys
+
+from tp1.lamport import N_BITS, Lamport, Message, PublicKey, SecretKey, Sig
+
+_FULL_MASK = (1 << N_BITS) - 1
+
+
+def _positions(mask: int) -> Iterable[int]:
+    """
+    Produit les positions des bits à 1 d'un masque (la position 0 est le bit de poids fort).
+    """
+    while mask:
+        bit = mask.bit_length() - 1
+        yield N_BITS - 1 - bit
+        mask ^= 1 << bit
+
+
+class CoverageIndex:
+    def __init__(self, pk: PublicKey | None = None):
+        """
+        Si `pk` est donnée, seules les signatures valides pour cette clé sont retenues.
+        """
+        self.pk = pk
+        self.sk = SecretKey(backend=pk.backend) if pk is not None else SecretKey()
+        # Positions dont la pré-image de la ligne 0 (resp. 1) est connue.
+        self.may_be_zero = 0
+        self.may_be_one = 0
+        self.signatures = 0
+        self.rejected = 0
+
+    def add(self, msg: Message, sig: Sig) -> bool:
+        """
+        Ajoute les pré-images révélées par une signature. Retourne False, sans rien ajouter,
+        si une clé publique a été donnée et que la signature n'est pas valide.
+        """
+        if self.pk is not None and not Lamport.verify(msg, self.pk, sig):
+            self.rejected += 1
+            return False
+
+        value = int.from_bytes(msg.data, "big")
+        new_one = value & ~self.may_be_one
+        new_zero = ~value & ~self.may_be_zero & _FULL_MASK
+        for i in _positions(new_one):
+            self.sk.one_pre[i] = sig.block(i)
+        for i in _positions(new_zero):
+            self.sk.zero_pre[i] = sig.block(i)
+        self.may_be_one |= value
+        self.may_be_zero |= ~value & _FULL_MASK
+        self.signatures += 1
+        return True
+
+    def add_many(self, signed: Iterable[tuple[Message, Sig]]) -> int:
+        """
+        Ajoute une suite de paires (message, signature), lue en flux.
+        Retourne le nombre de signatures retenues.
+        """
+        return sum(self.add(msg, sig) for msg, sig in signed)
+
+    def add_stream(self, stream: IO[str]) -> int:
+        """
+        Ajoute les signatures d'un flux texte : une par ligne, la signature en hexadécimal,
+        un espace, puis le message. Les lignes vides sont ignorées.
+        """
+        return self.add_many(
+            (Message.from_str(msg), Sig.from_hex(sig_hex))
+            for sig_hex, _, msg in (
+                line.rstrip("\n").partition(" ") for line in stream if line.strip()
+            )
+        )
+
+    def add_file(self, path: str) -> int:
+        """
+        Ajoute les signatures d'un fichier au format de add_stream.
+        """
+        with open(path) as f:
+            return self.add_stream(f)
+
+    @property
+    def masks(self) -> tuple[int, int]:
+        """
+        Retourne les masques (may_be_zero, may_be_one), comme forge.coverage_masks.
+        """
+        return self.may_be_zero, self.may_be_one
+
+    @property
+    def known(self) -> tuple[set[int], set[int]]:
+        """
+        Retourne, pour chaque valeur de bit, l'ensemble des positions dont la pré-image est connue.
+        """
+        return set(_positions(self.may_be_zero)), set(_positions(self.may_be_one))
+
+    def coverage(self) -> float:
+        """
+        Retourne la fraction des 512 blocs de la clé secrète qui sont connus.
+        """
+        known = self.may_be_zero.bit_count() + self.may_be_one.bit_count()
+        return known / (2 * N_BITS)
+
+    def free_bits(self) -> int:
+        """
+        Retourne le nombre de positions dont les deux pré-images sont connues.
+        """
+        return (self.may_be_zero & self.may_be_one).bit_count()
+
+    def free_fraction(self) -> float:
+        return self.free_bits() / N_BITS
+
+    def expected_attempts(self) -> float:
+        """
+        Retourne le nombre moyen de messages aléatoires à essayer avant d'en trouver un
+        forgeable : 2 à la puissance du nombre de positions imposées, ou l'infini si une
+        position n'a aucune pré-image connue.
+        """
+        if (self.may_be_zero | self.may_be_one) != _FULL_MASK:
+            return math.inf
+        return 2.0 ** (N_BITS - self.free_bits())
+
+    def report(self) -> dict:
+        return {
+            "signatures": self.signatures,
+            "rejected": self.rejected,
+            "coverage": self.coverage(),
+            "free_bits": self.free_bits(),
+            "free_fraction": self.free_fraction(),
+            "expected_attempts": self.expected_attempts(),
+        }
+
+
+if __name__ == "__main__":
+    index = CoverageIndex()
+    if len(sys.argv) > 1:
+        for path in sys.argv[1:]:
+            index.add_file(path)
+    else:
+        index.add_stream(sys.stdin)
+    for name, value in index.report().items():
+        print(f"{name} : {value}")
@@ -62,48 +62,292 @@ La fonction forge est testée par TestForgery.test_forgery() dans le fichier tes
 donc la commande `pytest -vv` et que tout passe, cela signifie que votre implémentation semble être bonne.
 """
 
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, NamedTuple
+
+import itertools
+import json
+import os
+import time
+
 from tp1 import signatures
-from tp1.lamport import Lamport, Message, PublicKey, Sig
+from tp1.coverage import CoverageIndex
+from tp1.hashes import SHA256, HashBackend
+from tp1.instrument import record_hashes, timed
+from tp1.lamport import Lamport, Message, SecretKey, Sig
+
+# Nombre de compteurs consécutifs confiés à un processus à la fois.
+SEARCH_BLOCK_SIZE = 4096
+
+# Masque dont les 256 bits valent 1.
+FULL_MASK = (1 << 256) - 1
+
+# Intervalle minimal (en secondes) entre deux rapports de progression.
+REPORT_INTERVAL = 2.0
+
+
+class SearchResult(NamedTuple):
+    """
+    Résultat d'une recherche : le compteur trouvé, le nombre de candidats
+    essayés pendant cette exécution et la durée de la recherche en secondes.
+    """
+
+    nonce: int
+    searched: int
+    elapsed: float
+
+    @property
+    def rate(self) -> float:
+        """
+        Nombre de candidats essayés par seconde.
+        """
+        return self.searched / self.elapsed if self.elapsed > 0 else float("inf")
+
+
+def candidate(prefix: str, nonce: int | str) -> str:
+    """
+    Retourne le message candidat correspondant à un compteur.
+    """
+    return f"{prefix} {nonce}"
+
+
+def revealed_preimages(
+    signed: list[tuple[Message, Sig]]
+) -> tuple[SecretKey, tuple[set[int], set[int]]]:
+    """
+    Rassemble les blocs de la clé secrète révélés par des signatures valides.
+    Retourne une clé secrète partiellement remplie et, pour chaque valeur de bit,
+    l'ensemble des positions dont la pré-image est connue.
+    """
+    index = CoverageIndex()
+    index.add_many(signed)
+    return index.sk, index.known
+
+
+def coverage_masks(known: tuple[set[int], set[int]]) -> tuple[int, int]:
+    """
+    Retourne deux masques de 256 bits, lus comme des entiers gros-boutistes
+    (le bit 0 du message est le bit de poids fort) : le premier a un 1 à chaque
+    position qui peut valoir 0 dans un message forgeable, le second à chaque
+    position qui peut valoir 1.
+    """
+    may_be_zero = sum(1 << (255 - i) for i in known[0])
+    may_be_one = sum(1 << (255 - i) for i in known[1])
+    return may_be_zero, may_be_one
+
+
+def is_forgeable(digest: bytes, masks: tuple[int, int]) -> bool:
+    """
+    Retourne True si chaque bit du hachage a une pré-image connue.
+    """
+    may_be_zero, may_be_one = masks
+    value = int.from_bytes(digest, "big")
+    # Un 1 là où seul un 0 est connu, ou un 0 là où seul un 1 est connu.
+    return not (value & ~may_be_one or ~value & ~may_be_zero & FULL_MASK)
+
+
+_worker_state: tuple[str, tuple[int, int], HashBackend] | None = None
+
+
+def _init_worker(prefix: str, masks: tuple[int, int], backend: HashBackend) -> None:
+    global _worker_state
+    _worker_state = (prefix, masks, backend)
+
+
+def _search_range(start: int, stop: int) -> int | None:
+    """
+    Cherche dans [start, stop) le premier compteur dont le message est forgeable.
+    Exécuté dans un processus de travail initialisé par _init_worker.
+    """
+    assert _worker_state is not None
+    prefix, (may_be_zero, may_be_one), backend = _worker_state
+    forbidden_one = FULL_MASK ^ may_be_one
+    forbidden_zero = FULL_MASK ^ may_be_zero
+
+    # L'état de hachage qui a déjà absorbé le préfixe fixe de candidate() est copié
+    # pour chaque compteur : seul le suffixe est haché à chaque essai.
+    base = backend.new(candidate(prefix, "").encode())
+    for nonce in range(start, stop):
+        h = base.copy()
+        h.update(str(nonce).encode())
+        value = int.from_bytes(h.digest(), "big")
+        if not (value & forbidden_one or ~value & forbidden_zero):
+            return nonce
+    return None
 
 
-def forge() -> tuple[str, Sig]:
+def _suffix_bytes(start: int, stop: int) -> int:
+    """
+    Retourne le nombre total de chiffres des compteurs de [start, stop),
+    soit le nombre d'octets hachés après le préfixe pour ces candidats.
+    """
+    total = 0
+    n = start
+    while n < stop:
+        digits = len(str(n))
+        hi = min(stop, 10**digits)
+        total += (hi - n) * digits
+        n = hi
+    return total
+
+
+def load_checkpoint(path: str, prefix: str) -> int:
+    """
+    Retourne le compteur à partir duquel reprendre la recherche de `prefix`,
+    ou 0 si le fichier n'existe pas ou concerne un autre message.
+    """
+    try:
+        with open(path) as f:
+            state = json.load(f)
+    except FileNotFoundError:
+        return 0
+    return state["next"] if state.get("prefix") == prefix else 0
+
+
+def save_checkpoint(path: str, prefix: str, next_nonce: int) -> None:
+    """
+    Enregistre de façon atomique le prochain compteur à essayer pour `prefix`.
+    """
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({"prefix": prefix, "next": next_nonce}, f)
+    os.replace(tmp, path)
+
+
+def search(
+    prefix: str,
+    known: tuple[set[int], set[int]],
+    start: int = 0,
+    workers: int | None = None,
+    checkpoint: str | None = None,
+    report: Callable[[int, float], None] | None = None,
+    backend: HashBackend = SHA256,
+) -> SearchResult:
+    """
+    Cherche le plus petit compteur n >= start tel que candidate(prefix, n) soit
+    forgeable avec les pré-images connues. Lève ValueError si une position n'a aucune
+    pré-image connue, car aucun compteur ne peut alors convenir.
+
+    L'espace des compteurs est découpé en plages de SEARCH_BLOCK_SIZE confiées à
+    `workers` processus (par défaut, un par cœur). Les plages sont consommées
+    dans l'ordre, si bien que le résultat est le même quel que soit le nombre de
+    processus ; dès qu'une plage contient une solution, les plages suivantes sont
+    annulées. Si `checkpoint` est donné, la recherche reprend à partir du compteur
+    enregistré et ce fichier est mis à jour au fil de la recherche.
+    `report(candidats, secondes)` est appelé périodiquement pour suivre le débit.
+    `backend` est la fonction de hachage des messages (celle de la clé publique).
+    """
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if checkpoint is not None:
+        start = max(start, load_checkpoint(checkpoint, prefix))
+
+    masks = coverage_masks(known)
+    uncovered = FULL_MASK ^ (masks[0] | masks[1])
+    if uncovered:
+        # Aucun compteur ne peut convenir : la recherche ne finirait jamais.
+        positions = [i for i in range(256) if uncovered >> (255 - i) & 1]
+        raise ValueError(f"Aucune pré-image connue aux positions {positions}.")
+    began = time.perf_counter()
+    last_report = began
+    next_nonce = start
+
+    def advance(stop: int) -> None:
+        nonlocal next_nonce, last_report
+        next_nonce = stop
+        now = time.perf_counter()
+        if now - last_report >= REPORT_INTERVAL:
+            last_report = now
+            if checkpoint is not None:
+                save_checkpoint(checkpoint, prefix, next_nonce)
+            if report is not None:
+                report(next_nonce - start, now - began)
+
+    ranges = (
+        (lo, lo + SEARCH_BLOCK_SIZE) for lo in itertools.count(start, SEARCH_BLOCK_SIZE)
+    )
+
+    found = None
+    if workers <= 1:
+        _init_worker(prefix, masks, backend)
+        for lo, hi in ranges:
+            found = _search_range(lo, hi)
+            if found is not None:
+                break
+            advance(hi)
+    else:
+        with ProcessPoolExecutor(
+            workers, initializer=_init_worker, initargs=(prefix, masks, backend)
+        ) as pool:
+            pending = deque(
+                pool.submit(_search_range, *r)
+                for r in itertools.islice(ranges, 2 * workers)
+            )
+            while found is None:
+                future = pending.popleft()
+                found = future.result()
+                if found is None:
+                    advance(next_nonce + SEARCH_BLOCK_SIZE)
+                    pending.append(pool.submit(_search_range, *next(ranges)))
+            for future in pending:
+                future.cancel()
+
+    assert found is not None
+    # Le compteur trouvé est enregistré : une reprise le retrouve immédiatement.
+    if checkpoint is not None:
+        save_checkpoint(checkpoint, prefix, found)
+    elapsed = time.perf_counter() - began
+    result = SearchResult(found, found + 1 - start, elapsed)
+    # Les candidats sont hachés à partir de copies d'état, hors de HashBackend.
+    record_hashes(result.searched, _suffix_bytes(start, found + 1))
+    if report is not None:
+        report(result.searched, elapsed)
+    return result
+
+
+@timed("forge")
+def forge(workers: int | None = None, checkpoint: str | None = None) -> tuple[str, Sig]:
     """
     Retourne un tuple composé d'un message sous forme de chaîne de caractères
     et une signature valide sur le hachage de ce message à partir de la clé publique
     fournie dans le fichier signatures.py.
+
+    La recherche du message est répartie sur `workers` processus et peut être
+    reprise grâce au fichier `checkpoint` (voir search()).
     """
-    # Décodage de la clé publique et des 5 signatures en
-    # structures utilisables à partir des chaînes hexadécimales.
-    pk = PublicKey.from_hex(signatures.hex_pub_key)
-    sig_1 = Sig.from_hex(signatures.hex_sig_1)
-    sig_2 = Sig.from_hex(signatures.hex_sig_2)
-    sig_3 = Sig.from_hex(signatures.hex_sig_3)
-    sig_4 = Sig.from_hex(signatures.hex_sig_4)
-    sig_5 = Sig.from_hex(signatures.hex_sig_5)
+    # Clé publique et 5 signatures, décodées une seule fois par signatures.py.
+    pk = signatures.pub_key
+    sig_1 = signatures.sig_1
+    sig_2 = signatures.sig_2
+    sig_3 = signatures.sig_3
+    sig_4 = signatures.sig_4
+    sig_5 = signatures.sig_5
 
+    # L'index vérifie chaque signature et retient les pré-images qu'elle révèle.
+    index = CoverageIndex(pk)
+    for k, sig in enumerate((sig_1, sig_2, sig_3, sig_4, sig_5), start=1):
+        good = index.add(Message.from_str(str(k)), sig)
+        print(f"Sig {k} : {'BONNE' if good else 'MAUVAISE'}")
     print(
-        f"Sig 1 : {'BONNE' if Lamport.verify(Message.from_str('1'), pk, sig_1) else 'MAUVAISE'}"
-    )
-    print(
-        f"Sig 2 : {'BONNE' if Lamport.verify(Message.from_str('2'), pk, sig_2) else 'MAUVAISE'}"
-    )
-    print(
-        f"Sig 3 : {'BONNE' if Lamport.verify(Message.from_str('3'), pk, sig_3) else 'MAUVAISE'}"
-    )
-    print(
-        f"Sig 4 : {'BONNE' if Lamport.verify(Message.from_str('4'), pk, sig_4) else 'MAUVAISE'}"
-    )
-    print(
-        f"Sig 5 : {'BONNE' if Lamport.verify(Message.from_str('5'), pk, sig_5) else 'MAUVAISE'}"
+        f"Couverture : {index.coverage():.1%}, bits libres : {index.free_bits()}, "
+        f"essais attendus : {index.expected_attempts():.0f}"
     )
 
     msg_str = "Mon message contrefait"
 
-    # -----
-    # TODO: Votre code ici...
-    # ----
-    # Astuce: msg.data[i // 8] >> (7 - (i % 8)) & 1
+    def report(searched: int, elapsed: float) -> None:
+        rate = searched / elapsed if elapsed > 0 else 0.0
+        print(f"{searched} candidats en {elapsed:.1f} s ({rate:.0f} candidats/s)")
+
+    result = search(
+        msg_str, index.known, workers=workers, checkpoint=checkpoint, report=report
+    )
+
+    forged_str = candidate(msg_str, result.nonce)
+    # Les pré-images révélées suffisent à signer le message trouvé.
+    return forged_str, Lamport.sign(Message.from_str(forged_str), index.sk)
 
 
 if __name__ == "__main__":
-    forge()
+    forge(checkpoint="forge_checkpoint.json")
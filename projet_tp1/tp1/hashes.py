@@ -0,0 +1,81 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Ce module regroupe les fonctions de hachage utilisables par Block, Message et Lamport.
+Toutes produisent 32 octets, la taille d'un bloc, si bien que les tailles des clés et
+des signatures ne dépendent pas du choix de la fonction.
+
+sha256 reste la fonction par défaut : c'est celle qui a servi à produire la clé publique
+et les signatures de `signatures.py`. Les fonctions BLAKE2 sont en général plus rapides
+que sha256 en CPython.
+
+Chaque fonction a un identifiant d'un octet, enregistré dans la forme binaire des clés
+et des signatures qui n'utilisent pas sha256 (voir lamport.BlockTable.to_bytes).
+"""
+
+from typing import Callable
+
+import functools
+import hashlib
+
+
+class HashBackend:
+    """
+    Une fonction de hachage de 32 octets, son nom et son identifiant d'un octet.
+    """
+
+    def __init__(self, name: str, ident: int, factory: Callable):
+        self.name = name
+        self.ident = ident
+        self._factory = factory
+
+    def new(self, data: bytes = b""):
+        """
+        Retourne un nouvel objet de hachage de hashlib, qui a déjà absorbé `data`.
+        """
+        return self._factory(data)
+
+    def digest(self, data) -> bytes:
+        """
+        Retourne le hachage de `data`.
+        """
+        return self._factory(data).digest()
+
+    def __repr__(self) -> str:
+        return f"HashBackend({self.name!r})"
+
+    def __reduce__(self):
+        # Les processus de travail retrouvent la même instance à partir du nom.
+        return get_backend, (self.name,)
+
+
+SHA256 = HashBackend("sha256", 0, hashlib.sha256)
+BLAKE2S = HashBackend("blake2s", 1, hashlib.blake2s)
+BLAKE2B = HashBackend("blake2b", 2, functools.partial(hashlib.blake2b, digest_size=32))
+SHA3_256 = HashBackend("sha3_256", 3, hashlib.sha3_256)
+
+BACKENDS = {backend.name: backend for backend in (SHA256, BLAKE2S, BLAKE2B, SHA3_256)}
+
+
+def get_backend(backend: str | HashBackend) -> HashBackend:
+    """
+    Retourne la fonction de hachage désignée par son nom (ou la fonction elle-même).
+    """
+    if isinstance(backend, HashBackend):
+        return backend
+    try:
+        return BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Fonction de hachage {backend!r} inconnue, choisir parmi {list(BACKENDS)}."
+        ) from None
+
+
+def from_ident(ident: int) -> HashBackend:
+    """
+    Retourne la fonction de hachage correspondant à un identifiant d'un octet.
+    """
+    for backend in BACKENDS.values():
+        if backend.ident == ident:
+            return backend
+    raise ValueError(f"Identifiant de fonction de hachage {ident} inconnu.")
@@ -0,0 +1,219 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Instrumentation facultative des chemins coûteux : nombre d'appels à la fonction de hachage,
+octets hachés et durée de chaque appel de generate_keys, sign, verify, from_hex et forge.
+
+L'instrumentation est désactivée par défaut. Dans ce cas, chaque opération instrumentée ne coûte
+qu'un test booléen de plus, et les fonctions de hachage ne sont pas touchées : les compteurs ne
+sont installés sur les objets de tp1.hashes que pendant l'activation.
+
+Utilisation :
+    with instrumented():
+        Lamport.verify(msg, pk, sig)
+    print(format_report(snapshot()))
+
+ou `python -m tp1 --instrument`. Les hachages sont attribués à l'opération instrumentée la plus
+interne en cours ; ceux faits à partir de copies d'états, hors de HashBackend (pré-images d'une
+SeedSecretKey, candidats de forge), sont ajoutés par record_hashes. Seul le processus courant
+est mesuré : le travail des processus de travail de verify_many, generate_keys_many ou de la
+recherche de forge() n'apparaît que dans la durée de l'opération qui les attend (et, pour
+forge, dans le nombre de candidats hachés).
+"""
+
+from typing import Callable, Iterator
+
+import contextlib
+import functools
+import time
+
+from tp1.hashes import BACKENDS, HashBackend
+
+# Nom utilisé pour les hachages faits en dehors de toute opération instrumentée.
+OUTSIDE = "(hors opération)"
+
+
+class OperationStats:
+    """
+    Statistiques d'une opération : nombre d'appels, durées, histogramme et hachages.
+    L'histogramme compte les appels par tranche de durée [2^k, 2^(k+1)) microsecondes.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.histogram: dict[int, int] = {}
+        self.hashes = 0
+        self.hashed_bytes = 0
+
+    def add_call(self, duration: float) -> None:
+        self.calls += 1
+        self.total += duration
+        self.min = min(self.min, duration)
+        self.max = max(self.max, duration)
+        bucket = max(int(duration * 1e6), 1).bit_length() - 1
+        self.histogram[bucket] = self.histogram.get(bucket, 0) + 1
+
+    def as_dict(self) -> dict:
+        return {
+            "calls": self.calls,
+            "total_s": self.total,
+            "min_s": self.min if self.calls else 0.0,
+            "max_s": self.max,
+            "histogram_us": {
+                f"{1 << k}-{1 << (k + 1)}": count
+                for k, count in sorted(self.histogram.items())
+            },
+            "hashes": self.hashes,
+            "hashed_bytes": self.hashed_bytes,
+        }
+
+
+class _State:
+    def __init__(self):
+        self.enabled = False
+        self.stack: list[str] = []
+        self.stats: dict[str, OperationStats] = {}
+
+    def current(self) -> OperationStats:
+        name = self.stack[-1] if self.stack else OUTSIDE
+        if name not in self.stats:
+            self.stats[name] = OperationStats()
+        return self.stats[name]
+
+
+_state = _State()
+
+
+def record_hashes(count: int, nbytes: int) -> None:
+    """
+    Ajoute `count` appels de hachage portant sur `nbytes` octets à l'opération en cours.
+    Sert aux chemins qui hachent sans passer par HashBackend (copies d'états, autres processus).
+    """
+    if _state.enabled:
+        stats = _state.current()
+        stats.hashes += count
+        stats.hashed_bytes += nbytes
+
+
+def _counting(backend: HashBackend, method: str) -> Callable:
+    original = getattr(type(backend), method).__get__(backend)
+
+    def counted(data=b""):
+        stats = _state.current()
+        stats.hashes += 1
+        stats.hashed_bytes += memoryview(data).nbytes
+        return original(data)
+
+    return counted
+
+
+def enable() -> None:
+    """
+    Active l'instrumentation et installe les compteurs sur les fonctions de hachage.
+    """
+    _state.enabled = True
+    for backend in BACKENDS.values():
+        backend.digest = _counting(backend, "digest")  # type: ignore[method-assign]
+        backend.new = _counting(backend, "new")  # type: ignore[method-assign]
+
+
+def disable() -> None:
+    """
+    Désactive l'instrumentation et retire les compteurs. Les statistiques sont conservées.
+    """
+    _state.enabled = False
+    for backend in BACKENDS.values():
+        backend.__dict__.pop("digest", None)
+        backend.__dict__.pop("new", None)
+
+
+def is_enabled() -> bool:
+    return _state.enabled
+
+
+def reset() -> None:
+    """
+    Efface toutes les statistiques.
+    """
+    _state.stats = {}
+
+
+def snapshot() -> dict[str, dict]:
+    """
+    Retourne une copie des statistiques de chaque opération.
+    """
+    return {name: stats.as_dict() for name, stats in _state.stats.items()}
+
+
+@contextlib.contextmanager
+def instrumented(clear: bool = True) -> Iterator[None]:
+    """
+    Active l'instrumentation le temps d'un bloc `with` (en effaçant d'abord les statistiques
+    si `clear` est vrai), puis rétablit l'état précédent.
+    """
+    was_enabled = _state.enabled
+    if clear:
+        reset()
+    enable()
+    try:
+        yield
+    finally:
+        if not was_enabled:
+            disable()
+
+
+def timed(name: str) -> Callable:
+    """
+    Décorateur qui mesure chaque appel de la fonction sous le nom `name`
+    lorsque l'instrumentation est active.
+    """
+
+    def decorate(f: Callable) -> Callable:
+        @functools.wraps(f)
+        def wrapper(*args, **kwargs):
+            if not _state.enabled:
+                return f(*args, **kwargs)
+            _state.stack.append(name)
+            start = time.perf_counter()
+            try:
+                return f(*args, **kwargs)
+            finally:
+                duration = time.perf_counter() - start
+                _state.stack.pop()
+                if name not in _state.stats:
+                    _state.stats[name] = OperationStats()
+                _state.stats[name].add_call(duration)
+
+        return wrapper
+
+    return decorate
+
+
+def format_report(report: dict[str, dict]) -> str:
+    """
+    Retourne un tableau lisible d'un instantané de snapshot().
+    """
+    table_headers = "Opération          | Appels | Moyenne (µs) |  Max (µs)  | Hachages | Octets hachés"
+    lines = ["-" * len(table_headers), table_headers, "-" * len(table_headers)]
+    for name, stats in report.items():
+        mean = stats["total_s"] / stats["calls"] * 1e6 if stats["calls"] else 0.0
+        lines.append(
+            f"{name:<19}|"
+            f"{stats['calls']:^8}|"
+            f"{mean:^14.1f}|"
+            f"{stats['max_s'] * 1e6:^12.1f}|"
+            f"{stats['hashes']:^10}|"
+            f"{stats['hashed_bytes']:^14}"
+        )
+    lines.append("-" * len(table_headers))
+    for name, stats in report.items():
+        if stats["histogram_us"]:
+            buckets = ", ".join(
+                f"{label} µs : {count}"
+                for label, count in stats["histogram_us"].items()
+            )
+            lines.append(f"{name} : {buckets}")
+    return "\n".join(lines)
@@ -0,0 +1,214 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Réserve de paires de clés à usage unique, générées à l'avance, avec un journal d'utilisation
+qui résiste aux pannes.
+
+Les clés ne sont jamais écrites sur le disque : la clé numéro i est dérivée d'une graine
+maîtresse, H(graine || i), comme les feuilles de merkle.py. Le répertoire de la réserve ne
+contient donc que la graine (32 octets) et le journal, un fichier en ajout seul où chaque clé
+remise est inscrite (numéro sur 8 octets gros-boutistes) et synchronisée sur le disque avec
+fsync *avant* d'être remise. Au redémarrage, la numérotation reprend après le plus grand numéro
+du journal : une clé remise avant une panne n'est jamais remise de nouveau. Une clé inscrite
+puis perdue dans la panne est simplement sautée.
+Le journal est verrouillé (flock) tant que la réserve est ouverte : un deuxième processus
+qui ouvre le même répertoire échoue au lieu de remettre les mêmes clés.
+
+Un fil d'exécution en arrière-plan garde entre `low_water` et `high_water` paires prêtes,
+déjà développées, si bien que take() ne coûte qu'une écriture du journal et que sign()
+ne coûte que Lamport.sign. La mémoire reste bornée par high_water paires (32 Kio chacune).
+
+Utilisation :
+    with KeyPool("cles") as pool:
+        pk, sig = pool.sign(Message.from_str("Bonjour"))
+"""
+
+from collections import deque
+
+import fcntl
+import hashlib
+import os
+import secrets
+import struct
+import threading
+
+from tp1.lamport import (
+    BLOCK_SIZE,
+    Lamport,
+    Message,
+    PublicKey,
+    SecretKey,
+    SeedSecretKey,
+    Sig,
+    hash_blocks,
+)
+
+SEED_FILE = "seed"
+JOURNAL_FILE = "journal"
+
+_RECORD = struct.Struct(">Q")
+
+
+def _derive(seed: bytes, index: int) -> tuple[SecretKey, PublicKey]:
+    """
+    Retourne la paire de clés numéro `index` de la graine maîtresse, clé secrète développée.
+    """
+    sk = SeedSecretKey(
+        hashlib.sha256(seed + index.to_bytes(8, "big")).digest()
+    ).expand()
+    return sk, PublicKey.from_bytes(hash_blocks(sk.to_bytes()))
+
+
+def _fsync_directory(path: str) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _load_seed(directory: str) -> bytes:
+    """
+    Lit la graine maîtresse du répertoire, ou la crée (de façon atomique) si elle n'existe pas.
+    """
+    path = os.path.join(directory, SEED_FILE)
+    try:
+        with open(path, "rb") as f:
+            seed = f.read()
+    except FileNotFoundError:
+        seed = secrets.token_bytes(BLOCK_SIZE)
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            f.write(seed)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+        _fsync_directory(directory)
+    if len(seed) != BLOCK_SIZE:
+        raise ValueError(f"Graine de longueur {len(seed)}, au lieu de {BLOCK_SIZE}.")
+    return seed
+
+
+def read_journal(path: str) -> tuple[list[int], int]:
+    """
+    Retourne les numéros inscrits dans le journal et le nombre d'octets d'une dernière
+    inscription incomplète (interrompue par une panne).
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except FileNotFoundError:
+        return [], 0
+    torn = len(data) % _RECORD.size
+    used = [index for (index,) in _RECORD.iter_unpack(data[: len(data) - torn])]
+    return used, torn
+
+
+class KeyPool:
+    def __init__(
+        self, directory: str, high_water: int = 32, low_water: int | None = None
+    ):
+        if high_water < 1:
+            raise ValueError("high_water doit être au moins 1.")
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.high_water = high_water
+        self.low_water = high_water // 2 if low_water is None else low_water
+        self._seed = _load_seed(directory)
+
+        # Verrou exclusif sur le journal : deux réserves ouvertes sur le même répertoire,
+        # dans ce processus ou dans un autre, remettraient les mêmes clés.
+        journal_path = os.path.join(directory, JOURNAL_FILE)
+        created = not os.path.exists(journal_path)
+        self._journal = open(journal_path, "ab")
+        try:
+            fcntl.flock(self._journal, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            self._journal.close()
+            raise ValueError(
+                f"La réserve de clés {directory} est déjà ouverte ailleurs."
+            ) from None
+        if created:
+            # Comme pour la graine : l'entrée du journal doit survivre à une panne.
+            _fsync_directory(directory)
+
+        used, torn = read_journal(journal_path)
+        # Une inscription incomplète a peut-être été suivie d'une remise : on saute son numéro.
+        self._next = max(used, default=-1) + 1 + (1 if torn else 0)
+        if torn:
+            self._journal.truncate(os.path.getsize(journal_path) - torn)
+
+        self._ready: deque[tuple[int, SecretKey, PublicKey]] = deque()
+        self._next_generated = self._next
+        self._condition = threading.Condition()
+        self._closed = False
+        self._worker = threading.Thread(target=self._fill, daemon=True)
+        self._worker.start()
+
+    def __enter__(self) -> "KeyPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._worker.join()
+        if not self._journal.closed:
+            fcntl.flock(self._journal, fcntl.LOCK_UN)
+            self._journal.close()
+
+    def ready(self) -> int:
+        """
+        Retourne le nombre de paires de clés prêtes.
+        """
+        return len(self._ready)
+
+    def _fill(self) -> None:
+        """
+        Boucle du fil d'arrière-plan : remplit la réserve jusqu'à high_water dès qu'elle
+        descend sous low_water.
+        """
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._ready) <= self.low_water
+                )
+                if self._closed:
+                    return
+                missing = self.high_water - len(self._ready)
+                start = self._next_generated
+                self._next_generated += missing
+            for index in range(start, start + missing):
+                pair = _derive(self._seed, index)
+                with self._condition:
+                    self._ready.append((index, *pair))
+                    self._condition.notify_all()
+
+    def take(self) -> tuple[SecretKey, PublicKey]:
+        """
+        Retourne une paire de clés jamais remise, après l'avoir inscrite au journal.
+        Attend le fil d'arrière-plan si la réserve est vide.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or self._ready)
+            if self._closed:
+                raise ValueError("Réserve de clés fermée.")
+            index, sk, pk = self._ready.popleft()
+            self._condition.notify_all()
+
+            self._journal.write(_RECORD.pack(index))
+            self._journal.flush()
+            os.fsync(self._journal.fileno())
+            self._next = index + 1
+        return sk, pk
+
+    def sign(self, msg: Message) -> tuple[PublicKey, Sig]:
+        """
+        Signe le message avec une nouvelle clé de la réserve et retourne sa clé publique
+        avec la signature.
+        """
+        sk, pk = self.take()
+        return pk, Lamport.sign(msg, sk)
@@ -11,37 +11,48 @@ Il y a probablement un moyen de faire passer les tests sans rajouter une implém
 je pense qu'il serait à votre avantage de penser à compléter le code correctement :).
 """
 
-from typing import Self
+from collections import deque
+from concurrent.futures import Executor, Future
+from typing import IO, Iterable, Iterator, Self
 
 import hashlib
+import itertools
+import mmap
+import os
 import secrets
+import stat
 import sys
 
+from tp1.hashes import SHA256, HashBackend, from_ident
+from tp1.instrument import record_hashes, timed
+
 
 class Block:
     """
     Un bloc de données a toujours une longueur de 32 octets.
     Nous utilisons sha256 et c'est la taille à la fois de la sortie (définie par la fonction de hachage)
-    et de nos entrées.
+    et de nos entrées. Les autres fonctions de tp1.hashes produisent aussi 32 octets.
     """
 
     def __init__(self, data=None):
         self.data = data
 
-    def hash_data(self) -> bytes:
+    def hash_data(self, backend: HashBackend = SHA256) -> bytes:
         """
-        Retourne le hachage sha256 des données du bloc.
+        Retourne le hachage des données du bloc (sha256 par défaut).
         """
         assert not self.is_empty()
-        return hashlib.sha256(self.data).digest()
+        return backend.digest(self.data)
 
-    def is_preimage(self, arg: bytes) -> bool:
+    def is_preimage(self, arg: bytes, backend: HashBackend = SHA256) -> bool:
         """
         Retourne True si le bloc est une pré-image de l'argument.
         Par exemple, si Y = hash(X), alors X.is_preimage(Y) renverra True,
         et Y.is_preimage(X) renverra False.
         """
-        return not self.is_empty() and secrets.compare_digest(self.hash_data(), arg)
+        return not self.is_empty() and secrets.compare_digest(
+            self.hash_data(backend), arg
+        )
 
     def is_empty(self) -> bool:
         """
@@ -64,39 +75,413 @@ class Block:
         return self.data.hex()
 
 
+# Taille des morceaux lus ou hachés à la fois par Message.from_stream et Message.from_file.
+HASH_CHUNK_SIZE = 1 << 20
+
+
 class Message(Block):
     """
     Un message à signer n'est rien d'autre qu'un bloc.
     """
 
     @classmethod
-    def from_str(cls, s: str) -> Self:
+    def from_str(cls, s: str, backend: HashBackend = SHA256) -> Self:
         """
         Retourne un objet Message dont la donnée est le hash de la chaîne
         fournie en argument.
         """
-        return cls(hashlib.sha256(s.encode()).digest())
+        return cls(backend.digest(s.encode()))
+
+    @classmethod
+    def from_buffer(cls, data, backend: HashBackend = SHA256) -> Self:
+        """
+        Retourne le Message des octets de `data` (bytes, bytearray, memoryview, mmap...),
+        hachés sur place, sans copie.
+        """
+        return cls(backend.digest(memoryview(data)))
+
+    @classmethod
+    def from_stream(
+        cls,
+        stream: IO[bytes],
+        backend: HashBackend = SHA256,
+        chunk_size: int = HASH_CHUNK_SIZE,
+    ) -> Self:
+        """
+        Retourne le Message des octets lus dans un flux binaire jusqu'à sa fin, par morceaux
+        de `chunk_size` octets : la mémoire utilisée ne dépend pas de la taille du flux.
+        """
+        h = backend.new()
+        if hasattr(stream, "readinto"):
+            # Un seul tampon, réutilisé pour chaque morceau.
+            buffer = bytearray(chunk_size)
+            view = memoryview(buffer)
+            while n := stream.readinto(buffer):
+                h.update(view[:n])
+        else:
+            while chunk := stream.read(chunk_size):
+                h.update(chunk)
+        return cls(h.digest())
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str | os.PathLike,
+        backend: HashBackend = SHA256,
+        chunk_size: int = HASH_CHUNK_SIZE,
+    ) -> Self:
+        """
+        Retourne le Message du contenu d'un fichier. Un fichier ordinaire est projeté
+        en mémoire (mmap) et haché par morceaux de `chunk_size` octets, sans copie ;
+        les autres (tubes, périphériques...) sont lus comme un flux.
+        """
+        with open(path, "rb") as f:
+            info = os.fstat(f.fileno())
+            if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+                return cls.from_stream(f, backend, chunk_size)
+
+            h = backend.new()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                if hasattr(mapped, "madvise"):
+                    mapped.madvise(mmap.MADV_SEQUENTIAL)
+                with memoryview(mapped) as view:
+                    for offset in range(0, len(view), chunk_size):
+                        h.update(view[offset : offset + chunk_size])
+            return cls(h.digest())
+
+    @classmethod
+    async def from_file_async(
+        cls,
+        path: str | os.PathLike,
+        backend: HashBackend = SHA256,
+        executor: Executor | None = None,
+    ) -> Self:
+        """
+        Variante asynchrone de from_file, exécutée dans `executor` (par défaut, le groupe
+        de fils d'asyncio). hashlib libère le GIL pendant le hachage, si bien que plusieurs
+        fichiers sont hachés en parallèle :
+            messages = await asyncio.gather(*(Message.from_file_async(p) for p in paths))
+        """
+        # Importé ici : asyncio alourdirait chaque import de tp1.lamport.
+        import asyncio
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(executor, cls.from_file, path, backend)
+
+
+# Taille d'un bloc (sortie de sha256) et nombre de bits d'un message.
+BLOCK_SIZE = 32
+N_BITS = 256
+
+
+class BlockView(Block):
+    """
+    Un bloc qui ne possède pas ses données : il s'agit d'une fenêtre de 32 octets
+    sur le tampon d'une clé ou d'une signature. Lire `data` ne copie rien, et
+    affecter `data` écrit directement dans le tampon partagé.
+    """
+
+    def __init__(self, buffer: memoryview, offset: int):
+        self._buffer = buffer
+        self._offset = offset
+
+    @property
+    def data(self) -> memoryview:
+        return self._buffer[self._offset : self._offset + BLOCK_SIZE]
+
+    @data.setter
+    def data(self, value) -> None:
+        if len(value) != BLOCK_SIZE:
+            raise ValueError(f"Bloc de longueur {len(value)}, au lieu de {BLOCK_SIZE}.")
+        self._buffer[self._offset : self._offset + BLOCK_SIZE] = value
+
+
+class BlockRow:
+    """
+    Une rangée de 256 blocs adossée à une tranche contiguë d'un tampon.
+    S'indexe comme une liste de blocs : row[i] retourne un BlockView et
+    row[i] = x copie les 32 octets de x (un Block ou des octets) dans le tampon.
+    """
+
+    def __init__(self, buffer: memoryview):
+        self._buffer = buffer
+
+    def __len__(self) -> int:
+        return N_BITS
+
+    def __getitem__(self, i: int) -> BlockView:
+        if not -N_BITS <= i < N_BITS:
+            raise IndexError(i)
+        return BlockView(self._buffer, BLOCK_SIZE * (i % N_BITS))
+
+    def __setitem__(self, i: int, value) -> None:
+        self[i].data = value.data if isinstance(value, Block) else value
+
+    def __iter__(self):
+        return (self[i] for i in range(N_BITS))
+
+
+class BlockTable:
+    """
+    Base commune de SecretKey, PublicKey et Sig : `ROWS` rangées de 256 blocs
+    de 32 octets, stockées dans un seul tampon contigu (bytearray) selon l'ordre
+    décrit dans forge.py (rangée 0 en entier, puis rangée 1).
+    Les accès aux rangées et aux blocs retournent des memoryview, sans copie.
+
+    `backend` est la fonction de hachage qui relie les rangées (voir tp1.hashes).
+    Pour sha256, la forme binaire est constituée des blocs seuls ; pour les autres,
+    les blocs sont précédés de l'identifiant d'un octet de la fonction de hachage.
+    """
+
+    ROWS = 1
+    SIZE = ROWS * N_BITS * BLOCK_SIZE
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.SIZE = cls.ROWS * N_BITS * BLOCK_SIZE
+
+    def __init__(self, buffer=None, backend: HashBackend = SHA256):
+        if buffer is None:
+            buffer = bytearray(self.SIZE)
+        view = memoryview(buffer).cast("B")
+        if len(view) != self.SIZE:
+            raise ValueError(
+                f"{type(self).__name__} de longueur {len(view)}, au lieu de {self.SIZE}."
+            )
+        self._buffer = buffer
+        self._view = view
+        self.backend = backend
+
+    @classmethod
+    def _from_serialized(cls, buffer: bytearray) -> Self:
+        """
+        Construit un objet à partir d'une forme binaire déjà copiée dans `buffer`,
+        en retirant l'identifiant de la fonction de hachage s'il est présent.
+        """
+        if len(buffer) == cls.SIZE + 1:
+            backend = from_ident(buffer[0])
+            del buffer[0]
+            return cls(buffer, backend)
+        return cls(buffer)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Retourne un objet à partir de sa forme binaire (voir to_bytes).
+        Les données sont copiées une seule fois dans un nouveau tampon.
+        """
+        return cls._from_serialized(bytearray(data))
+
+    @classmethod
+    def from_buffer(cls, buffer, backend: HashBackend = SHA256) -> Self:
+        """
+        Retourne un objet qui partage le tampon fourni (bytearray, memoryview, mmap...)
+        au lieu de le copier. Le tampon ne contient que les blocs.
+        """
+        return cls(buffer, backend)
+
+    def _header(self) -> bytes:
+        """
+        Retourne l'en-tête de la forme binaire : vide pour sha256, l'identifiant sinon.
+        """
+        return b"" if self.backend is SHA256 else bytes([self.backend.ident])
+
+    def to_bytes(self) -> bytes:
+        """
+        Retourne la forme binaire de l'objet : les blocs concaténés dans l'ordre,
+        précédés de l'identifiant de la fonction de hachage si ce n'est pas sha256.
+        """
+        return self._header() + self._view.tobytes()
+
+    def __bytes__(self) -> bytes:
+        return self.to_bytes()
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BlockTable):
+            return NotImplemented
+        return (
+            self.ROWS == other.ROWS
+            and self.backend is other.backend
+            and self._view == other._view
+        )
+
+    def __hash__(self) -> int:
+        # Cohérent avec __eq__ : le hachage suit le contenu, qui ne doit donc plus changer
+        # tant que l'objet sert de clé de dictionnaire ou d'élément d'ensemble.
+        return hash((self.ROWS, self.backend.ident, self._view.tobytes()))
+
+    def row(self, r: int) -> memoryview:
+        """
+        Retourne une vue (sans copie) sur les 256 blocs de la rangée r.
+        """
+        size = N_BITS * BLOCK_SIZE
+        return self._view[r * size : (r + 1) * size]
+
+    def block(self, i: int, r: int = 0) -> memoryview:
+        """
+        Retourne une vue (sans copie) sur le bloc i de la rangée r.
+        Pour une clé, r est la valeur du bit i du message.
+        """
+        offset = (r * N_BITS + i) * BLOCK_SIZE
+        return self._view[offset : offset + BLOCK_SIZE]
+
+
+class SecretKey(BlockTable):
+    ROWS = 2
+
+    @property
+    def zero_pre(self) -> BlockRow:
+        return BlockRow(self.row(0))
 
+    @property
+    def one_pre(self) -> BlockRow:
+        return BlockRow(self.row(1))
 
-class SecretKey:
-    def __init__(self):
-        self.zero_pre = [Block() for _ in range(256)]
-        self.one_pre = [Block() for _ in range(256)]
 
+class DerivedRow:
+    """
+    Une rangée de 256 blocs calculés à la demande par une SeedSecretKey.
+    """
+
+    def __init__(self, sk: "SeedSecretKey", r: int):
+        self._sk = sk
+        self._r = r
+
+    def __len__(self) -> int:
+        return N_BITS
 
-class PublicKey:
-    def __init__(self):
-        self.zero_hash = [Block() for _ in range(256)]
-        self.one_hash = [Block() for _ in range(256)]
+    def __getitem__(self, i: int) -> Block:
+        if not -N_BITS <= i < N_BITS:
+            raise IndexError(i)
+        return Block(self._sk.block(i % N_BITS, self._r))
+
+    def __iter__(self):
+        return (self[i] for i in range(N_BITS))
+
+
+class SeedSecretKey:
+    """
+    Une clé secrète réduite à une graine de 32 octets, 512 fois plus petite qu'une SecretKey.
+    Chaque pré-image est dérivée à la demande par H(graine || rangée || i), où H est
+    la fonction de hachage de la clé, la rangée tient sur un octet et i sur deux octets
+    gros-boutistes.
+    S'utilise partout où une SecretKey est attendue par Lamport.sign.
+    """
+
+    SIZE = BLOCK_SIZE
+
+    def __init__(self, seed: bytes, backend: HashBackend = SHA256):
+        if len(seed) != BLOCK_SIZE:
+            raise ValueError(
+                f"Graine de longueur {len(seed)}, au lieu de {BLOCK_SIZE}."
+            )
+        self.seed = bytes(seed)
+        self.backend = backend
+        # État de hachage ayant déjà absorbé la graine, copié pour chaque pré-image.
+        self._state = backend.new(self.seed)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        if len(data) == BLOCK_SIZE + 1:
+            return cls(data[1:], from_ident(data[0]))
+        return cls(data)
+
+    def to_bytes(self) -> bytes:
+        if self.backend is SHA256:
+            return self.seed
+        return bytes([self.backend.ident]) + self.seed
 
     @classmethod
+    def from_hex(cls, s: str) -> Self:
+        return cls.from_bytes(bytes.fromhex(s))
+
+    def to_hex(self) -> str:
+        return self.to_bytes().hex()
+
+    def _derive(self, i: int, r: int) -> bytes:
+        # Copie d'état, hors de HashBackend : les appelants comptent eux-mêmes les hachages.
+        h = self._state.copy()
+        h.update(bytes((r, i >> 8, i & 0xFF)))
+        return h.digest()
+
+    def block(self, i: int, r: int = 0) -> bytes:
+        """
+        Dérive la pré-image i de la rangée r.
+        """
+        record_hashes(1, 3)
+        return self._derive(i, r)
+
+    def select(self, data: bytes) -> bytes:
+        """
+        Équivalent de select_blocks pour la clé complète : ne dérive que les 256
+        pré-images choisies par les bits du message `data`.
+        """
+        blocks = []
+        for offset in bit_layout(data):
+            r, i = divmod(offset // BLOCK_SIZE, N_BITS)
+            blocks.append(self._derive(i, r))
+        record_hashes(N_BITS, 3 * N_BITS)
+        return b"".join(blocks)
+
+    @property
+    def zero_pre(self) -> DerivedRow:
+        return DerivedRow(self, 0)
+
+    @property
+    def one_pre(self) -> DerivedRow:
+        return DerivedRow(self, 1)
+
+    def expand(self) -> SecretKey:
+        """
+        Retourne la SecretKey complète (16 Ko) correspondant à la graine.
+        """
+        record_hashes(2 * N_BITS, 6 * N_BITS)
+        return SecretKey(
+            bytearray(
+                b"".join(self._derive(i, r) for r in range(2) for i in range(N_BITS))
+            ),
+            self.backend,
+        )
+
+    def public_key(self) -> "PublicKey":
+        """
+        Retourne la clé publique correspondante. Chaque pré-image est dérivée puis
+        hachée aussitôt, sans jamais matérialiser la clé secrète complète.
+        """
+        digest = self.backend.digest
+        record_hashes(2 * N_BITS, 6 * N_BITS)
+        return PublicKey(
+            bytearray(
+                b"".join(
+                    [
+                        digest(self._derive(i, r))
+                        for r in range(2)
+                        for i in range(N_BITS)
+                    ]
+                )
+            ),
+            self.backend,
+        )
+
+
+class PublicKey(BlockTable):
+    ROWS = 2
+
+    @property
+    def zero_hash(self) -> BlockRow:
+        return BlockRow(self.row(0))
+
+    @property
+    def one_hash(self) -> BlockRow:
+        return BlockRow(self.row(1))
+
+    @classmethod
+    @timed("PublicKey.from_hex")
     def from_hex(cls, s: str) -> Self:
         """
         Prend une chaîne de PublicKey.to_hex() et la transforme en un objet PublicKey.
         Renverra une erreur s'il y a des caractères non hexadécimaux ou si la longueur est incorrecte.
         """
-        pk = cls()
-
         # Un octet de 8 bits peut avoir des valeurs allant de 00000000 à
         # 11111111 sous forme binaire, qui peuvent être commodément
         # représentées par 00 à FF en hexadécimal.
@@ -104,50 +489,90 @@ class PublicKey:
         # 256 blocs, 2 rangées, 64 caractères hexadécimaux par bloc.
         expected_length = 256 * 2 * 64
 
+        # Une fonction de hachage autre que sha256 ajoute son identifiant
+        # (un octet, donc 2 caractères hexadécimaux) en tête.
         # Nous nous assurons que la chaîne hexadécimale est de la bonne longueur.
-        if len(s) != expected_length:
+        if len(s) not in (expected_length, expected_length + 2):
             raise ValueError(
                 f"Clé publique de longueur {len(s)}, au lieu de {expected_length}."
             )
 
-        # Conversion hexadécimal -> bytes
-        buffer = bytes.fromhex(s)
+        # Conversion hexadécimal -> tampon, en une seule allocation.
+        return cls._from_serialized(bytearray.fromhex(s))
 
-        for i in range(256):
-            pk.zero_hash[i] = Block.from_bytes(buffer[32 * i : 32 * (i + 1)])
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale d'une clé publique.
+        """
+        return self._header().hex() + self._view.hex()
 
-        for i in range(256, 512):
-            pk.one_hash[i - 256] = Block.from_bytes(buffer[32 * i : 32 * (i + 1)])
+    def fingerprint(self) -> "PublicKeyFingerprint":
+        """
+        Retourne l'empreinte de 32 octets de la clé publique.
+        """
+        return PublicKeyFingerprint(self.backend.digest(self._view), self.backend)
 
-        return pk
 
-    def to_hex(self) -> str:
+class PublicKeyFingerprint(Block):
+    """
+    Une clé publique compacte : le hachage des 512 blocs de la clé publique complète.
+    Elle ne permet de vérifier que des signatures étendues (ExtendedSig), qui contiennent
+    de quoi reconstruire la clé publique complète.
+    """
+
+    def __init__(self, data=None, backend: HashBackend = SHA256):
+        super().__init__(data)
+        self.backend = backend
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        if len(data) == BLOCK_SIZE + 1:
+            return cls(bytes(data[1:]), from_ident(data[0]))
+        return cls(bytes(data))
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
         """
-        Retourne une chaîne hexadécimale d'une clé publique.
+        Prend une chaîne de PublicKeyFingerprint.to_hex() et la transforme en empreinte.
         """
-        s0 = "".join(block.to_hex() for block in self.zero_hash)
-        s1 = "".join(block.to_hex() for block in self.one_hash)
+        # 32 octets, 64 caractères hexadécimaux, plus l'identifiant éventuel.
+        expected_length = 64
 
-        return s0 + s1
+        if len(s) not in (expected_length, expected_length + 2):
+            raise ValueError(
+                f"Empreinte de longueur {len(s)}, au lieu de {expected_length}."
+            )
 
+        return cls.from_bytes(bytes.fromhex(s))
 
-class Sig:
+    def to_bytes(self) -> bytes:
+        if self.backend is SHA256:
+            return self.data
+        return bytes([self.backend.ident]) + self.data
+
+    def to_hex(self) -> str:
+        return self.to_bytes().hex()
+
+
+class Sig(BlockTable):
     """
     Une signature se compose de 256 blocs de 32 octets chacun.
     C'est une révélation sélective de la clé privée, selon les bits du message.
     """
 
-    def __init__(self):
-        self.preimage = [Block() for _ in range(256)]
+    ROWS = 1
+
+    @property
+    def preimage(self) -> BlockRow:
+        return BlockRow(self.row(0))
 
     @classmethod
+    @timed("Sig.from_hex")
     def from_hex(cls, s: str) -> Self:
         """
         Même idée que PublicKey.from_hex, mais deux fois moins grand.
         Le format est juste chaque bloc de la signature dans l'ordre.
         """
-        sig = cls()
-
         # Un octet de 8 bits peut avoir des valeurs allant de 00000000 à
         # 11111111 sous forme binaire, qui peuvent être commodément
         # représentées par 00 à FF en hexadécimal.
@@ -155,66 +580,389 @@ class Sig:
         # 256 blocs, 1 rangée, 64 caractères hexadécimaux par bloc.
         expected_length = 256 * 1 * 64
 
-        # Nous nous assurons que la chaîne hexadécimale est de la bonne longueur.
-        if len(s) != expected_length:
+        # Nous nous assurons que la chaîne hexadécimale est de la bonne longueur,
+        # avec ou sans l'identifiant de la fonction de hachage.
+        if len(s) not in (expected_length, expected_length + 2):
             raise ValueError(
-                f"Clé publique de longueur {len(s)}, au lieu de {expected_length}."
+                f"Signature de longueur {len(s)}, au lieu de {expected_length}."
             )
 
-        # Conversion hexadécimal -> bytes
-        buffer = bytes.fromhex(s)
+        # Conversion hexadécimal -> tampon, en une seule allocation.
+        return cls._from_serialized(bytearray.fromhex(s))
 
-        for i in range(256):
-            sig.preimage[i] = Block.from_bytes(buffer[32 * i : 32 * (i + 1)])
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale d'une signature.
+        """
+        return self._header().hex() + self._view.hex()
 
-        return sig
+
+class ExtendedSig(BlockTable):
+    """
+    Une signature étendue : la signature ordinaire (rangée 0) suivie des hachages de la rangée
+    non révélée de la clé publique (rangée 1), soit 16384 octets.
+    Avec ces deux rangées, le vérificateur reconstruit la clé publique complète,
+    ce qui permet de ne distribuer que son empreinte de 32 octets.
+    """
+
+    ROWS = 2
+
+    @property
+    def preimage(self) -> BlockRow:
+        return BlockRow(self.row(0))
+
+    @property
+    def complement(self) -> BlockRow:
+        return BlockRow(self.row(1))
+
+    def sig(self) -> Sig:
+        """
+        Retourne la signature ordinaire contenue dans la rangée 0, sans copie.
+        """
+        return Sig.from_buffer(self.row(0), self.backend)
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
+        """
+        Même idée que Sig.from_hex, mais deux fois plus grand.
+        """
+        # 256 blocs, 2 rangées, 64 caractères hexadécimaux par bloc.
+        expected_length = 256 * 2 * 64
+
+        if len(s) not in (expected_length, expected_length + 2):
+            raise ValueError(
+                f"Signature étendue de longueur {len(s)}, au lieu de {expected_length}."
+            )
+
+        return cls._from_serialized(bytearray.fromhex(s))
 
     def to_hex(self) -> str:
         """
-        Retourne une chaîne hexadécimale d'une signature.
+        Retourne une chaîne hexadécimale d'une signature étendue.
         """
-        return "".join(block.to_hex() for block in self.preimage)
+        return self._header().hex() + self._view.hex()
 
 
 class Lamport:
     @classmethod
-    def generate_keys(cls) -> tuple[SecretKey, PublicKey]:
-        sk = SecretKey()
-        pk = PublicKey()
-
-        for i in range(256):
-            sk.zero_pre[i] = secrets.token_bytes(32)
-            sk.one_pre[i] = secrets.token_bytes(32)
+    @timed("generate_keys")
+    def generate_keys(
+        cls, backend: HashBackend = SHA256
+    ) -> tuple[SecretKey, PublicKey]:
+        sk_buffer, pk_buffer = _generate_batch(1, backend)
+        return SecretKey(sk_buffer, backend), PublicKey(pk_buffer, backend)
 
-            pk.zero_hash[i] = hashlib.sha256(sk.zero_pre[i]).digest()
-            pk.one_hash[i] = hashlib.sha256(sk.one_pre[i]).digest()
+    @classmethod
+    def generate_seeded_keys(
+        cls, seed: bytes | None = None, backend: HashBackend = SHA256
+    ) -> tuple[SeedSecretKey, PublicKey]:
+        """
+        Génère une paire de clés dont la clé secrète n'est qu'une graine de 32 octets.
+        """
+        if seed is None:
+            seed = secrets.token_bytes(BLOCK_SIZE)
+        sk = SeedSecretKey(seed, backend)
+        return sk, sk.public_key()
 
-        return sk, pk
+    @classmethod
+    def generate_keys_many(
+        cls,
+        n: int | None = None,
+        batch_size: int = 16,
+        workers: int | None = 1,
+        backend: HashBackend = SHA256,
+    ) -> Iterator[tuple[SecretKey, PublicKey]]:
+        """
+        Produit paresseusement `n` paires de clés (sans fin si n est None).
+
+        Les clés sont générées par lots de `batch_size` : une seule lecture d'aléa
+        et un seul tampon de clés publiques par lot. Les clés d'un même lot se
+        partagent ces tampons, donc la mémoire reste bornée par la taille du lot
+        tant que l'appelant ne conserve pas les clés.
+        Avec `workers` > 1 (None pour un processus par cœur), les lots sont générés
+        par un groupe de processus, avec au plus deux lots en attente par processus.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        sizes: Iterator[int]
+        if n is None:
+            sizes = itertools.repeat(batch_size)
+        else:
+            sizes = (min(batch_size, n - lo) for lo in range(0, n, batch_size))
+
+        if workers <= 1 or (n is not None and n <= batch_size):
+            for size in sizes:
+                sk_buffer, pk_buffer = _generate_batch(size, backend)
+                yield from _split_batch(sk_buffer, pk_buffer, backend)
+            return
+
+        # Importé ici : concurrent.futures.process alourdirait chaque import du module.
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            pending: deque[Future[tuple[bytearray, bytearray]]] = deque()
+            for size in sizes:
+                pending.append(pool.submit(_generate_batch, size, backend))
+                if len(pending) >= 2 * workers:
+                    sk_buffer, pk_buffer = pending.popleft().result()
+                    yield from _split_batch(sk_buffer, pk_buffer, backend)
+            while pending:
+                sk_buffer, pk_buffer = pending.popleft().result()
+                yield from _split_batch(sk_buffer, pk_buffer, backend)
 
     @classmethod
-    def sign(cls, msg: Message, sk: SecretKey) -> Sig:
-        sig = Sig()
+    @timed("sign")
+    def sign(cls, msg: Message, sk: SecretKey | SeedSecretKey) -> Sig:
+        return Sig(bytearray(_select_preimages(msg.data, sk)), sk.backend)
 
-        hash_data = msg.hash_data()
-        for i in range(256):
-            b = hash_data[i // 8] >> (7 - (i % 8)) & 1
-            if b == 0:
-                sig.preimage[i] = sk.zero_pre[i]
-            else:
-                sig.preimage[i] = sk.one_pre[i]
+    @classmethod
+    @timed("sign_extended")
+    def sign_extended(cls, msg: Message, sk: SecretKey | SeedSecretKey) -> ExtendedSig:
+        """
+        Signe le message et ajoute les hachages de la rangée non révélée de la clé publique,
+        pour une vérification à partir de l'empreinte de la clé publique.
+        """
+        revealed = _select_preimages(msg.data, sk)
+        hidden = _select_preimages(_complement(msg.data), sk)
+        return ExtendedSig(
+            bytearray(revealed + hash_blocks(hidden, sk.backend)), sk.backend
+        )
 
-        return sig
+    @classmethod
+    def rebuild_public_key(cls, msg: Message, sig: ExtendedSig) -> PublicKey:
+        """
+        Reconstruit la clé publique complète à partir d'une signature étendue :
+        les hachages des pré-images révélées d'une part, les hachages fournis d'autre part.
+        """
+        # Table de deux rangées : hachages révélés, puis hachages fournis. Le bloc i de la
+        # rangée r de la clé y est à la rangée 0 si le bit i vaut r, à la rangée 1 sinon :
+        # la rangée 0 de la clé est donc choisie par les bits du message, la rangée 1
+        # par leur complément.
+        table = hash_blocks(sig.row(0), sig.backend) + sig.row(1).tobytes()
+        return PublicKey(
+            bytearray(
+                select_blocks(msg.data, table)
+                + select_blocks(_complement(msg.data), table)
+            ),
+            sig.backend,
+        )
 
     @classmethod
-    def verify(cls, msg: Message, pk: PublicKey, sig: Sig) -> bool:
-        hash_data = msg.hash_data()
-        for i in range(256):
-            b = hash_data[i // 8] >> (7 - (i % 8)) & 1
-            if hashlib.sha256(sig.preimage[i]).digest() != pk.zero_hash[i] and b == 0:
-                return False
-            if hashlib.sha256(sig.preimage[i]).digest() != pk.one_hash[i] and b == 1:
+    @timed("verify")
+    def verify(
+        cls,
+        msg: Message,
+        pk: PublicKey | PublicKeyFingerprint,
+        sig: Sig | ExtendedSig,
+    ) -> bool:
+        """
+        Vérifie une signature. Avec une empreinte de clé publique, la signature doit être
+        étendue : la clé publique reconstruite doit alors avoir la même empreinte.
+        La clé et la signature doivent utiliser la même fonction de hachage.
+        """
+        if sig.backend is not pk.backend:
+            return False
+        if isinstance(pk, PublicKeyFingerprint):
+            if not isinstance(sig, ExtendedSig):
                 return False
-        return True
+            rebuilt = cls.rebuild_public_key(msg, sig).fingerprint()
+            return secrets.compare_digest(rebuilt.data, pk.data)
+        if isinstance(sig, ExtendedSig):
+            sig = sig.sig()
+
+        return verify_blocks(msg.data, pk._view, sig._view, pk.backend)
+
+    @classmethod
+    def verify_many(
+        cls,
+        items: Iterable[
+            tuple[Message, PublicKey | PublicKeyFingerprint, Sig | ExtendedSig]
+        ],
+        workers: int | None = None,
+        chunk_size: int = 256,
+    ) -> Iterator[bool]:
+        """
+        Vérifie une suite de triplets (message, clé publique, signature) et produit
+        le résultat de chacun, dans l'ordre d'entrée.
+
+        Les triplets sont lus par paquets de `chunk_size`, ce qui permet de passer
+        un itérable en flux (générateur, fichier...) sans le matérialiser. Les paquets
+        sont répartis sur `workers` processus (par défaut, un par cœur) avec au plus
+        deux paquets en attente par processus. Avec un seul processus, ou si tout
+        tient dans un seul paquet, la vérification se fait dans le processus courant.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+
+        chunks = _chunked(items, chunk_size)
+        if workers <= 1:
+            for chunk in chunks:
+                yield from (cls.verify(*item) for item in chunk)
+            return
+
+        first = next(chunks, [])
+        second = next(chunks, None)
+        if second is None:
+            yield from (cls.verify(*item) for item in first)
+            return
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers) as pool:
+            pending: deque[Future[list[bool]]] = deque()
+            for chunk in itertools.chain([first, second], chunks):
+                pending.append(
+                    pool.submit(_verify_chunk, [_to_raw(*item) for item in chunk])
+                )
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+
+
+# Pour chaque valeur d'octet, ses 8 bits, du plus significatif au moins significatif.
+_BYTE_BITS = [tuple(byte >> (7 - k) & 1 for k in range(8)) for byte in range(256)]
+
+
+def bit_layout(data: bytes) -> list[int]:
+    """
+    Retourne, pour chaque position i du message `data`, le décalage dans le tampon d'une
+    clé (ligne 0 puis ligne 1) du bloc choisi par le bit i.
+    """
+    bits = itertools.chain.from_iterable(_BYTE_BITS[byte] for byte in data)
+    return [BLOCK_SIZE * (b * N_BITS + i) for i, b in enumerate(bits)]
+
+
+def select_blocks(data: bytes, key) -> bytes:
+    """
+    Retourne la concaténation des 256 blocs de `key` (le tampon d'une clé de 2 lignes)
+    choisis par les bits du message `data` : pour une clé publique, les hachages attendus
+    d'une signature de `data`.
+    """
+    view = memoryview(key).cast("B")
+    return b"".join([view[offset : offset + BLOCK_SIZE] for offset in bit_layout(data)])
+
+
+def _complement(data: bytes) -> bytes:
+    """
+    Retourne le message dont chaque bit est l'inverse de celui de `data`.
+    """
+    return bytes(byte ^ 0xFF for byte in data)
+
+
+def _select_preimages(data: bytes, sk: SecretKey | SeedSecretKey) -> bytes:
+    """
+    Retourne les 256 pré-images de `sk` choisies par les bits du message `data`.
+    Avec une SeedSecretKey, seules ces pré-images sont dérivées.
+    """
+    if isinstance(sk, SeedSecretKey):
+        return sk.select(data)
+    return select_blocks(data, sk._view)
+
+
+def verify_blocks(data: bytes, pk, sig, backend: HashBackend = SHA256) -> bool:
+    """
+    Vérifie la signature `sig` (le tampon de ses 256 blocs) du message `data` avec le tampon
+    de la clé publique `pk`. Le travail ne dépend pas de la signature : chaque pré-image est
+    hachée exactement une fois, et les 8192 octets obtenus sont comparés en une seule fois
+    aux hachages attendus, en temps constant.
+    """
+    return secrets.compare_digest(hash_blocks(sig, backend), select_blocks(data, pk))
+
+
+def hash_blocks(data, backend: HashBackend = SHA256) -> bytes:
+    """
+    Retourne la concaténation des hachages de chacun des blocs de 32 octets de `data`.
+    Par exemple, hash_blocks(sk.to_bytes()) est la forme binaire de la clé publique de sk.
+    """
+    view = memoryview(data).cast("B")
+    digest = backend.digest
+    return b"".join(
+        [
+            digest(view[offset : offset + BLOCK_SIZE])
+            for offset in range(0, len(view), BLOCK_SIZE)
+        ]
+    )
+
+
+def _generate_batch(
+    count: int, backend: HashBackend = SHA256
+) -> tuple[bytearray, bytearray]:
+    """
+    Génère `count` paires de clés dans deux tampons contigus : les clés secrètes
+    concaténées, tirées en une seule lecture d'aléa, et les clés publiques
+    correspondantes.
+    """
+    sk_buffer = bytearray(secrets.token_bytes(count * SecretKey.SIZE))
+    return sk_buffer, bytearray(hash_blocks(sk_buffer, backend))
+
+
+def _split_batch(
+    sk_buffer: bytearray, pk_buffer: bytearray, backend: HashBackend = SHA256
+) -> Iterator[tuple[SecretKey, PublicKey]]:
+    """
+    Découpe les tampons d'un lot en paires de clés, sans copie.
+    """
+    sk_view = memoryview(sk_buffer)
+    pk_view = memoryview(pk_buffer)
+    for offset in range(0, len(sk_buffer), SecretKey.SIZE):
+        yield (
+            SecretKey.from_buffer(sk_view[offset : offset + SecretKey.SIZE], backend),
+            PublicKey.from_buffer(pk_view[offset : offset + PublicKey.SIZE], backend),
+        )
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """
+    Découpe un itérable en listes d'au plus `size` éléments, au fil de la lecture.
+    """
+    it = iter(iterable)
+    while chunk := list(itertools.islice(it, size)):
+        yield chunk
+
+
+def _to_raw(
+    msg: Message, pk: PublicKey | PublicKeyFingerprint, sig: Sig | ExtendedSig
+) -> tuple[bytes, bytes, bytes, bool, bool]:
+    """
+    Convertit un triplet en octets bruts pour l'envoyer à un autre processus,
+    en notant si la clé est une empreinte et si la signature est étendue.
+    """
+    return (
+        bytes(msg.data),
+        pk.to_bytes(),
+        sig.to_bytes(),
+        isinstance(pk, PublicKeyFingerprint),
+        isinstance(sig, ExtendedSig),
+    )
+
+
+def _from_raw(
+    msg: bytes, pk: bytes, sig: bytes, fingerprint: bool = False, extended: bool = False
+) -> tuple[Message, PublicKey | PublicKeyFingerprint, Sig | ExtendedSig]:
+    """
+    Inverse de _to_raw ; sans les deux indicateurs, une clé publique et une signature
+    ordinaires.
+    """
+    key: PublicKey | PublicKeyFingerprint
+    signature: Sig | ExtendedSig
+    if fingerprint:
+        key = PublicKeyFingerprint.from_bytes(pk)
+    else:
+        key = PublicKey.from_bytes(pk)
+    if extended:
+        signature = ExtendedSig.from_bytes(sig)
+    else:
+        signature = Sig.from_bytes(sig)
+    return Message(msg), key, signature
+
+
+def _verify_chunk(chunk: list[tuple]) -> list[bool]:
+    """
+    Vérifie un paquet de tuples bruts (voir _to_raw) ; exécuté dans un processus de travail.
+    """
+    return [Lamport.verify(*_from_raw(*raw)) for raw in chunk]
 
 
 if __name__ == "__main__":
@@ -0,0 +1,296 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Dans ce module, les clés à usage unique de Lamport sont regroupées dans un arbre de Merkle
+pour obtenir un schéma de signature à usage multiple : 2^h feuilles, chacune étant le hachage
+d'une clé publique de Lamport, et une clé publique de 32 octets qui est la racine de l'arbre.
+
+Une signature contient l'indice de la feuille utilisée, la signature de Lamport étendue (ExtendedSig,
+qui permet au vérificateur de reconstruire la clé publique de la feuille) et le chemin
+d'authentification de la feuille jusqu'à la racine.
+
+Les clés secrètes des feuilles sont dérivées d'une graine, si bien que le signataire n'a jamais
+besoin de conserver les 2^h feuilles. Les chemins d'authentification successifs sont calculés avec
+l'algorithme de parcours de Szydlo ("Merkle Tree Traversal in Log Space and Time", la base de
+l'algorithme BDS) : au plus h calculs de feuille par signature et O(h) nœuds en mémoire.
+"""
+
+from typing import Self
+
+import hashlib
+import math
+import secrets
+
+from tp1.lamport import BLOCK_SIZE, ExtendedSig, Lamport, Message, SeedSecretKey
+
+
+def _hash_nodes(left: bytes, right: bytes) -> bytes:
+    """
+    Retourne le hachage d'un nœud interne à partir de ses deux enfants.
+    """
+    return hashlib.sha256(left + right).digest()
+
+
+def _leaf_secret(seed: bytes, index: int) -> SeedSecretKey:
+    """
+    Dérive la clé secrète de Lamport de la feuille `index` à partir de la graine de l'arbre.
+    """
+    return SeedSecretKey(hashlib.sha256(seed + index.to_bytes(8, "big")).digest())
+
+
+def _leaf(seed: bytes, index: int) -> bytes:
+    """
+    Retourne la valeur de la feuille `index` : le hachage de sa clé publique de Lamport.
+    """
+    return _leaf_secret(seed, index).public_key().fingerprint().data
+
+
+class _TreeHash:
+    """
+    Calcul incrémental d'un nœud de hauteur `height` : chaque appel à update()
+    calcule une feuille de plus et fusionne les nœuds de même hauteur sur la pile.
+    """
+
+    def __init__(self, height: int):
+        self.height = height
+        self.stack: list[tuple[int, bytes]] = []
+        self.next_leaf = 0
+        self.node: bytes | None = None
+        self.active = False
+
+    def initialize(self, start: int) -> None:
+        """
+        Commence le calcul du nœud dont la feuille la plus à gauche est `start`.
+        """
+        self.stack = []
+        self.next_leaf = start
+        self.node = None
+        self.active = True
+
+    def low(self) -> float:
+        """
+        Hauteur du nœud le plus bas sur la pile : h si la pile est vide, l'infini
+        si le calcul est terminé ou n'a pas commencé.
+        """
+        if not self.active:
+            return math.inf
+        if not self.stack:
+            return self.height
+        return min(height for height, _ in self.stack)
+
+    def update(self, seed: bytes) -> None:
+        """
+        Calcule une feuille et fusionne tant que possible.
+        """
+        height, node = 0, _leaf(seed, self.next_leaf)
+        self.next_leaf += 1
+        while self.stack and self.stack[-1][0] == height:
+            _, left = self.stack.pop()
+            height, node = height + 1, _hash_nodes(left, node)
+        if height == self.height:
+            self.node = node
+            self.active = False
+        else:
+            self.stack.append((height, node))
+
+
+class MerklePublicKey:
+    """
+    Une clé publique de Merkle : la racine de l'arbre (32 octets) et sa hauteur.
+    """
+
+    def __init__(self, root: bytes, height: int):
+        self.root = root
+        self.height = height
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
+        """
+        Prend une chaîne de MerklePublicKey.to_hex() et la transforme en un objet MerklePublicKey.
+        """
+        buffer = bytes.fromhex(s)
+        if len(buffer) != 1 + BLOCK_SIZE:
+            raise ValueError(
+                f"Clé publique de longueur {len(buffer)}, au lieu de {1 + BLOCK_SIZE}."
+            )
+        return cls(buffer[1:], buffer[0])
+
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale de la clé publique : la hauteur sur un octet, puis la racine.
+        """
+        return (bytes([self.height]) + self.root).hex()
+
+
+class MerkleSig:
+    """
+    Une signature de Merkle : l'indice de la feuille, la signature de Lamport étendue
+    et le chemin d'authentification.
+    """
+
+    def __init__(self, index: int, ots: ExtendedSig, auth: list[bytes]):
+        self.index = index
+        self.ots = ots
+        self.auth = auth
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Retourne une signature à partir de sa forme binaire (voir to_bytes).
+        """
+        view = memoryview(data)
+        height = view[4]
+        expected_length = 5 + ExtendedSig.SIZE + height * BLOCK_SIZE
+        if len(view) != expected_length:
+            raise ValueError(
+                f"Signature de longueur {len(view)}, au lieu de {expected_length}."
+            )
+        index = int.from_bytes(view[:4], "big")
+        ots = ExtendedSig.from_bytes(view[5 : 5 + ExtendedSig.SIZE])
+        offset = 5 + ExtendedSig.SIZE
+        auth = [
+            bytes(view[offset + BLOCK_SIZE * h : offset + BLOCK_SIZE * (h + 1)])
+            for h in range(height)
+        ]
+        return cls(index, ots, auth)
+
+    def to_bytes(self) -> bytes:
+        """
+        Retourne la forme binaire de la signature : l'indice sur 4 octets, la hauteur sur
+        un octet, la signature de Lamport étendue, puis le chemin.
+        """
+        return b"".join(
+            [
+                self.index.to_bytes(4, "big"),
+                bytes([len(self.auth)]),
+                self.ots.to_bytes(),
+                *self.auth,
+            ]
+        )
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
+        """
+        Prend une chaîne de MerkleSig.to_hex() et la transforme en un objet MerkleSig.
+        """
+        return cls.from_bytes(bytes.fromhex(s))
+
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale d'une signature.
+        """
+        return self.to_bytes().hex()
+
+
+class MerkleSecretKey:
+    """
+    La clé secrète d'un arbre de Merkle : la graine des feuilles et l'état du parcours.
+    Elle change à chaque signature et ne doit jamais être réutilisée dans un état antérieur.
+    """
+
+    def __init__(self, seed: bytes, height: int):
+        self.seed = seed
+        self.height = height
+        self.index = 0
+        self.auth: list[bytes] = [b""] * height
+        self.treehash = [_TreeHash(h) for h in range(height)]
+
+    def remaining(self) -> int:
+        """
+        Retourne le nombre de signatures qui peuvent encore être produites.
+        """
+        return (1 << self.height) - self.index
+
+    def _advance(self) -> None:
+        """
+        Prépare le chemin d'authentification de la feuille suivante (algorithme de Szydlo).
+        """
+        s = self.index
+        self.index += 1
+        if self.index == 1 << self.height:
+            return
+
+        # Mise à jour des nœuds d'authentification dont le sous-arbre change.
+        for h in range(self.height):
+            if (s + 1) % (1 << h) == 0:
+                node = self.treehash[h].node
+                assert node is not None
+                self.auth[h] = node
+                start = (s + 1 + (1 << h)) ^ (1 << h)
+                if start < 1 << self.height:
+                    self.treehash[h].initialize(start)
+                else:
+                    self.treehash[h].active = False
+
+        # Au plus h calculs de feuille, attribués au calcul en cours le plus bas.
+        for _ in range(self.height):
+            focus = min(self.treehash, key=_TreeHash.low)
+            if focus.low() == math.inf:
+                break
+            focus.update(self.seed)
+
+
+class Merkle:
+    @classmethod
+    def generate_keys(
+        cls, height: int, seed: bytes | None = None
+    ) -> tuple[MerkleSecretKey, MerklePublicKey]:
+        """
+        Génère un arbre de 2^height clés de Lamport.
+        Seuls la racine et les deux premiers nœuds de chaque hauteur sont conservés.
+        """
+        if seed is None:
+            seed = secrets.token_bytes(BLOCK_SIZE)
+        sk = MerkleSecretKey(seed, height)
+
+        # Calcul de l'arbre complet avec une seule pile : O(height) nœuds en mémoire.
+        stack: list[tuple[int, bytes]] = []
+        for index in range(1 << height):
+            level, node = 0, _leaf(seed, index)
+            position = index
+            while True:
+                if position == 1 and level < height:
+                    sk.auth[level] = node
+                elif position == 0 and level < height:
+                    # Le nœud de gauche sera le prochain nœud d'authentification de ce niveau.
+                    sk.treehash[level].node = node
+                if not stack or stack[-1][0] != level:
+                    break
+                _, left = stack.pop()
+                level, node = level + 1, _hash_nodes(left, node)
+                position >>= 1
+            stack.append((level, node))
+
+        _, root = stack.pop()
+        return sk, MerklePublicKey(root, height)
+
+    @classmethod
+    def sign(cls, msg: Message, sk: MerkleSecretKey) -> MerkleSig:
+        if sk.remaining() == 0:
+            raise ValueError(
+                "Toutes les clés à usage unique de l'arbre ont été utilisées."
+            )
+
+        ots = Lamport.sign_extended(msg, _leaf_secret(sk.seed, sk.index))
+        sig = MerkleSig(sk.index, ots, list(sk.auth))
+        sk._advance()
+        return sig
+
+    @classmethod
+    def verify(cls, msg: Message, pk: MerklePublicKey, sig: MerkleSig) -> bool:
+        if len(sig.auth) != pk.height or not 0 <= sig.index < 1 << pk.height:
+            return False
+
+        # La feuille est l'empreinte de la clé publique de Lamport reconstruite.
+        node = Lamport.rebuild_public_key(msg, sig.ots).fingerprint().data
+
+        # Remontée du chemin d'authentification jusqu'à la racine.
+        position = sig.index
+        for sibling in sig.auth:
+            if position & 1:
+                node = _hash_nodes(sibling, node)
+            else:
+                node = _hash_nodes(node, sibling)
+            position >>= 1
+
+        return secrets.compare_digest(node, pk.root)
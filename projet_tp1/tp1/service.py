@@ -0,0 +1,398 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Service local de signature et de vérification, basé sur asyncio, pour que plusieurs processus
+clients partagent un seul processus déjà chargé.
+
+Protocole (sur un socket Unix ou TCP local) : chaque trame est une longueur sur 4 octets
+gros-boutistes suivie du corps. Le corps d'une requête est un code d'opération (1 octet),
+un identifiant de requête (4 octets) et les données ; celui d'une réponse est un statut
+(0 = succès, 1 = erreur), l'identifiant de la requête et les données (ou le message d'erreur
+en UTF-8). Les requêtes peuvent être envoyées à la suite sans attendre les réponses, qui
+reviennent dans l'ordre où elles sont prêtes.
+
+    SIGN   (1) : hachage du message (32 octets)
+                 -> clé publique (16384 octets) puis signature (8192 octets),
+                    avec une nouvelle paire de clés à usage unique par requête
+                    (tirée d'une réserve keypool.KeyPool si le service en a une).
+    VERIFY (2) : hachage du message (32) + clé publique (16384) + signature (8192)
+                 -> 1 octet, 1 si la signature est bonne et 0 sinon.
+    STATS  (3) : rien -> les métriques du service, en JSON.
+
+Seules les clés et signatures sha256 sont acceptées, pour que les tailles soient fixes.
+
+Les vérifications qui arrivent dans une fenêtre de `window` secondes sont regroupées en un
+seul lot confié au groupe de processus. Au plus `max_in_flight` requêtes sont traitées à la
+fois ; au-delà, le service cesse de lire les sockets, ce qui ralentit les clients.
+
+Utilisation : python -m tp1.service --unix /tmp/tp1.sock
+          ou  python -m tp1.service --tcp 127.0.0.1:8765
+"""
+
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+import time
+
+from tp1.instrument import OperationStats
+from tp1.keypool import KeyPool
+from tp1.lamport import (
+    BLOCK_SIZE,
+    Lamport,
+    Message,
+    PublicKey,
+    Sig,
+    _verify_chunk,
+)
+
+OP_SIGN = 1
+OP_VERIFY = 2
+OP_STATS = 3
+
+STATUS_OK = 0
+STATUS_ERROR = 1
+
+_LENGTH = struct.Struct(">I")
+_HEADER = struct.Struct(">BI")
+
+# Plus grande trame acceptée : une requête VERIFY.
+MAX_FRAME = _HEADER.size + BLOCK_SIZE + PublicKey.SIZE + Sig.SIZE
+
+
+def _sign_fresh(digest: bytes) -> bytes:
+    """
+    Génère une paire de clés à usage unique et signe le hachage fourni.
+    Retourne la clé publique suivie de la signature.
+    """
+    sk, pk = Lamport.generate_keys()
+    return pk.to_bytes() + Lamport.sign(Message(digest), sk).to_bytes()
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> bytes | None:
+    """
+    Lit une trame complète, ou retourne None si la connexion est fermée.
+    """
+    try:
+        (length,) = _LENGTH.unpack(await reader.readexactly(_LENGTH.size))
+    except asyncio.IncompleteReadError:
+        return None
+    if length > MAX_FRAME:
+        raise ValueError(f"Trame de longueur {length}, au plus {MAX_FRAME}.")
+    return await reader.readexactly(length)
+
+
+def _frame(code: int, request_id: int, payload: bytes) -> bytes:
+    return (
+        _LENGTH.pack(_HEADER.size + len(payload))
+        + _HEADER.pack(code, request_id)
+        + payload
+    )
+
+
+class SignatureService:
+    def __init__(
+        self,
+        window: float = 0.002,
+        max_batch: int = 256,
+        max_in_flight: int = 1024,
+        workers: int | None = None,
+        key_pool: KeyPool | None = None,
+    ):
+        if workers is None:
+            workers = os.cpu_count() or 1
+        self.window = window
+        self.key_pool = key_pool
+        self.max_batch = max_batch
+        self.executor: Executor = (
+            ProcessPoolExecutor(workers) if workers > 1 else ThreadPoolExecutor(1)
+        )
+        self._in_flight = asyncio.Semaphore(max_in_flight)
+        self._batch: list[tuple[tuple[bytes, bytes, bytes], asyncio.Future]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task] = set()
+        self._servers: list[asyncio.Server] = []
+        self._connections: set[asyncio.Task] = set()
+        self.stats = {"sign": OperationStats(), "verify": OperationStats()}
+        self.batch_count = 0
+        self.batched = 0
+        self.largest_batch = 0
+
+    async def start_unix(self, path: str) -> asyncio.Server:
+        server = await asyncio.start_unix_server(self._handle, path)
+        self._servers.append(server)
+        return server
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 0) -> asyncio.Server:
+        server = await asyncio.start_server(self._handle, host, port)
+        self._servers.append(server)
+        return server
+
+    async def close(self) -> None:
+        for server in self._servers:
+            server.close()
+        # Les connexions encore ouvertes sont interrompues avant d'attendre les serveurs.
+        for connection in self._connections:
+            connection.cancel()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        for server in self._servers:
+            await server.wait_closed()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self.executor.shutdown()
+
+    def metrics(self) -> dict:
+        """
+        Retourne les métriques du service : latence de chaque opération (en secondes,
+        avec un histogramme en microsecondes) et taille des lots de vérification.
+        """
+        report = {name: stats.as_dict() for name, stats in self.stats.items()}
+        report["verify_batches"] = {
+            "calls": self.batch_count,
+            "mean_size": self.batched / self.batch_count if self.batch_count else 0.0,
+            "max_size": self.largest_batch,
+        }
+        return report
+
+    async def verify(self, digest: bytes, pk: bytes, sig: bytes) -> bool:
+        """
+        Ajoute une vérification au lot en cours et attend son résultat.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._batch.append(((digest, pk, sig), future))
+        if len(self._batch) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                self.window, self._flush
+            )
+        return await future
+
+    def _flush(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._batch = self._batch, []
+        if batch:
+            self.batch_count += 1
+            self.batched += len(batch)
+            self.largest_batch = max(self.largest_batch, len(batch))
+            self._spawn(self._run_batch(batch))
+
+    async def _run_batch(self, batch) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, _verify_chunk, [item for item, _ in batch]
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    def _spawn(self, coroutine) -> asyncio.Task:
+        task = asyncio.get_running_loop().create_task(coroutine)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def _handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = asyncio.current_task()
+        assert connection is not None
+        self._connections.add(connection)
+        write_lock = asyncio.Lock()
+        pending: set[asyncio.Task] = set()
+        try:
+            while True:
+                try:
+                    body = await _read_frame(reader)
+                except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+                    body = None
+                # Sans en-tête complet, il n'y a pas de numéro de requête à qui répondre :
+                # la connexion est fermée.
+                if body is None or len(body) < _HEADER.size:
+                    break
+                # Contre-pression : pas de nouvelle lecture tant que la limite est atteinte.
+                # Le jeton n'est pris qu'une fois la trame lue : une connexion inactive
+                # n'en retient aucun.
+                await self._in_flight.acquire()
+                task = self._spawn(self._respond(body, writer, write_lock))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+        finally:
+            self._connections.discard(connection)
+            writer.close()
+
+    async def _respond(
+        self, body: bytes, writer: asyncio.StreamWriter, write_lock: asyncio.Lock
+    ) -> None:
+        try:
+            code, request_id = _HEADER.unpack_from(body)
+            payload = body[_HEADER.size :]
+            start = time.perf_counter()
+            try:
+                status, response = STATUS_OK, await self._dispatch(code, payload)
+            except Exception as e:
+                status, response = STATUS_ERROR, str(e).encode()
+            if code == OP_SIGN:
+                self.stats["sign"].add_call(time.perf_counter() - start)
+            elif code == OP_VERIFY:
+                self.stats["verify"].add_call(time.perf_counter() - start)
+            async with write_lock:
+                writer.write(_frame(status, request_id, response))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._in_flight.release()
+
+    async def _dispatch(self, code: int, payload: bytes) -> bytes:
+        if code == OP_SIGN:
+            if len(payload) != BLOCK_SIZE:
+                raise ValueError(f"Hachage de longueur {len(payload)}, au lieu de 32.")
+            loop = asyncio.get_running_loop()
+            if self.key_pool is not None:
+                # La réserve vit dans ce processus : la signature se fait dans un fil.
+                pk, sig = await loop.run_in_executor(
+                    None, self.key_pool.sign, Message(payload)
+                )
+                return pk.to_bytes() + sig.to_bytes()
+            return await loop.run_in_executor(self.executor, _sign_fresh, payload)
+        if code == OP_VERIFY:
+            expected_length = BLOCK_SIZE + PublicKey.SIZE + Sig.SIZE
+            if len(payload) != expected_length:
+                raise ValueError(
+                    f"Requête de longueur {len(payload)}, au lieu de {expected_length}."
+                )
+            digest = payload[:BLOCK_SIZE]
+            pk_bytes = payload[BLOCK_SIZE : BLOCK_SIZE + PublicKey.SIZE]
+            sig_bytes = payload[BLOCK_SIZE + PublicKey.SIZE :]
+            return bytes([await self.verify(digest, pk_bytes, sig_bytes)])
+        if code == OP_STATS:
+            return json.dumps(self.metrics()).encode()
+        raise ValueError(f"Opération {code} inconnue.")
+
+
+class ServiceClient:
+    """
+    Client asynchrone du service. Plusieurs requêtes peuvent être en cours à la fois.
+    """
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self._next_id = 0
+        self._waiting: dict[int, asyncio.Future] = {}
+        self._receiver = asyncio.get_running_loop().create_task(self._receive())
+
+    @classmethod
+    async def connect_unix(cls, path: str) -> "ServiceClient":
+        return cls(*await asyncio.open_unix_connection(path))
+
+    @classmethod
+    async def connect_tcp(cls, host: str, port: int) -> "ServiceClient":
+        return cls(*await asyncio.open_connection(host, port))
+
+    async def close(self) -> None:
+        self._writer.close()
+        await self._writer.wait_closed()
+        self._receiver.cancel()
+
+    async def _receive(self) -> None:
+        try:
+            while (body := await _read_frame(self._reader)) is not None:
+                status, request_id = _HEADER.unpack_from(body)
+                future = self._waiting.pop(request_id)
+                payload = body[_HEADER.size :]
+                if status == STATUS_OK:
+                    future.set_result(payload)
+                else:
+                    future.set_exception(ValueError(payload.decode()))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            # Connexion fermée ou coupée : aucune requête en cours n'aura de réponse.
+            waiting, self._waiting = self._waiting, {}
+            for future in waiting.values():
+                if not future.done():
+                    future.set_exception(
+                        ConnectionError("Connexion fermée par le service.")
+                    )
+
+    async def _request(self, code: int, payload: bytes = b"") -> bytes:
+        if self._receiver.done():
+            raise ConnectionError("Connexion fermée par le service.")
+        request_id = self._next_id
+        self._next_id = (self._next_id + 1) % (1 << 32)
+        future = asyncio.get_running_loop().create_future()
+        self._waiting[request_id] = future
+        self._writer.write(_frame(code, request_id, payload))
+        await self._writer.drain()
+        return await future
+
+    async def sign(self, msg: Message) -> tuple[PublicKey, Sig]:
+        """
+        Fait signer le message avec une nouvelle clé à usage unique.
+        """
+        response = await self._request(OP_SIGN, bytes(msg.data))
+        return (
+            PublicKey.from_bytes(response[: PublicKey.SIZE]),
+            Sig.from_bytes(response[PublicKey.SIZE :]),
+        )
+
+    async def verify(self, msg: Message, pk: PublicKey, sig: Sig) -> bool:
+        response = await self._request(
+            OP_VERIFY, bytes(msg.data) + pk.to_bytes() + sig.to_bytes()
+        )
+        return response == b"\x01"
+
+    async def stats(self) -> dict:
+        return json.loads(await self._request(OP_STATS))
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    key_pool = KeyPool(args.key_pool) if args.key_pool else None
+    service = SignatureService(
+        window=args.window,
+        max_in_flight=args.max_in_flight,
+        workers=args.workers,
+        key_pool=key_pool,
+    )
+    if args.unix:
+        server = await service.start_unix(args.unix)
+    else:
+        host, _, port = args.tcp.rpartition(":")
+        server = await service.start_tcp(host or "127.0.0.1", int(port))
+    print(f"Service à l'écoute sur {server.sockets[0].getsockname()}")
+    try:
+        await server.serve_forever()
+    finally:
+        await service.close()
+        if key_pool is not None:
+            key_pool.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m tp1.service")
+    address = parser.add_mutually_exclusive_group(required=True)
+    address.add_argument("--unix", help="chemin du socket Unix")
+    address.add_argument("--tcp", help="adresse hôte:port")
+    parser.add_argument("--window", type=float, default=0.002)
+    parser.add_argument("--max-in-flight", type=int, default=1024)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--key-pool", help="répertoire d'une réserve de clés")
+    try:
+        asyncio.run(_serve(parser.parse_args()))
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,368 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Journal binaire de signatures, en ajout seul, avec un index pour l'accès direct.
+
+Le journal `chemin` commence par un en-tête de 16 octets (SIGLOG_MAGIC, puis l'identifiant d'un
+octet de la fonction de hachage de toutes ses clés et signatures, puis 7 octets nuls) et contient
+ensuite des enregistrements de taille fixe RECORD_SIZE :
+    hachage du message (32) | empreinte de la clé publique (32) | signature (8192)
+L'enregistrement n se trouve donc à un décalage connu : l'accès par numéro est direct.
+
+L'index `chemin.idx` permet de retrouver les enregistrements d'un hachage de message sans
+parcourir le journal. C'est une table de hachage à adressage ouvert : un en-tête de 24 octets
+(INDEX_MAGIC, la capacité et le nombre d'enregistrements indexés, sur 8 octets chacun) suivi de
+`capacité` cases de 16 octets : les 8 premiers octets du hachage du message, puis 0 (case vide)
+ou 1 + le numéro de l'enregistrement. La case de départ d'un hachage est donnée par ses 8 premiers
+octets ; les cases suivantes sont parcourues jusqu'à une case vide. La table est au plus à moitié
+pleine, et son agrandissement n'a pas besoin de relire le journal.
+
+L'index est reconstruit à partir du journal s'il est absent ou s'il n'indexe pas exactement tous
+les enregistrements (par exemple après une panne), si bien que seul le journal fait foi. Une
+dernière écriture incomplète dans le journal est retirée à la réouverture en écriture.
+
+Utilisation :
+    with SignatureLogWriter("signatures.log") as log:
+        log.append(msg, pk, sig)
+    with SignatureLog("signatures.log") as log:
+        for record in log:               # vues sans copie sur le fichier projeté en mémoire
+            ...
+        records = log.find(msg.data)
+"""
+
+from typing import Iterable, Iterator, NamedTuple
+
+import mmap
+import os
+import struct
+
+from tp1.hashes import SHA256, HashBackend, from_ident
+from tp1.lamport import (
+    BLOCK_SIZE,
+    ExtendedSig,
+    Message,
+    PublicKey,
+    PublicKeyFingerprint,
+    Sig,
+)
+
+SIGLOG_MAGIC = b"TP1SLOG\x01"
+INDEX_MAGIC = b"TP1SIDX\x01"
+
+HEADER_SIZE = 16
+RECORD_SIZE = 2 * BLOCK_SIZE + Sig.SIZE
+
+_INDEX_HEADER = struct.Struct(">8sQQ")
+_SLOT = struct.Struct(">QQ")
+
+# Capacité initiale de l'index, en cases.
+MIN_CAPACITY = 1024
+
+
+class LogRecord(NamedTuple):
+    """
+    Un enregistrement du journal. Les champs sont des vues sur le fichier, sans copie.
+    """
+
+    digest: memoryview
+    fingerprint: memoryview
+    sig: Sig
+
+    def message(self) -> Message:
+        return Message(bytes(self.digest))
+
+
+def _header(backend: HashBackend) -> bytes:
+    return SIGLOG_MAGIC + bytes([backend.ident]) + bytes(HEADER_SIZE - 9)
+
+
+def _read_header(data) -> HashBackend:
+    if len(data) < HEADER_SIZE or bytes(data[:8]) != SIGLOG_MAGIC:
+        raise ValueError("Ce fichier n'est pas un journal de signatures.")
+    return from_ident(data[8])
+
+
+class _HashIndex:
+    """
+    La table de l'index, dans un tampon (bytearray ou fichier projeté en mémoire).
+    """
+
+    def __init__(self, buffer):
+        magic, self.capacity, self.count = _INDEX_HEADER.unpack_from(buffer)
+        if magic != INDEX_MAGIC:
+            raise ValueError("Ce fichier n'est pas un index de journal de signatures.")
+        self.buffer = buffer
+
+    @classmethod
+    def empty(cls, capacity: int) -> "_HashIndex":
+        buffer = bytearray(_INDEX_HEADER.size + capacity * _SLOT.size)
+        _INDEX_HEADER.pack_into(buffer, 0, INDEX_MAGIC, capacity, 0)
+        return cls(buffer)
+
+    def _slots(self, prefix: int) -> Iterator[int]:
+        """
+        Produit les cases à examiner pour un préfixe, dans l'ordre du sondage linéaire.
+        """
+        mask = self.capacity - 1
+        slot = prefix & mask
+        while True:
+            yield slot
+            slot = (slot + 1) & mask
+
+    def _get(self, slot: int) -> tuple[int, int]:
+        return _SLOT.unpack_from(self.buffer, _INDEX_HEADER.size + slot * _SLOT.size)
+
+    def entries(self) -> Iterator[tuple[int, int]]:
+        """
+        Produit les paires (préfixe, numéro d'enregistrement) de la table.
+        """
+        for slot in range(self.capacity):
+            prefix, value = self._get(slot)
+            if value:
+                yield prefix, value - 1
+
+    def insert(self, prefix: int, n: int) -> None:
+        for slot in self._slots(prefix):
+            if self._get(slot)[1] == 0:
+                offset = _INDEX_HEADER.size + slot * _SLOT.size
+                _SLOT.pack_into(self.buffer, offset, prefix, n + 1)
+                self.count += 1
+                _INDEX_HEADER.pack_into(
+                    self.buffer, 0, INDEX_MAGIC, self.capacity, self.count
+                )
+                return
+
+    def lookup(self, digest: bytes, digest_of) -> Iterator[int]:
+        """
+        Produit les numéros des enregistrements dont le hachage est `digest`.
+        `digest_of(n)` retourne le hachage de l'enregistrement n ; il n'est appelé
+        que pour les enregistrements dont le préfixe correspond.
+        """
+        prefix = _prefix(digest)
+        for slot in self._slots(prefix):
+            slot_prefix, value = self._get(slot)
+            if value == 0:
+                return
+            if slot_prefix == prefix and digest_of(value - 1) == digest:
+                yield value - 1
+
+
+def _prefix(digest) -> int:
+    return int.from_bytes(digest[:8], "big")
+
+
+def _build_index(digests: Iterable, count: int) -> _HashIndex:
+    """
+    Construit un index pour `count` enregistrements, à partir de leurs hachages dans l'ordre.
+    """
+    capacity = MIN_CAPACITY
+    while capacity < 2 * count:
+        capacity *= 2
+    index = _HashIndex.empty(capacity)
+    for n, digest in enumerate(digests):
+        index.insert(_prefix(digest), n)
+    return index
+
+
+class SignatureLog:
+    """
+    Lecteur d'un journal : le fichier est projeté en mémoire et les enregistrements
+    sont des vues sur cette projection.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+        self.backend = _read_header(self._view)
+        self._count = (len(self._view) - HEADER_SIZE) // RECORD_SIZE
+        self._index: _HashIndex | None = None
+        self._index_mmap: mmap.mmap | None = None
+
+    def __enter__(self) -> "SignatureLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        # Des enregistrements encore utilisés gardent la projection ouverte
+        # jusqu'à ce qu'ils soient libérés.
+        if self._index_mmap is not None:
+            self._index_mmap.close()
+        try:
+            self._view.release()
+            self._mmap.close()
+        except BufferError:
+            pass
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _record_view(self, n: int) -> memoryview:
+        if not 0 <= n < self._count:
+            raise IndexError(f"Enregistrement {n} hors du journal ({self._count}).")
+        start = HEADER_SIZE + n * RECORD_SIZE
+        return self._view[start : start + RECORD_SIZE]
+
+    def digest(self, n: int) -> memoryview:
+        """
+        Retourne le hachage du message de l'enregistrement n.
+        """
+        return self._record_view(n)[:BLOCK_SIZE]
+
+    def __getitem__(self, n: int) -> LogRecord:
+        view = self._record_view(n)
+        return LogRecord(
+            view[:BLOCK_SIZE],
+            view[BLOCK_SIZE : 2 * BLOCK_SIZE],
+            Sig.from_buffer(view[2 * BLOCK_SIZE :], self.backend),
+        )
+
+    def __iter__(self) -> Iterator[LogRecord]:
+        for n in range(self._count):
+            yield self[n]
+
+    def _load_index(self) -> _HashIndex:
+        if self._index is None:
+            try:
+                with open(f"{self.path}.idx", "rb") as f:
+                    self._index_mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                index = _HashIndex(self._index_mmap)
+            except (FileNotFoundError, ValueError, struct.error):
+                index = None
+            if index is None or index.count != self._count:
+                index = _build_index(
+                    (self.digest(n) for n in range(self._count)), self._count
+                )
+            self._index = index
+        return self._index
+
+    def lookup(self, digest) -> list[int]:
+        """
+        Retourne les numéros des enregistrements du hachage de message `digest`.
+        """
+        return list(self._load_index().lookup(bytes(digest), self.digest))
+
+    def find(self, digest) -> list[LogRecord]:
+        """
+        Retourne les enregistrements du hachage de message `digest`.
+        """
+        return [self[n] for n in self.lookup(digest)]
+
+
+class SignatureLogWriter:
+    """
+    Écrivain d'un journal, en ajout seul. Les enregistrements passent par un tampon de
+    `buffer_size` octets ; flush() les écrit, puis réécrit l'index.
+    """
+
+    def __init__(
+        self, path: str, backend: HashBackend = SHA256, buffer_size: int = 1 << 20
+    ):
+        self.path = path
+        if not os.path.exists(path) or os.path.getsize(path) == 0:
+            with open(path, "wb") as f:
+                f.write(_header(backend))
+            self.backend = backend
+            self._count = 0
+        else:
+            with open(path, "rb") as f:
+                self.backend = _read_header(f.read(HEADER_SIZE))
+            if self.backend is not backend:
+                raise ValueError(
+                    f"Le journal utilise {self.backend.name}, et non {backend.name}."
+                )
+            size = os.path.getsize(path)
+            self._count = (size - HEADER_SIZE) // RECORD_SIZE
+            # Une dernière écriture incomplète est retirée.
+            if (size - HEADER_SIZE) % RECORD_SIZE:
+                os.truncate(path, HEADER_SIZE + self._count * RECORD_SIZE)
+
+        with SignatureLog(path) as reader:
+            # Copie modifiable de l'index existant (ou reconstruit).
+            self._index = _HashIndex(bytearray(reader._load_index().buffer))
+        self._file = open(path, "ab", buffering=buffer_size)
+
+    def __enter__(self) -> "SignatureLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(
+        self,
+        msg: Message | bytes,
+        pk: PublicKey | PublicKeyFingerprint | bytes,
+        sig: Sig | ExtendedSig,
+    ) -> int:
+        """
+        Ajoute un enregistrement et retourne son numéro. `msg` est un message ou son hachage,
+        `pk` une clé publique, son empreinte ou les 32 octets de l'empreinte.
+        Seule la signature ordinaire d'une signature étendue est conservée.
+        """
+        digest = bytes(msg.data if isinstance(msg, Message) else msg)
+        if isinstance(pk, PublicKey):
+            pk = pk.fingerprint()
+        fingerprint = pk.data if isinstance(pk, PublicKeyFingerprint) else bytes(pk)
+        if len(digest) != BLOCK_SIZE or len(fingerprint) != BLOCK_SIZE:
+            raise ValueError("Hachage et empreinte doivent faire 32 octets.")
+        if sig.backend is not self.backend:
+            raise ValueError(
+                f"Signature {sig.backend.name} dans un journal {self.backend.name}."
+            )
+        if isinstance(sig, ExtendedSig):
+            sig = sig.sig()
+        if not isinstance(sig, Sig) or len(sig._view) != Sig.SIZE:
+            raise ValueError(
+                f"Signature de {len(sig._view)} octets, au lieu de {Sig.SIZE}."
+            )
+
+        self._file.write(digest)
+        self._file.write(fingerprint)
+        self._file.write(sig._view)
+        if 2 * (self._index.count + 1) > self._index.capacity:
+            self._grow()
+        self._index.insert(_prefix(digest), self._count)
+        self._count += 1
+        return self._count - 1
+
+    def extend(self, records: Iterable[tuple]) -> int:
+        """
+        Ajoute une suite de triplets (message, clé publique, signature).
+        Retourne le nombre d'enregistrements ajoutés.
+        """
+        count = 0
+        for msg, pk, sig in records:
+            self.append(msg, pk, sig)
+            count += 1
+        return count
+
+    def _grow(self) -> None:
+        """
+        Double la capacité de l'index en y réinsérant tous les enregistrements.
+        """
+        new = _HashIndex.empty(self._index.capacity * 2)
+        for prefix, n in self._index.entries():
+            new.insert(prefix, n)
+        self._index = new
+
+    def flush(self) -> None:
+        """
+        Écrit les enregistrements en attente, puis l'index (de façon atomique).
+        """
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        tmp = f"{self.path}.idx.tmp"
+        with open(tmp, "wb") as f:
+            f.write(self._index.buffer)
+        os.replace(tmp, f"{self.path}.idx")
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
@@ -8,16 +8,75 @@ seulement un petit sous-ensemble de messages. C'est à vous de rechercher un mes
 et de produire une signature falsifiée. Le message doit inclure votre adresse e-mail U-LAVAL et le mot "contrefait".
 
 Si vous souhaitez vérifier ces messages, les messages signés étaient "1", "2", "3", "4" et "5" respectivement.
+
+Les données sont stockées en binaire dans `signatures.bin` : la clé publique (16384 octets) suivie
+des 5 signatures (8192 octets chacune), dans l'ordre décrit dans forge.py. Le fichier n'est projeté
+en mémoire (mmap) qu'au premier accès, et chaque attribut n'est calculé qu'une fois :
+    hex_pub_key, hex_sig_1, ..., hex_sig_5 : les chaînes hexadécimales d'origine ;
+    pub_key, sig_1, ..., sig_5 : les PublicKey et Sig décodées, en lecture seule, qui partagent
+    la projection du fichier au lieu de la copier.
 """
 
-hex_pub_key = "ffe2d3d376be06715b9ae661d905ec921ee04c042fa11692f1a2f8e8ae4d4f0079572c565d305025a3aba7175a46228f8d2416d24eb242fb94c2bf6e92f526141c3a0d5b2799ba57a8de01704e543e3a206b53a0248b64310da21bd8f91b31e4492643c8f74ac9bb5af9395a9c7979586a2e694d0a54586c40b0526f9efc7e1f279c071017b61b6d027ec1a518aeb3a9388d21a7f5d1b0efbf5bb6a0c30db29a91c1f8c6407399ef2408491b6a355bf7fec8faa40766e0bf2d956770ad467d6de4a4909161e43e83561827dc0901c937e228ce3ee8bab5af58966e3c490bfceb02ce3d7cc4b3c1529566d9f7961307a4e019381a0b266aa6c2cd95fbc36917e1045663ed23a2b932c9159b7a08a8afb0a9a0e107c9806466220db55ef14fe43c925e354f9500864ed3b461623a8487ff595681890b97e32f6e5f4379a9ca4a3b84469cf9487aac85500f42353adbe6a0277828ead9602a6453c533eb7eabf2d5c8f66bff46849661f142eef6c12a21f4b27cb134c4c8c4aea1a98a393178ff220b498fb49369bb980f7b1879c81d92501b4fb7be77acc3abe2ec442931853634f72e762854db7bf696a478d9a379a8793cb1499a957f309eaa816fb79ceff0beb2ee5e23cf34f981178c6853347d556572d7af0a98bcac7738e7c8bdccd99367e859d2ac29610373fa344b0e7cd33d225b43dfe39d52e23ccd00e476d4346f67a2f0ad33482c96e2587647c757c277a7b570fc8ddb001ea3388210555d79a0e8e8b9fe3155616c82e946c60288de8e4252f596a749efd1e1e0c8f39b4350961f591b7d14e13cabb8cb3a04f49050b4fd444b675dc321d9c3df08e472a8b5997b9eb33583116c668f0533cab9c6d5e8089044f69963150f477a0562bea91a0d24c860798e0a28b078e75e470836c2504516abd7a51badca76862ab7851212fa3375a75d3e825d1a952b6d9825f41758be1772fdd8cb0ad3d28e76b407735def15384da5a7d444538ace37ef69306e8dfc2a07f7ef5d4706dc8b5d27dc3623c9f2205279b14212a91b918a989325ef3dcfb675953b90edd4899726310c5c112ef1d32bb4060e048399b400f72128e3c354f61270e22d4c9705f9ac9dbfc776eb941b023bc87a5793fc82f3d50def65dbc82932bca454530f75e95ec0ca681582908dd0e37c5beae16757d83c0b1f393707b7cf9d08bf0cbf45a1a87bf59a93939f46b8006a119f8d824188f689563c1f8f6c22f2a41763dc86fafd4264f8b6ab4f97bedf9a321d28a588c649d3108051602718fad326f729b4f95e84142f1f07f2fd73ab3e9d9252dc97b96f0aca423992ba3b903b7e1b1c67010a43ce472b47f1b2001be97ef7d2dec7712dcc23a92cbc1fd2d236cc8a92d92e8927034214fe0fb59463eb5728f326f85e93754c29886589a04224382afeb9e8fcdd1e3b38ac701fc2267c749a24e553b722fb4e7435e8932700876a0e83445fa272355ec3b9dba3b6cb10f47a877baf85f38c4af0706a0f92888132380a765d9f2104487d7da58c04f8d35239103d7ac53baf17ff19b43f4c91702e29d309f36c72959e492384dc3e56f7b895d7cd7a9eb56c83f99a20221177ef24e60f59a0e50d8f197dc86fc06125e981145abdd419da9b937074ac4039f9f13a39f2792badcac7af237afc16651d594b29c2431e7678ba3f7f083d1c70b333525037de255029e23f4622c6e11abb39e6f7cbb1d81f1dc6f5b848ddc21165870c8cc588878df2c804ae2fc3bd86451b18260f0adde31d685f7de407867d898fa9faabfb49564f15071bfd1bd63bcce158a3e92b2cf4d46f6623458f1f14594e626f4a362f91c3aab88c70679ce640138eb88324fd112a1c9361937e61da5050d26cf659e461ac779f830e63d201d50d6dea81a250c70100bbd2a4ccc46fa1dee1eb1d31f770c0779ebb486333c4703913a5125ddcdbb2ec9140a3ef401c12226b15cc705347fec73a3a7b93209c2d53f9c195d008c6b36cb544af27054b6248d533454efe865e733f6724d0dcf82eb2e8f1854d8023da1d4766f11815e313201f0cf7f18024e860146d2ba4af089b6f1241d1e9608cf7cc085d0cc5dc798328219587b051e47ac166f6f8d5441f0194c178113fb226de66dddbe440b39ba4de88d3021f1d67ddc72f7ffc01149c63ad1e90825763883e6e4c6a7acda27f423f3149279987ab712b82f3336146ad38bedf94ea7c9012b9a471a9f98c10ba7001c309090d632da1645cd577dc991b14ec1a1fc99f940f4ccce33b17970575c688486b36874cafdc3a0662a210eea1185218eecf8b2c635e4947160673c90c694db275be4d81923a485984d14bbb9de93a75c9c9bc9ae512890e1cd1a8f65c8a8eac91bd53594d9d39ec54878ba7d596398accbed6732ea7a16cb4d7f6c22251be3bdafb84f90d3a1b4dbb00d3b9c4e64e55811cb00c9a46f5ac48791d84551be476a91e38a403ea3f47fb5ad0bb289d87518653d138cc37a0ad6837eff74545395d9444bd231d94460fe4034135ecf83ac29a21e919c7389d8ba68c4c065762da10e17cec08dd539145e9801daafa22cf47768c0dd99febddcefbf69f5e9d1bdb5d8a6bd421681a850310ff5022170fcbbadac901d3217cba934e1d12535c2c0ca6432cd0f30cdb91689714ed16e099598bb8b0d2d9969936fbf1454de901b78b216db2c87218d9177f098d0929b1f246263da9de6e4fd360d786e9287793bde74bfcd6ede28a66a5e2a07e7699b427147cb128bc5f5ab1e259cd72035f17da069952ee11f5e57eb812f7a676e92b948637bd680ff9e4be744699b929e985e7fbd4c99be0450c2d265d034e38b9a77b1306641ab347d5db525c132a9cedd9a47d9351927cd8acd0d3844c691e349d5f3c0176f904bb24624669692588bdb60f1ef460e9b78dbd8084a7712206263f80c6fab042dfec59d0c1a4b8419d1725c02f48141d628d734870ccc5473ed430d8a6f484688bb239c0e7acb630af52a7f41af6a0fbae2691e6810fefee37c140a710d19804df92e01649644ef5b1687fa50afdd75eea3692d878c24923904e91572e4c7ed6cef64e3884107c9dd1d4b6698484061cd74886ecf76394c5b8612950f495a9e02b1e23d7177668270223cb502931ccb4c461c5664a438c07f16837041ff7a7d23c7814673c3e41d9d44a0e54a2303dce8a118cd7a2ad1d91bc3bef4c9b937f8bb8331ae6e0d009077e4eac09cfad4eec84008df63fc1f40419b5943148dfa0ca61fe80614af05f4f42d59b432d0adee3e609c8a6be61f58476ad0ecbe359e5e7d4d42f2d896ca6e56e5b057dafe577f26d9110c8366d46e81aa000c217c45d0622e7c06ac2074f31d63618906ab64e1ae516dd5f97412c4dba2600fbbad7e93a7ea0df6b42da640d578f834dcaeed8a8f0543b19f5cc89ef14bb9945eff585c3dd2e33f4dec787647e44df56d555278dde5f4499dc73f3b8216f77f153c018254e2ec1bffa0788fb461800e57769b63905fe2590b5037f82923412b9626a98482b52c233e5619f8be4b797b79a80872e6eb61fd453a96352b8b5ba566a6cfd82a8ae665d8f65960769282530071fccb8f6c70599325e0e36729a54feeda89f86e4432c1c7c2624da1137c8ef7df8e29583b3da6b7e5c6d440147c79143a6b3754a26a501a30c55b346b326e09f5683f38526bd1c6a9fedc18130deb56b0df6caabc7283fa261caea3c18ed869851653c4e8fef6d3066373b2075f522fda6dd5da301cbcb18e6bb8d48bee4ab74965a17edb7775587d496465e9f908c6997ed22ddc790bfe69b82f16de62a719ddf8209b5229902341f8d01f07d06c63df27ff97d83c4214028343d1faf0077573c01abadf8102a642cec0bc61f24eb9edcd2e42bf4aafda520939fb5b4471b08b06fcc1c0c45429a580903fa577d09a8381513d9c275729d3bfa6b9d7341a013f9c32cc6407185af670854e0149142b0279deca86ece21ff2161c4202b54b892f57c3df02bbe2a22e07cb787af24057341a853e8d7bbf9163bc35cc58c49c6787a012c2241f601f766f87cefebc16e555bf2a3337d2e0983eb5dd04abbdc318ec0276e94e1962d2c5a1cc69e0fdf9d1902cdf41c3863899e25893412d34485f3a349b9bf776efbaa373a401e44ab23b1ee94a671080a6272cebadce47ecf1f071dd65d45af1c330532df93e6f2b56dc5b407c8e8adf4872bb6d108c68d35aea7fec4314cbdb9b0a166279535e87c0c932f339d2b736ce298369570e802b32d9ab0cb04a3accdce56f5186fea0c2e1f6669f078b527d6ee38cde8c373593400b8897239e228bf33bf4b5ac55f13306c799cf82b8c1be2734a039713cbd967b6a5944db8e85e950054934bfd09bc6c7d641dc80e74f61f118398c6882e666b3d1671e72c0353a90f40778c3892458283426a7d36c6a7f5873c1f8f80084af269ebd488700d03f06c7974d49daac47a01b81373854d9582b247d1a3d931106a471954733e00e13e10966db8f3378dba0fea605c4ebcb730f219499afe76874f8583bea074b16bb0d0dff47d5e049f7548a54321676f4addb314e2fdac019d552a04dd4f2a640f460ae6b746eade53618e6fee17db0f241ce30991e19958716b6d85201ce19433ee6c33d0f0ba742a10bc1b29dfdb2a0e002017345145db11462779ffb6577ff70d06fa65a827ae1ca3015e9765b810fe0932072d144dda426b64f6ad683cbcc2a606b4073fd150c00455964e6642836d8c3aa2eced45cf83503ed15a130c375b30296c8bdbdea137e0e26fc3aeb7bdd60913ea2323abbb4b777b33733dc2c720327718344def5b34435f09acf54c621b74add2b7615bb5a340c76fec1eff59fee9d38b626f04b5c0143be50eaedab681d129b786d9abae07d16ffc6241c34d386a34637a864e21967f65b509a6114856a110aee76c740397d1db1020a06cfdfc55708d3d7a986888040e75309c5b801fe7276d6c567395da96f0664ece00888f62e6257096664a54b609db34287fa87f1d9e52da37c8166ca015e70ea560d071e417c18e43440475cfb80962377a43b7028659fafd64d7893de822647781be09f67f761bfd193c0683d304c0958e0800a9d60a4bf40454bd3e1d7dc2808c0f24b827d3162370a3e176c1ec27f2bb8c343eb9d17f35efd92d8d3daca20ceece967b145c335fc24337a011dc04be5b2a5b5a344d3c892baae3cd208684ad9607d197aa80d8cafb8623cba358bcea83afffe06ef36756f56b45f9a697b6e5253ca99f8f2092774961271fe49cb3db82ca548388c7df792bd95c03b0a6b54e9b49c40828fd051134cf4faaebd9c67b309e3182537a52f4039585fdccca92d9e76eeec55cfa588fad2edbbb9238c4e6ed10c9cb11a6697719735ae4454e2fa337688a6b16be2968ee8a09d748e5db2aaa53a6beb3d058090c902239047935ccdfb0eb8f974843a93d13762d12cf5409d3cf36e0edd1892fdddfe1da8be5d769f094c10a98a06f90140c8118176bd19288cd9631265b342c4d04d1ed88b6d230f9c3df1f134f7be07f6aa5aec6246f181781ebf5bcd5b9afb5121429338ae8163ec86b81850f13396cf5edc33e4e37d4e910980840f0cd3e0653cc1cca4afb056e6adb8cafcf0d873eedb8fb5bdad5eb7f399c2e22a0621622466dbbfe9527508edc71ac4dd4a058378d8272b2477394b0284bb1d88587054f37a3032b1d9b8bc123ff2723b00965fd0c4eed6cb09f5c8ab0fb3b1d46d48a4e79d6c55a79ddab27dc6d1b37c40886d4d3a3baab139212f679a8fd749c587d11a8ba6df8aea9c41364db3ab4fee50e84a58d27ac21b5fd50e0f4e4ac3755ac86fddeb1ba79a5d69baa91b8f13bf627ac36428bc55a0710d488ab259bee08828b38bddbc4acbb4884c920a3606ccf094cfdd388785ed75837992a31effc26d346d7c071be0986ab7f1bcd1a15ed0a302cc4d8d3ded59b1a79c3a97b7b8523d997c52f88a5ddba0f8607e2f45f0f28f23e9d5c271199297566d407e93bc7b9a2fef7c17fe74ab6e4bc78e398f473f8935e82dcf1af5de300a9536f48b332af63e999f8b763d52e70192646b0dab1e892b58bdf286158f7952d62381bef350ae75b2cbd4d574d710eb289572f0b86d659fa77003bc9cf0d358615cdee799af061cede40d525dba849beeeed35b3005c77ea67474b97095a02befd53baa7495ad3626e2571c6d0aafda18739a84ed358d46a262664ba8ff6d65353a559472538c7311b6a6c04a89168d1d64b5a28ecf8809e97b7dbfee545249e435358492d925b044cc4e3a05c8c0cad910496000147f59a937abbaf69622ab22081951031d20208ff29008988528241c6f5a5e9833bf98b3f30e77fa2271f45e2f277f0d9989bc546ae8e60358ba34b1824de774c57da2f5f2e24c549ec8c5707edb0bf97ec7fc6fe6e03323decd5bd5eef390baa44909a897f3833d6bf8add0c17075f34940ae692a692e2d30be7958eec725a176ec12f4af0a2fff140f34794439884810fa2b101b66965914d737e791f3778cb89f0c090eba9c713cfa94e85cf96703380eaea9f031b416d9c145844246f03c72be8608365d6c38e692efaff71c73873fa78d978466615a87f53371bc32d3afcf3ceff116bb77932d2921066e10e2cff0da294506c2472922964a2da7aa5a2d7279f5de12851c3d59452a410c60225ab08ec4c86fc2b3903c63d6d804651db452c409b9c3dd607ad27d425afbef7bd58e0420137b72e5b2ab8f13afc051197789b0913f25e3868683b7d61fd5f73f9c10356dcddeaf9de957f21eb1f2cf2ae3592808a7b0862c1d1db321138e60ab773971771fa76430e33bbfeefffa701a34875c74b08ef1ac26365827a4a0f11fd66ad6d0a92c59b5803be2759b64d786e6d9698a0a6f43e03cef2532657899a7c32c4e7aa55dbe70fe7b0a78025957b5779c82ef72747cff593b54885562a3ba991557a60e0b838987a78a2065d22e03d4b20e55180a64f571737d8e86647398859a095826fb7016ace6f0a07f7aad9dca216c52f2adc6aa92caccabca11fb4a79851366826075310814976d2bc4e47f35eaa1414b3eac583b217ef7428280f5fc1353473099ed55045aac8306b4d3ecba6a61f30112563b7f5c712771db751fe7969573cf56889e2ad1ce93cc292889fb6209aaf1578ff7a52e981359a0a4b0d094d8922e51bbe3a3c019f3aeaca1d58d20236f805372466ffa1973cbfd269520bedde5c7fb8f2f9e11097b6cb0830235f5de65843b215510b705eaabe8c9084d6a0dd4d18d69d41500573d4d6ea48c242e57b1ac4d68b57eb196c4be00a179677bd0242f539fe6bb0aded6693949d6b8f7ebe67e2e5765b3f2b22f237920ffcb8c46b44f0886d4561186f5933438d45900ffbdb6e8995b48ad1187013671de094682685aa39e80c38f88546a150363853c415b043b3b9fcb8b5299fa4ecf57a8d238b4b75f28f7944b8d3bdd0447880c2f7fa8a73c599f39ea506c95c8c66665731abb0401ba541c97cd5a5e04f4241bbaa67e2d6be98727ffe06c1169323edec87dffdb077a524a95f1a8356f46484235696d2d4862513b850d5e22b24ed7960d47ae52c5f783f807650cac934736db2fa3c9c9f3d2e5051c4137f144c841b0f0dc0aaeb8d65741cf6bd3b1fc109168d711c0c3704a899dea2fe24dabf79bf67073fc6492762b9b74d967be6aa31c641aa7a78c9bc28c2b6e839aa534e808753b4d31bb598b6e52aca8e01feb1e12ab11d715e0c3bcecaa070e451b54fc710980ad05d6cb69e54d8e034ff2919d339d7f6247da8b2bb7e26a8de75f813d13cba8a1616372417f9ca18276b5c1815f11e032f62fa335cf027e3ae2dc8585be9f070d5b755a87ebc4e107f17ba2c0ff013e3206a4e76162b6212a986facbd23223f7c253ed6dcba51ecbdb6245b61304a853ad8299e44261a68c876a57466b7307a86d4eb06a2e472b9e93ec50934183239e615e7ecb4e19c61f909ec5ed1d4595644d6a77f08f0e7accdc5cd156bc0b2572f72a0f52076409e4b973a639ea2ab9716430ecd35ba53ef37ed4842f95e5a10e6d54323d4e025151a632ac21de7a402cf7f0503d6bb4e39f0339659268fcb2f6c1098bd759790a43b982d69fd9e85edea957502db751665d9a1b2499d63e1e7666006b15506c6b03d80782578e49e498c6d108b9e43f8fbe0e6f208697b240935730bef45871c81cece5d126c178d8ff5583eabeca5b8aae299b3ad637bc1b7c24091f578db620b436c22bd3fe44bbb8ae7cc8103a6114294428296074fd9e017439f92f7d93bb90d3c3f5bad20a2376cc6e506072604057ed12c0f48aa1a5dc9db70e91695b23c5b495cc4749875edc671903e1d6d118124b0c4d2ad880b9a45cc2e7f2115539023ccc80a29c3d49ee25f3946004e0db453b31e442a2f207fd1583c98f2bb4cd91f8ea7b6cd3cf546235da25070f4f2423057ce96a9d887c5356403df69464307b52b34b37296415bd4e3663a2005aa4badb965b6fb28513a4af571c493a1288a6607d42a58deac86c5e2c3f9984d67c55839433fc3451e8682032742271bd463205db54dd2af516fc927a5a57f33d9299636afea1ec723ca9b0de900748df60928644423a9472021832fddbc61cc878a500e55a1ad68aa36793a1b3a99be9b77dc967bf388f494b79d547f2322750e53e632bd90693ab23effd10480b037e047c5df7da0ad8702d8a3be75ec2fbb42dcab80cb9842f56953e457c7063ef2bf9caa11b162403bff06d68e796de57f3f6a92cab0cb5bc9a3ce9b121fc96a164c2b5351fcdb996f8fd79001ddb46b1231e86937c6923c6c0fd54fb11f69498ac6e1d82b9f670b1f7281321981e4d412756c5b184f9a2ce7b5d2862451406e436647786d8e65a96357c15d27b782a866b2b98be805adc3a547694892b543e02e13fdc874e563c10b2b9fdeaafe31c1a98eb7a467ded068db62c47c97b15572f6613329aabc311dc1f791bc7ca4a1f6626c21d87f63b0095b30406bb1fbd0cbafae968af739df33713f9e782321a7aef65b179e36dbc524ef5646d5d68e3277829bbeac331f89033a0602e126ab0ca90e54b602c706abae1f00a03db8058e30c3890d872f07e12a5aa509f7928f8c131f7eb7411731966502ea69467fb93d94b023789ddf358f15801f85fa70dacba4d04fdf9aaed2b883374210fb2b0bcb987152b4071f1e136907ac62a785044bdc013a5da57d856e4f56a5ac37aa80637cf19b0bb2e35efe8f7df9ed02ea81501fe260690add1e23ebca5f926a6b492c1dcf8339add5006a487b59a6b7687e260c4a0b68b75b3b839b03e0a2c5406f280edd9ffdc1332babe3b785e4766f5f687ab503be7865f5112fe8a86451b724caf0efe5c23b85c6cc9771e9416feddb9ae36893c6bd437d1de4fbbc09448c9ba5def996169bb00daf7fb6c9cf81468d1225bc704c0ecd4961884dd7fc741c51b440f0dfe0207cd712730a11ac47df8400560aec590a6860b31dd900dde9df38c02d3de3e3f7ce4fa015b4ed5b0039df7915803ad47a7ddd34f2a5da12f93cc073834f5cf5057cc49c8cf17a5a92f761bcc58fbdef6cc7b1bed3a57b0d82e410b9eb7d02c089ae63d2ebe8956e1904abb8c5518a44aef139412fefe34211ff07cb319de8764f761d857525f91e99b8fc11e573ac2f4b5e7a972d35c10075a600a0c6e6baeefab76474b9e5ecfb717ea8894fb84a650adf30141be284f3af2fd47b8ed89bbbcef8992f5bdfcb44a69b868d2a6f0d8b0613d7688fec70e5bec50393cf815eaa905baa8a5060f3607b81c12540f06670c427eeb174330435d0f97b40df71ebe8997a1b792186b3bf4bcbacf366949e44661e23848b258ed88914feaf19d6b0a0a7befdf1a63dabcf134461cc47874cf028dfae27c1baab3daa56c62aa14c94f1c34415c40ab70bcd257bb71451f950354b4afdab1fae4b16b02027e8fa53f365636543cd47b2401aff95587df1d984db44c9297223fb76c86ec1908b6b9046d494e6ab694aee5695600ef69c4d2d57b58135157d2959ab3f0d1c9234bd08d4e704ad8bc9979fc4f9e22f4f07865e9b5fc7f601c47c6bee1925c905e0935af985032b9fda797acbb07980756ee772ffae81dbb78f8671f998ec98415fdf445c3e1ab0ce3fc06f19800e5460ee74b3be1bee7176f7d5c454531db59783cf7bc4e3a4d7a030465b256d51d236360e1f46842b6a539aeebfa4bc8a4fb89e6bcc55948ba6bd176d23ccb01885a7a758228f7ab95c6256b84d7c2b20f1362eea5574f0c83de3851f05ecbac11c31b542fbb9ca13b51ddd512107f2e36901103464c72455af1235980724ab2141a20abf8f692ef214cad896c09920b5b7269116f1765bec901de2441c7d6b80ed3e205a283e63a5ab7a03e65700552b3e46240fda8de341ef3e2eda0bcd7231d32e9a2ab01179ad0c7f53e681502f285689bcea46438ba8321b11824f70ef972c4b881219dbe13608564c078ad3933c2b25af8ca1a42509aa1125766d83f2f7dd8bd077439ea5ee2b1fd3db0bb7ef9f9fa77b03772afa51be5a96544e7ea5e44fedbe3ddd1a66e930c2e01ac0a53f6d28915da1e545f03d35c239ea3ef95b29e8198a8553843559b9548d658b0ddac298cb0b37d7c84985649ab847e598af881e30c6587e1f2ccb80d018c270ba87f688f7e2c95fa1e25cb58244afbea198bb9186a88a4c4a67e2fed05fbdc845f8bb1382f8011096ce6b062a21e4e8920e51eee80473d1961309bc0d9bba0ea7ae5d10722fb09853f167807b5cfc2d4e645cf9601f56f03a888228231bf71c10c57854626722143b427016612ad5b630b2c6bccdb36130ca11d7c94f4fff732980ae5d51cbae9d6b487481a6347722c5a0d643c002d7f8b67645c76cc63021d7b573364daa2c8c94c72d8c009a9ce262377154d375eddc8eb5ef97d42c7e5450de370748ce51c8b731b376258d314e238e9983e4ea0fc31e20f5fd2d09565368335535f89dcbd30ebd3a0bc0a40bdcfc989b3aea368ab2781b264636f60d721b58818375f4084a77e30962b7337e03a62f494faf5cf02ace412595028730e207d044bc025df2178999f5afa5a8df53b4d57dfab8f36b7504e4a34c6aa2c03e88696ff02061741f3cb34692d126c20c615d2daaba53bbe2124a5924a070bf3accbe624a6dd75f952d4505fc3c8ae86701e5f84541d012a47196cffc2568d04009d0b7a7aaf3672f5fbe678466a2a4aa4e8ee42bf6c7dc9e11b9222a834c643e76578313e3a94e3718ecc992c456664015b42a105a34b597c1fef9173a2cbfa96dab19a5c8096c89f330a1421aefeb8e09b8d232827e14e5948483f8e3a8fa7473343cf3e4d4972c49197af25c6796a9d04cde683beb0de17f65a39c2b184942f611c135b7b05884e47487b0cd0c18dd97e14c1ada8e4abf686e92599fd28b7867e144a15282366d1173f9c541cabb6dc454a248f71fd89f3489920e5ebfe555a08160a99f2235bf252bc21089487a6d9580a7565ce28fa5343f154797836b7c3a241ed22cc804f9d21aa577a68e5cbfbc1a725e376e5c7ff7976e3e73d9a214a2ae77417c7d5e5a81ab54dbd33c0b2e65a158c416b7cfc89ef69315103f4a336cd366e1554bb5bb0e2405aa8aba0b986d9a59a28c2076a1b68703c5c14894e9758d727a3ee28422aba78c4bb57c4814021d444423fa9a6ddb5a07ec2f52236c0ba2db1e18cfaee8a72ff2c90e5cb78b28268407777a68333ed3afde2b0d07b182e513b20a49d27a9a7393552c6840b5113dfc3c65e1c77d30bb79105c6b8907df8ef35c9dabee9f1fea78e128f2a7b4042496f84a71e471773ea319733258cf1429565f328a3c5abd49d79c9c4e72c52e67e6475311d40b63138648ae92aeb76c37ad0f951a2a4ef6376a4aa3c354a6131100030c0b7d059b9230623920ab7951d98fb16e7cc941a5c805ded1ef3ab04f125980278950e7a3f87b2df9d57330cb5096895c05a7981d8730aed30898a3d56bdf1bb4917185adc6944663777ea9cfcc4be4c5fb982b9a9c96ad9881b951c51dd8b64c39aed83954bfad81ca88b61c041a4f63aa7de5b0b29c513fc126dd0900153fa2dd243128a3f9600c89489a9ab972d0d832fbaacd81d27682ca568a1979304845d0eda22fe47e62d8e9979f16c613dcfac4585a143e13b2cee34f7c041c862dd9ff6fdf4c0168d190e486e8d0d5a460a21643dbe7d881dd2fcdc238dac1c0272d840f5a8fd9b3e40e98b3631a1b9a5d01a467ae450b51e1036da4359e08e060117b1d7935e0574d3d5b4475e89c740e6ff4e9cfef2cd2210217bd9a56ec9c056abd7f59d3c03bde78e2a02b1ed88391905a4acd48828e341ddc72bffb7415e4f4ed2f784819174d22123e99af176aed0087c28f44d4caeba4c68b5f9c312ba4ede1a6880d130d69effe646a0ed3a2008d0a9fb485e3ed58ab93e8abc1e4730eeb56fd77bc871e24a0d7419a23ff3f40a008c2ad527eba03f07d5749153290f7a049ec9fbdcce6c1eeb830f04b45b12cca5e5e08113831a55011d3b61c064b218f7bf6652d4b39e17ca2478130ba4c9f0183384bc01da734d9fe16e8054a18921532d5dadc5f4b9815e45b7b82475a3ef4dd788d36b737c33d51f3c77dcd8ca4b66558f10af82741ebadd85de85723dd1d9b3d9d09e43f9694b15f11e7b5a7ed863c2e54e46fac689207938181aeb4cb955ef1ccf7125a1fa4f45d6f46aa4d1f6921d91ae02cea1659c988ad72bbb9d93e2f3fbc4a762f0817bdd44febc02f34207d986f795a8d8191079ca3db6475e089857434edca2275c849f4d3ef96f77abcf965b9c00418ff674a28aa48e2a5ba045f05567bcb17ca3be6097fc978fae66fc598636def2128c56b03ce13a9713fc7876c56289a7a457bb8a7ddc56dbad514d63e0ae547bc31de764408fe82b247bea46aba9a82cf3142819935fe818eb64dd297525cfab10527e0697b71fc020f4944a20f05f06b62f6e9696df72e74d42124627a6b84c1756d074d1fca6376bac272711ae61b62d8586d70a87f82db707e732be41d27c7e9e53c10e99b067499d33e7a7bcb4dd2cbf2b8806bbea73897dde99bbfcddb3d718c102dd01eb30d75b7f313eda6c9ad8eaa8ee51cf8b8dd4cfe8059014d507e94de1e28fe1372f172cb062bd7214215c706b26dab5476bd4def0bce4199f3757e74dd8ed9f2e324caf42766c844c5c17b0fe9572d294a6e6609788d09e4d6adbbc246250694b4060936369b911b6a8c717b37a0274ccfcedd718a5e253dee4afd0c8c28c7cdb5b1202fd16dbecdbdd1f58295aa1fa6bc14bf81642b5d9252a39668f67284608ffeb1f89e4fbd878fb617146920b7e2c724b15cac5ab0a62640480e10c25d690ee1ad6988bd3ff23a8c95ad649ef319f1758af5b24838e696030a23cad1e228784679390516e7066a03479c6d0614c21550ad6aee88ee8fa175068c81cba54d8031cf50e2970932de1ede445ef5a2c927dc51567cb67ae298c37eb87d32ae07f43423ec1118f75654adde191d29b3e2f96a66be82ce903e6b4f531b1d882b2d0d2ccaccd409eab0cc205d5b4958fa5ca6605562dd0e20902d1edf5f6b7498df65887598e6aebd2d7e08c6406a8dff73249c38999ce9f3599cb0410fd699a82109e0e63297535154a9f326d8af55b7570fe106505cf9352e8d76e73a8fdd4f91251c4e958d765c8cf789b3f5f5c9c94c51df50110099981ede7b7ac6cc08e16f961947724f4c1b4faca20a1f188c5af353b534463808b22a0fdc4d058291fd291f24da92d674a4dd562bd38076d264b2572fa0bce5a48a4d5f6308c0acf9da6b2c74be888168fa16561989e100ef5d12690d4c59417d71f780495073128a04eb2d480223c6a3c1ffded23ac37d22c45ae9cd8865cc931fa2edaf76fab5d4cb352f4ce31426b65e4c3957008db40ce1145b01d99c099ba89376d73603ac0b07327c53e8d5520a086c3f786da1210b4bb7a99c780e6a7af3d2a4d29a9b95803628b9831208de542e2a1f88454db76c3896c1bf6cc276a4ad7f90b6a6afc830f4adad1e349a7accc312395a7663e644430a6f41052389126f5f780e3ee6bbb12775e0115905ffe2ab065d148259f9f307c1d8d6594a7b5ef45ad4e8394a61390f12b814ba6e227ca8634dac0e8d9406eca3dc6ce42019fbd089be6ad98552b15296034ca62d332eb1278c2092ff517626c09266e1a923a9d951031b8c4dcb60e515782681d627a154ea794874a6281efb694e9f350e3e5bde08b200f235d8bfc5747a9a57d7c4dcfb35a79ea141a131e172e311af68f6f34422383d1391d4fff2a393216aa5bd8c3ffd8bc2525198cd8dc6291455b17bf70bb2e607aecc5bb1ac1afc86e0c3e39c7c660a1b96a2dd615b5b4b4bdcb045aeb573dc6630d121492371dac9b1196583d68231e02f561a540f2b7bb1e90c5de5ddefa8b0e9b562ef124e3d1efd4527b4ec3d325a381c3efd10ece04850382d337afb924071bb34753c41aeb439a1513c742e9176711f0a30eb0cf5bbf5c233867f01717ac0ba8c1bca3ee990ef11a298ea8c3b1b81f0e32c24b983f6be1a6d273618162951e99d7752404bf5cddd83fb1c747577eccc687d40fb3dbfe9abd4a3326c11cc93adf567fcd24ed0c97d4bbc8d6349f12252aaa5b64386a463dc7a6e0924f5d87c991f7bb4bc08bce2693235c58ceefbd75c56c900f3137e835e8af67d4ef556f8162be10a479871298b6803553f95de1698a2a520a149a56da8dd5f017b177b79fe003b2ca9cd741aaa48067238374fb4a2d9b688930d70a06979458f283f6a0689311e6c1cfefa52f590329f9f409c4eebfb0263b72b56c79b283e811b14bb72e715b8b675cff0d39d3c4f71ddcd981be42cd00c1c8dfb62c231d2b0b6214e0ff71a7abddf608f0ca31caece5e2e431b6167766fed161fd841b2c3904c537062ef7d4ce1a8f5fcdc784f8ec369825dfdf516cda26336408d8be31759df86d80a40ac0191a3b749c2b4b5ebf8180a63c6b39f9f5a9c0f2ebf5678467946a80b1109c2a54bf2c547fd3a8915c6a03ec13c107ca7268e4eb3c920843388dad21cb02f8de69cfe70f14fdfd8637aa11588b5b83527fe775e3644f4be7fc5595115ed14ef5f9291ffaa4130ac8f7ba883c652a7a08dfaf5277e28a71bc5fa33b2dd05dcac0eb4d58fdf302d7243fe082eeffc7e06ae1598e5e360761dda323ab5420773688bc50eca86baacb76496763cf04cf68be2df8eadc8381fbbc638fdd4beded3a2f3d1a764a489834c82ad910960eb24ff417d2c317748aec8d1e23104fb322b65eb60a92bb3140e9e6443a6a5182f8362d5e23de96858fafa527dc903233782eb9500a0ee355cc19ed33b4fcdec5e518dabe78f3d08664bc4223bcdd7e7959e4c1df6340e9e92dcbc9b4e5fcbe827042613a9f9c03783e2adcaf4d091ad67fabfabfb29739d48eb89df1056e3027fdf03ec3e263b03eff99e542666296895b543224d808687c8db6878d95af0a90b168630130370b148feb4cc0961df4f2862419b65baf5ce266368b609498aa03831de5304db6d6c56bda03b9c8ee2d001e22b2e0e7eeef3983a7c5ae5dd6fe89f1c410e51e9dca039e9dc4eb0ee8a7778bcd277f1b06532a2c5264253d6dcbe8e13ce1a6cbb0e61a5aceb3b317223b00e142c4d63316b942c20da1a854e6d6a4369695c0d19e65a603518126a0e3998443dee4b43e1f75dcf20b5f3fc74b75ebc4eee1881c32e29b2e68e0399fc0862c31b0298a415e4c2e171e33c10063858b21647688b0ed909e5b7e965ffe947dd75fd7f5b7c0efb14a2491c4f80f6d884f093f94c11fd8e6e64d4096a68e097fbed7d4a4ff3983c336a96b29ac6fd9b9736319372148ab87a5b9fa7dbc6e92eb9a0fc9cf2e77d6a26af911494546bc29fcf4dbbc513d8006f42b0421c8710bf119a3c37ffc01c037ae93ba622d0cb28fca4ad5785e4c90c88c299c1040b13d7b5b86ba02f46b215aedee2c4df949f61e517a4ff98b85e7dacf56c665ca65a2fee09c484bb79869fff9e9a4b19dc9ed6cbd7d384ea636cab209d6ef07d98086a535de8b22898d91ca541cad1602d82b951c10f4567a541ef011f3e94a55a032032a27ea03ca66b57be89e0cad85306b323d7bf7bd09c87d7fd02447a5ff13a79be10921764e5d5e463a0537ab550d62f778cafc8b1eb256f31ad5ec21c965d3f4523388a9555429cb2a2cba248777b4dd4e3b43736be21a09a1bd2ac984d7d66d83f42e67975bd2d8a00e91296dbfaf104ec1bccbc832bb3d64406c7c151966ff7b9a402d4eaa217b9cd356179b624a5d4c969a4cf8491e0901e1dcb6b446be5373273507e7b7fc4e55322db141e257cd6a264e575fd9c9b6801897fae13c37ea4ea1b88480f572e1df2bf7d63fc455828982e49c7e4cc1d2fecf6403c2ebfd18a91b38c227486963d754f8a18c61b6e2ec7c9b931dcf93baade1030b75d99d3435fec3751a564de65312b817c0ec6cc28f60098e0ca67cf9578243d0887a0e6ae6f8f6fb3ed84b501554c7e623575277587a65b0acfb49eb967d4fd3a8f8c2c1a6328e06d72982b2808b14f6f3f606768478c2212a1cab5173322d7464f553f2c54546987fdb6d03a8e230bba7ce8d2fb10dcc96aa1fe9041436284a426c070bd011b30baa08f6221d38223504e0501b6ca04bc367b415d12dab65a102d620bc309a973b43a4a17f85ffd9579c4319c6650cd9a187e8fffd02532d961d41a04ffc23f23c941d9411724d7815ddf43430434fb9dc24766f0d65a907e5fd8ad0715720feb7affcdeb1b83c24842d1546dc747c8f426157e0d1233d67680aa4d5845b58336e31b9493815cdb70462e537f1ac94cb4966ac4d62006b32def6e92cef4624eaaccc0bc9667401db605dae122a9e1480daa53361729438d6c602c02a7bc019311dfdd930ca2494eb9ca39d09595749a41da7e8082c801d301603b307943fcbca29f8867a5fbdbdb9a85bed372b2d6b236d9d82d23008b79c51ad34ed628b80e944673a55a7db339aed30852a6ebab71d38343e42f2b29c41fbcdf7b65e1a77d4295d32ecab781a50b0a60b91173fda25584723cc65b2072cc3e7ecaea794448d50f18e86a0ec324a9d5e5301f6fa1883b2a7c96b1da2d15214edccce398d020b0f60d7fcbf1aaaa461efbcdb79443e109db0c11f28a12804dff86fd8620356fa6d812b4e1e2f241cbd4da1e052dcd1331495cb99b75b14309a5eb2611e8a022731f4645ad4fad73c8fdf1a59a6047df373fa0cc5864fc8aed34479c6da4112dd2c9540f2114340071f518b2911bb36b661fedb7147270d27e9b41ef34c0a924dee3012ffdbf659467993c473fc6d91ab98785e856a4bd9d8847abd8b6c50c73fcce88ba75094f53dc148c669c1e98b77b3a73bc2262cdbc63c19072df6d2898741693671d428a0cebf2c7fdc4977d9378e6bc49cf19dfcbd760ec0fefc42c5da6879f06124f17cb1ff9236011f12918bc23615392814428e5bba6ed9b57485ab2630c60d6813aee3eb0d325a080060b95ffb80ad44fe00003528b87cb6aa1f96195fe617caddf5529cb03f35c9c6d5fe06ba242e64905989a979807fc33754434c30ef3383e3bf70417031726124c7290fc251c5c6e120e5fb7e99a83237f41cfcc7d35e3b160d64b402fb84e05c560a60dd1eda8d80eb458f68f0d279bbc4304613a45430bbe7aac310a2d5002dd97e30904bade2d5ec77342113630213b3523c8af15ad36a00ef1c1227e7aebb6a238f3249cb2d4d245150a390fc5a19e5c440e79a385358f3e95ee717a3e0ea9467100f9062d7017f32ae6e64807b9486eebcc4463004e4cc8ab5dab19736c399615d679b4dd4cd5b877ceb1577e31b34df724b453a8ecbfb129e5ce846caab08887fd25cc8b74883363ca26f7c3b6329371b75541be8b00262b4fb9824c2f3b30913f3b198f830f02c2c3b093a1f12c1afc0f3b3faf73ce82919305d4f1dd5e7109321b0a200b0322908ebe255498cfa348a124f7e9831f22bdb8b714c0284ed063ad82e7ac3322118e1e56f171175a1ed363c9d5d91557e6f0ef047cf9285c6a2c3a64453a6c79b6da85dcea8f01b6a7941cbbd823f9797b3fbdb4decc27881cdf63cf55ae1a58091f3b5224c5a54fd65f87880113951a8aa24c2b71993fb6e8906cde9ee382db49a2dde9c3267b43779696a088df1227db4e3cd1b90cc9fcf8b641c418dbd7fb12b17ae5f470198e12abd0f4d481f995055214b49ec2d37f066aeaee631043c649f621aeea2a0f04941fce3fbe5100949ab6fa5596e16b0a6bfde9257f883665f999d605ff6910af1364e18a2f3e662819d0eae983d82a6dd653978d27e9409aad41789ece85d04d436e95f2abc8c15493896ed8a88292bdc8d4a8935a2adedf9687d90acb1d12edec55e80140f50c5a23fce9b8c7e2530fd744485219750bb2d493c8774843435a550975bdfda18049e9cce556f4437bde34d1fa7c702390e3e0d3a4b4185187b9f13918826815e3041ef06ce979c95a81afab3ec6d0b93ebb925e0cb36c25df4ab2196789f9812fd869f2cfd0b7e0cae00e417492ebedf7f3c329726308a9f81b225c166068ec85a8bdf44e3aa06669297e56045b6c4603fa5bfdd127d9c8afe21f6d6452f072add0c21e77acc954008eb07506b204b4ccdc931ae0c4378397738d1c57daeafd89ae2bb885c9959456453210a26da3673478d9be7a2ecf36cb7ca42bb205d435b3d48de1d2116a1ecdab611f831182722791a767ba8a5b511db4d88a6977d34b8a7551f5dac26c1a5ed5bd8b7d942d1188fd20256b6ae6ac562977c956460190f5cdad1508da95a4cd8c3b1783c068ff2ae8bd1ec16025f5dd2e8b2a84c4541fd62a63be0ae55a52bc5a5ff4e536d5518948cf6e86a7c9fd3da1f1c04ea59a2fbe701b147c9e6cc63f8e28d446b94bc7f264c5c7b47370558f761b49c10e31613220f44673b96b69c1fe40472b97e412e8e8c775166c9506f0916f5aa655fef8343375eaa9808100ba4f3a9a1588e0010e788fee654a2e0f4762de62f626c001362c88bd75df24d247cac3428027cad503b7b2d575f717fcc11a8c6cd349abd05643ce700c1b52ae3fa134edf0fa3c44d2a36518fdeb85031a4dbf290c3a6626a179580a74d02cc0e68786c4be77d0ebe9e0f6c2f3e7a5fd178f75d4b00da67987b9601aab44e0ea63b5ec920a0970771e8c6d00fce723701e5e001b6b377539b2412fcc459d300efcff7dd66fcb2044a321b3632dc7f976af777a23f90fa9f2c131b48bc402c8dee6e528d9892f8f1f33ce40055b38502d5414ea7e38ffca23c562f712d3840b68d051846ef6e015c2c119bea8ecf008dd62356d9c7e5a6e1c9005bddb62c8d38446c0fa9d793b6573028ba0fc4d80c04e3f26fd9e8cacea9df2cde6ea7cab1a6ef454932dc31df538542145597cd838dbb26215930bd3be504356a0d10184b9c1dd7c33b1ddaa24d2472dc65b82f0ca64d0bc5d0bc7903824d8a378750f8188d18fac4abd54cd34c0bfed8b31dbf1e5783b371f0b320f8fa109d903b195856fd0a13c58aa053768f09c0cbd9b67891a67c50d3ebd71568492ffaeda3110274ff55c5c11682f3996cd1b9c97056843dbd4212ca98c86bc6abe1eebb04ada5b34a991becfd0b2c33c89476f7ad0087f31d11650b74bbf06093943362007942195ddb068472d7e4e525d01314e9d82243c7ab28c34ab0af292bf9aa93452f372b4c8d033d1b627052eacfb99d980eff3ef897668df51346dc63a973998c8a72da0ba7eaed10835770ed2f8a9610cba4470a395f97bc051c5d1fd4e0dd908c6b51cd800f51beaf338bd4ea185c1c2eeff22569e1b309474e13a754001fb5af603e55325a30d42318f4ad1563ed3a18d4c4a4dea55400403d6a7e6184f218087549819470a8b386ad1a605c260d5a48ca7b96955e76f1f8b223e9c58b6a4ed35d08fa24f4efe1cdc5f209f06d28d78af75fe36dad3ce198e6dd01886484c14e15289bc5fcdb8e0da6367e9a16fa9a9b3cc325a1f6e75671d466f37ad0ca004d2552e19bea9868d9c30b02dddca5a2f4fbd4e02fa178dd682640c5c75f6af7a1e349df04b2f232db988b916e902b1e85595786236e718682acd55f2a83d16b2e3a1002c3994f44988571b78e44538f9e040cc77cb299ff1057018034e977890aa4963ce48cc2a0d0d8601c6c8324914166fed70e54c59234b9fe092a725b53963017c9c634a48db9656400efc4d1ebfb51dc3b4564046577d77d281a5699cdda601bb7450a4240516c9bf33452746199ad5123c4364d0f67fa75d144b56110e9ecd9d3edd7a15e20e65b0ad62116a914a9d1c9808adde9b5d48fa2e3ecbb9b73cf8cdbe2c94f5ddb45d4fdf26113b138de2aa3a6fcc1d694c0668dfebe44a6b3a637207923875246587306959b3fbded4f3f7ab20415e15ff32d07d8127fa88366e09f54aaf6fe8d77818d865756212e2021aea066b9771465af02a31e814da75070518997dd557d44059a6c53b8e80ac94977f60ea4162eac0ff1bc0cf00e990c7303b27f5991dba50149b47b3646ed9c02e7daf4dcb713331f937ba150ac0f01704dcf6592ec8ae2a02d764d6d1e35d4a3e6bf3c47631273e2718c960b3452a931d0e988736d7e1266dd6df0617a2916d42072a17bead3a4b83cbf4d3ebec6749b44049b8db0f85ee15b90e8e4af339d7d808d42468d08e3f938787a673c00dff3b17928e2ef85cdd5dc8bce057ed7edb30cac9eef3f1dc8f5154dc3162313be9a6d7e860d0f2025d0f0a9e4d3447df489d4087a30b068e6aa6731331d85d4bec2f26bc7c14ca7a809263715a52bc59c99d0ffaa6bf500344c6b4ad6a9606ee6c5d5b1ddf0262ecf41e42031d5e652f779c27b8a6cad697662d87f32713abf62cdee078e85a57820cb57d44623f99f2adf918b9c76e42cc655fcb184a768efb2f5afa0e2187035812b22d0450c61c5986d8e290e19dd7760bb9b9739e4e3c7826eb888ed1b79fa0278136051683d6c4984d50d5590981ccae5c323969d3f6e57cb9653eb5d888a4302e4488f41fd480f09c943f8148b70ba077a7e983226aafe2532daeb368dd5154adeb7c340ff21ba9c2dffd4a4b8d12c96e97e266c32cd3cc527c6f085561ac6b2958650993b5653aac19ae8501382fc8a6e75260ed2fb3634533181d2a9cb7da484c9a711209c6976301474a27c08d6ab59bf44f6cba9fdaac6b3308a2638f5269780f03814b4865467c7abacac3ce35ed19b73dd999a2014455b5f7457b395c69cbe80f0359c7eb6da40ddbdaf93f64268a83e0a3235988a41203d6fbed6596c3764b1b7f4f5b8492810492990a9b99c42e9a4aa2a5f25eacf74aedad019dd5f302ddd832113160f5eb9aaa2c7a933c100f6c6efb0fffed8707f1d6a8797eee1dbaca5ee132e517e1af87db5ff2fdcf56dc617c18273fdb0589ed8eb65e508f515cf467b467d08140a5fc207ba8d833266dfcabc6b0467c2d69a63bf9ca754c9deb489e5fbe0bbf159a562cb1e91f38cd5becb2c937b71cdf7aedf41b4c14ee7b6d42870d80c71dda4fcf07735d8feedbf05ba050c62687bb5b4ad8b35796bd6ad4e14fabdf823b35f6d96ef8cc2dab4cdbf18279dd5f9a4f36b77538fad8037f9e6a1883de77df1bede6d14530a78552209b57e2a2d56aa07e42cbd1dda687ddd5599c55b0603e0a48a373eac8bed1563ecbf39b0fc41cc85c757d71bdca44009f5bdaefcf3fca73fe1f3b807ee43a3239737d5866d5c9a11fa0a7ba2ed4747fc30ede4756a1b4349d3a5cf4eece7708557204dc1b75a967ef8edbacf809200d084c200a5b72a838c5a0f9d757eb989c60dc30a1424c466a79c868ee69a8d35d197bbcfbca7a933fe0d2e0408afe902e9c0cd57a13ee891577d35e34c7288f02183a18ce8b2d04178dd5c93b37046eb5466ec0b8a4e89b507eebcf30573181afa70cbb2ad66a96df5bc65da2c2f9bdae19b4007495d5a17da6560ea4987fa70de5e45853d2cfc800970f7af1fc04eafea154fbc38a36ac9890ea3ee94a7760ba1b50a25b3553902c3f8f93527e339bc1756fa7e5db45678eebf72e2964afe3fac22ea68a988761f023903728374d68af2c9b227b34836cfba65255b95a24ea375f292ffdf40384eecf0fb376497c0634cb05d7b03293156128cb643a217c4364522f90b9aedc035c8437964077a83f3f8611b38b35b5fceeb277ee9a38ef9661955ebd0f8abc092285dffd92fa7cd15523286198af2cac626fa58ab1c7e8ad6002082596868db7a08e41610bdf03ae0f5077204c94d7b2ebb8bfae895dc4928cc8f9d8d0af883aed951df5c163f71f0ceb8be417f1fd4718234c14843537833b2065ebc8a046af96850a2e78df41fa7047a9cb5635ab21e75928968d2833c6f937bd30b1f66d02501e19ae17609a55c0cf581d22f924a7e6150d8e04a2c52e71bd1f256b0e218a3d1dd4f06b0b3406d97fa0408abfc3aab59e24a77dc79d3d611a64c69aed80a1e02ff18e3fe1260ad2b6da949378655441624b27ebc7c8d5968934550327520718052d429fec79aa7a2e3b74936fe585d9471a43fe4ccef841b6a1e50984a52101bc4163403f0d66c0540db3ed0d4abe70e33bbf7676aa40559bb52b3f150ae5f4904001b342215a5462d3a6dba6c1fdc1efcf1eb964b1e43455ac9d7fbd5d711205801fd863165f27fa96fcff154767d9b68038570c7278b3833780887a5594139ae4c88401ddc8b5676a171bf2b226b2de835033ea7709a8319391d37cba15db138150af01fd8896295ff4db1e4782e6c8cb88307cc6396cceb437659e96bed20db8868058676ccb6b88ae5d7a9da2b9fa72a320a4a4efdf48351bc1a406c78529c70086a6d898a2eb1fb697a0bf45b48bfc3be69e0d4174f8cc799d10bb8e6a7587f686080e954401548363fb139bdfbc9d5c008bdd4e62ad71c70b521d90625345354c64f44a0d0b9a4bc8a6615a2c8bb61d8df15205f5ecdc764098b0c569c2f24253447b6b9d77d2caae72530f16b84234b458c3be87d7a066c9d25e8eb5386c9158d3f19e75bdc1b13e2"
+import mmap
+import os
+
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "signatures.bin")
+
+PUB_KEY_SIZE = 2 * 256 * 32
+SIG_SIZE = 256 * 32
+SIG_COUNT = 5
+
+_NAMES = ["hex_pub_key", "pub_key"] + [
+    f"{prefix}sig_{k}" for k in range(1, SIG_COUNT + 1) for prefix in ("hex_", "")
+]
+
+_view: memoryview | None = None
+
+
+def _data() -> memoryview:
+    """
+    Retourne une vue sur le fichier de données, projeté en mémoire au premier appel.
+    """
+    global _view
+    if _view is None:
+        with open(FIXTURE_PATH, "rb") as f:
+            _view = memoryview(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        expected = PUB_KEY_SIZE + SIG_COUNT * SIG_SIZE
+        if len(_view) != expected:
+            raise ValueError(
+                f"{FIXTURE_PATH} de longueur {len(_view)}, au lieu de {expected}."
+            )
+    return _view
+
+
+def _span(name: str) -> memoryview:
+    """
+    Retourne la vue sur les octets de la clé publique ou de la signature `name`.
+    """
+    if name == "pub_key":
+        return _data()[:PUB_KEY_SIZE]
+    k = int(name.removeprefix("sig_"))
+    start = PUB_KEY_SIZE + (k - 1) * SIG_SIZE
+    return _data()[start : start + SIG_SIZE]
+
 
-hex_sig_1 = "386617e2d64edd0501bb0dbe0e2b84b0f0e20952d888c7f26de19ea05f6f89c9f42346553db229b46cc78c1b6dd8a81e1da0bd801781ef013bdcdca457cfa5da1f35e09f726ad5640d41d8417c902ef6f633d397c25f6e3afe0d8bef82f827a8ab32c3edb55306861fb0f65308600a97ede5284ea843334e987250d6f73c6188d4f1a9275820e01deff95051025dd10a51d053deaad5be424b714a1dcbca90c81841a512a85fa02e42f8f0f5ee4dd07d3286ea39c00f6acee15ba16c8ebc8bd47d05f99ddd95cb7aa64b02bec93ce9d5743aba7223babbacc20a10c78c37bf0daeac589aad857fd20c3e8262158e1ebbff0f5574f0ad81cee46ddc0a4c43490c4c6de3c9b268387da8545c1b302e302048aaff75aa81318ee326b20616021ce9d35a3ca54d10f6e66d1b0683c89b3aa22a60f026428e246ce587b52c0cda82b51ca2ab63742aa85a4988b9bae51c2e420ad798cefd0d3e7238faf6f9f58fa5b33d2c560f7fa5d34885cb4ef8a1a81b7a20e6aede9a6af083ea02f1394d89ce880e1cfb892670cae1e52076939ed984fb4824eeed5eb8353565b8f01ac08646aa9937584085b4b1feae7c25b9f8a36ec8837f6611378b8c1aa8101d93e591a4a9cfdb7b086637c4884afbfeedb94bd1fd047f3bf901fc6d19e33a9791431ce6c325cc5bf9d8c4066516a277fb53ab0afa9c40a9d62cb3570ba15c83a8cee0ca5e1f502790089f022728f2af74cee8b755fce37a79b90434f5908d3939e4f87538d7d2b64b9e22999b87ca2fb5f6fab3aeaa3c88dfce3fcff1dd9dbd0532548567689d09be6dc0a24847e1d65e6471ed03f63bcfeb6122ed060d296a17114d52f8742f2642c541fdfcaf7e1fcf65187c6755b506c4ac0ff401892d64eafc4068bfcd0576b490b9ae4796d9faa27b2c1bc3d75787a42f285c243b87d8f8bf3b6bf9d19691f384bde587ab8e889a631a033ae0510862854337eacf108fc210192bba96b9e7571cfbf94ece27fe864d07cb9c83748fddf5816245186b51a7d13d69b43e1011835fb99bb5051797478d2bf2326a6257a88a2ba3078ea723f6f6a4d780834d44724adc591680e0ccfd53afca856696c615d3975411e4ebf0b6179ae2b947ccac162615645dd8176f922f84ac7b5901b7a4e66a87cdeb3436d08d81236eb272ff3634b306cd5bcd08c4ff04dc478b22de27bda30e59bf2e0bd9fab971fad98fc37ba2d13233bf0228e697ae74388456421b00c2b1623a3950eb8e047b9e3a2f032a56d1e409c06c44238e74a48cf1aad50c2941ea20d1f8fd9ee7d11bd98a245cdbca1e15f0a5ca6cea08cb74c1c9be873e2406ffa62cd6ebfd971f6033c8e8df24f9f4ee53ba89d0921e979d7b46a5cc9bf5c9a893490f81a728d814df0ab0ed4cb810263be5269c828c81a9cef4e8f6359c96857e2f3c683416b42d2313ec3ef9b2b434f882bc898b8c713e2f0ccbf0e874a9d10cc787d4d0c3bbd3fca32acc14457c846c0546ddb62ce387c96276fb602b155c0b7ee18a553bb604880298daecf420143dd16c7ec2e2bf92fd30896e6d079d3033400d81a6ba30584f33b6931b799e785f07e387caaff7e6a81553a547a37a021ddcd37b73c46272a31b3034f32ec21dfe409112a8d41b98b3a39318ef8bc934f3eabab2baf0aa103712a9a1a8f6c21790e61d6cad5f92dd2635ee6e478d769a1e1700957936dd528aabf3ee1195d0ca1f455c518f0db9f8dfbcdfc46bc14c5dc75ebfe331e7195a3001bd7e96d65d6751cae23d3590cac3fe28d525e7b6300fe548b415ecc291320a0b5a157a580e234d23199e4797744264490de492a74c87886b4c441bdf7dbf429dda3855c87e6d4653bd03b80a0b3c250db8778b7bdddd009ae17b6560307efa528645fbc05448206a18258ce081b0393c6f6840f9389d990ca8da12edfa26c11c04131dfc4b19cf3074509ab55813f0c6c58065f56e2934c9334e1de7a6473b3bc14a0eae60de50841f0cf35d4a5973103887945a984a9f754457c0029a85caf62ec758f8e6f41b253fd730ae813a447947f2007146c31da6db1dce482f8bea49d52fbe1da559982abc87b9d6d8e3f7297db878be4c472bef2f92ee0faa98b534ef5fdb844896c22a319041e59bdcb32e2151f6f9002cdef4fcf90ea877f91632085221437c138313721057b93411aa9ba1408c6177c8aa55dde6d6326276917000240eb5d1aa4aa4c0c49617df85f004c5ff05671626f42815cd254e4228a448b1fda03884d9081166c0df713d9f2e2b9d15748f73ca055b55fdda9058d60b66027f47b1125149ddf4576e51f5d9140a9e54752820db660dc1acecd20d182d05c8c49b357d1097e32d9b614157bbb45d4709cc82199011961829827bea3c858948d7ea4a5a7eb4e23dbb576023875ed8369b011d9198cbf80e87654db93a428a040c145efff9b466fbd56072827da788ed850e2b63ed444e98c12766ff6b1eb197213c7bd9bd09fa4b1c90156e24eb4f3ffc03b3b7e520ae577a20b2681436c3f3ee4f822e46950f588ddb6472aee094fb0919740278ec7394e5fb5c369a9f60112ef826ada6efe89347d8371f04b6dd81dd62abc95b02c5a973425f53703d18a9b90540d5525f4bded350c55a73446475dbf0a7c96f6c7f8693ed0ebd61b23cd64741f05038f853e84d8cdf2d9ed4e4d3b55bc6300971ffb0bcb66de5d5cac42bc0803cd2978ca099df182a4bb81289693d56e78b2061630c53e270366c63df84eca5e2bb1015f98bb4bc1408036f348c24f98fe55866fc45e5d85b861fa857aa7fa4df0cc236473dd6650f370510a91922b2cd4d254d46b5322c22a828ec8dd0bf6ce61959a48b3ffafee2de4b78615a50eff1c9eeba0d8f44bf86b92f1780a2cd74b67c69a8b136e7055db59c7e516145b1290004610e6bd6d28a920ae14e8ceb00715292269a4493e68a750a9fd343926db5231add4cf511c276869b51025f75c89e71ed88f0ae2be48f40be02433bcdf72cf67dfeb3681d617a81ac304c5e7521539be45b20e9454743cee2c97dad154fd70fd9bac673f8e9c4c87dda75efa39ee47707c51685d22f7669831ec96924c3d7ec35bd9b2848bc2a086e85c8563927258640ee4ca7720351739f7f39581a7a6a89de5553b153205e33d2da3d33813ef5e148788eec2b9be2a2b222d9227ae0e59cc79d4863eddac1b4a2d6a88690997b6bd7babe3bb788f6be3c0d8e5d76119ec56abe15470e2b934d882fc9630c2156d45ef4ad1c3ad5b530750ac024bae98e620e31ec0873ef2d270db286e4915da882be1dcc3e3fef0b8424a99a9a03276b49a73e84d36b55d761b948b8c76714f411d5df23db7740bd8b91b16e41f0e8d3f268f875083c35582bfe2645d681666f86cfcb77cee63e6b99ea3cfa6cd092a2b54b2909fd66992164616999bb7436b651da8b2605a98a07cb412a01083d4c90590d157a9285e25223a99fa26cc5518bfd8273522e2ac8bbaa243c4b0915bddcc624116536d9b1d3332d60b439ac212801522f8ee16ab2798d8e38f7881867ccf93314319d47f8f4db86857454b567e16fd661f3e006bd0020a35829035afd2b8df50d336e31100d05ca664098a7cae586064b39abec289aa905271d434e9af6e7fcfc3241be5a060a811bc300eee953654dac293a669c739e55981ddd682711f6fce21b86f4bb8673a301c513621675338e535fb1537deb913811a47e98be7033d4d60626b848745dbe7c4e1ddd7510de0375b7265ac08ad024de1349ca6c78a1ab506885f03698fe8b879ae4cb585affadad19f47c9bb49cb473668d3bb663093e17e67af5429c7d84610e8452326c1d39972756a3804c12516b75576364bb43b39bc4d368e270aec587b5a308601b79874a28549e2aa4b2270088976f02c27473d232c80b7a002c608bcc81c8268a98432fbc337566c1eb14aeb90404b3e9fced2017b79fc2d9a01eccfc78829fe906371daf4a79963803b78efa67f3a341a2388e75704fa0d324f8c1fa624a3f69db47920abf3d3d53d837d380d15a75b7b5f136dc7f20b4f5c40897996059446e45b55bbe6985e80857a45bbaa55f1fd271d90f502dfa94172a511c1bf48f28942ad32c83f19a68e114e7488f187f5e3d0332e7c21aee90aa22d4e0bcf119e5e0a51cbdb840cf6437aac7775878fd89575bc2f993ec5e9ea17e502e8d10c8de3f8a1248e51f51d8c420e98e6a96401545959a77683a85cf88b91a6d4c9c7a1837e00d6c586a6ba015656492471d41b750013f31502b5b33816954788baf1f283633cc69a4a7537abb68b989808a1944bfda4c92bb6c631c592edbd3ef094a7094078a5f16ed7df2b3bd70713c520acd14f03d6b64f22deedbbf785d5e1f2c3cf1949eef798ced87f985603669d38e44c4eea3c69e0c3711e9313d3d1a9f74e6a72aa1f295a2036b7a69945aad68a0a4635eb633bb64f814f51f2534e3d960a7eebd339abaea0782f129dae782ede5810f7b5b3bcfeb5d40d084fff26f7f4c1473d46cab4ef5050a66b09e5a0def8a2bb54bb56b2e0cce8b61f081a926a0e2923f54dd9d31f4c8c92274674afa16c4e4d573724585cd94d137fcd9761a973d5e4096bf87336e549a576a5f311edfd8b8da01d230514e2eeb5b743938cda95441e247f81a9e04e99920c175eea5c7f96a94ba62668697d21b82458c63eca1d929616ee5543e2cfb89a59596234ef318b0084b63199dd90ce380b89042fdc8093d94b11e232cbbe1e931c45cf5f24a4cc0eaf80ff4d8082ea106cdc64c7da775f058a454a36f42b717e6ffc77352370c073107644e8e6a7689a088fcf9473823824e523f399c0a9b3b13c7aca9256bca5a2b40287cf7cde12f428ac066bdaa3b7b94eee2283efb17dc5ad8e75104a74a7936063285b4b7c850dc4d6f1c2c2bbdcfd91fe13e99013d176492c40b6faf818d646c890fda87137520adb32156304664accc926f10e7a23aa79bf61602c8465658b0d8cfda7823fa7296469d041c1b3ac62bea0318ea9613d6ffb4880800c49ac2ca1ef99f13a61ed76a872f3d6ad465523a63ac73f587019cda67685cf7c1438a8bf1e51d55ebc11e11542b2e5fc4fd24c378ae647ccc62b0e418c66cb76232e69c9a4d2f65bb536e0fa957ede5e77d25f69fe73da9e4d999dae27334c6a5f0ed79545207009587a31ef3fc58a80a9ca07736433f4f2cce7f83ed5d6abf383609a895aa831695c6395ddd74bfca1b97181fdc0313bd8356abc2f0bccbbead6a04c4502d944b8fe332715633e8e551df8688d3b38a1802e6e8bd59798d867cd703fd517f861c33c6fe51c6474f34abfd826eee40a04476d987278956849c29034e7d81dc0907146298b455845496ecf3682630435cbdb0cab0b0eb41105115b43e992f96659e477c40d3d1a915b28f0c43bca5605d51b82ac29a8263bfd716cb0f5f4a23e7f72b6205157ad24f2a3804654e192c76c755fa65d383e821e02599770d72b7312e624e5617f2d71a27fd3e9e69db63ce7cc74a2c9e142e6bd22d65837abcaec90ac476e3dc0eba9891afb8b84cb5034e33590dc00815ea2ba56d7764b585da7c8b10562bb97ff58367fd9b87e5fe1bb3c2f361632c66ae62b61758907d724d9da366edb3d6e5043122918781ef3865962e25ed8af6d283d486becc2c4210acd520ec4d8d396dc7ca53908ecc1252cfe0cf0903978167f0f83cb5e742eed2f7b1828fd9c31cc997f2ddc5e9874249d1883f32a42db7551d0759612ba3cbf1371139259fe5d45e4ca595f963630513fd41fa6754bac782f631bc199c7887c7ca14764f1162cfdf53725b11354098ebec98268fd0a0f5f0e4ae413f6410b712cb0548262f0695fd84f091cb00e58041374e4d9d3828ccafa6ef9df36ff7eafd77fb2255c3af42d003713c8910568105745a674b7d5d56d1ceaf230e4eb7604050311ee3a07af1da546315e1b257b996ca499dc8aae7e94d7909a62cd059fdfc2883992cea236a4d4a1a377cb181faa43b4e71c5be0d07ebd49aa3de714a87ec1c4b7791a538fb5bb8d25c97a6b91ac3e730c825d62b89ab2d6cee4913984218a0a32ec1a6f55414d1583e31fdbb3dde336ce856d703abbb56c22cacc075a4977e96a42901ade9fd00ae21a4ff80f0e3183b7e2a32272d0ae2ebff94ccaa4a11af0caf2b1316906fbe37b613ed44463e2f68cb1cd43715fa8a5a33ee39a1c0d93144e7cb7112c14c32cebcc9b70698d9f9444a9cec72ca5cb40d2731280a0aab786d17bae06ca29c1bbf78c212fa9e815e0714d4c06bb4cf012182901d8bdf21ef19475b26b9f1ee779f050c0963668e982e957640a645b806582274127e8d386b513e943efd243ff6debe14351d5bbc4feef23cd0afdbdcabb8f4557e6b3bc5db5f6d0f5a5b1cf3234da97827255d3f9c27ffed253d3f812e93858ef5571ec741a976ec6e21258513113340791a6c3745530d29075fd02acc1f3205f056a1ce4e102e49865acd52cb7a753d637f60c5886ffacf05ffb5534bb54f7b3d2967268aa0e16b3642073ae398484e7884ce25cf602fcebac591e9755bfd197572a22982ec1e422576162b5f24b0341a59be3bfeba6247c3fae691b5be8cc3ff92bcf5327a0d0c6d0fdf9f6fe457a87dce6b4c9385f760aef5a62e72d83ad7dd53d17cca8d896b734a04a319c2330ec800f48554a8dd3cd19f0d7bab3bcba89ed4f509cf4c35094538bed27ba45d9abd4cf114ba2f1060fcf5f55e18cb2a08900370b135d3dae08991f72b27ce9785b3bade91c5d51485822190618c4e33675792fcc8976fd5f0453b2aa7fd0b3a23580d287501e4661c38d3423402da21ef5f3ce4b0500e76a4d8bc5cb635e4debdf1a24fc573ea4d9658936ae34be6ae7247bba099b8be154c89e4dd365b456ad3a83c229835fa4f01af5e96bf3c3fe5f411636d344bb5973f35900f644bdb73fdab4d9d62d0e4cae6bdb7f87e1af7a78c75509a6564e394ebb2208355df344c297717c9d258de82c6d4abd34fbd09168dd6183dd90dc5b2726075143b3904d90c3210ae413fd6fc5610970bde04fdd60189c5d4ee76d795b5a4b6aa305c11d9a7c13c32f5b91a80fc5c3689fc4aba1f4aba0159e314a979a267b15c2cf0661e882f7601c1c91a6208b8349dd4fef64e1524e9cd3d8817c533b43bc3aaa5ea1f90dcafd52b207132537003a3a94091108d61b15997acc63560f52ef6200edaf8f5a99664054f184a9bc0ba30216dd06925a71cffc3ad3b14f0f8d491c257d8dea797a3df396a746d503a0ea75b7522c416e5f36f4ee66f122d41b21a7d803f35422e8efe0edcf09e35431872605e944aeb9b6cc6e3988066ec7ff50a0157e95f71afc8c3f569e86b384650b95f81c6f98063554b6ac4a57fcc35710947f36f6a3666f3ca50e7df7b56793000b154b7beb93799e36646d0857eabd6616a7429407deff9907ac0f43b4fe46a80a4afee08fa6aae4c8bb4133254874a68549b71128804f795a3b5bf47891693c57c1dc35ffdf91daa148e70fac32d40ce8ab29426cd6fe0618df9dde88e6aa1f9811d081d89346c05eea9d46466e10624bd1a20637faa1e8a6adb1aa14eefda7873ad26a37aad426f36422f50be24e2ccf6dcd561d2d9db941ff8e75b2453ce703841a58b650592d2acb1987112ee0e53c282ac04f615645339fbef38f31184f9377a37664fdcb08f3986945fef9c230cb363ae6b40d8e50bbd0e6486e86c44db63c461bd19fd16145d6769ba57e21cd417be9d9c18484bf0e282e30302f11ce2c9187c480586f249db94a139fdff410460f45835abfcc7b31331cdd6ae82b15386ffa6bd23653cf3aa84a8189afd15debbbe05ea65f45911a84378358024ef57d6c10e4ca25d2893bdeed3d8d9ce8f270e522803d6892be33e1db8dc181ffadf1f2e3ab38cd11281d42af4dd372406dc3ece7fd5a196153c4dfbd3d998d4bcd54b658c81f9f280ca362e594b4316b9620df02760b57a38c5922c37ed3b5c19a07eb5bdb931f0f5a86a1daa6066fd68b4bdd59572c173db28672b278f954724812a2e77b037def67d65a8354d7c50275c98c5b1942cc009e9033e0740103888413a317f386948b6539d32874fc1f5bac52d21760a141725a548b40b34162a0d810a3e00f92cd6408584eb81a8b0f2be18b6a4aeaba28b3ac503007862c6f0b8a603f7e37074fbe89e92da8dc9c900c512a125440d662680b1eed483d3439caa9b73c439887038c8a869fc02fbfeb3841d340ca83955453409f5d75ba8064f7481aed84dd6d66f930c434267db7680f6336bef19c3fe4779e623cbca2c76e3702b3eefddaa8fef90ea1f0a6bdf2fa0b1c53a949604883eb3fbeff6f1ce2da34a292de035461cf82b81969f193dd5233c13809b99bc143724c93760d7f369f0c9caed68ed762ae9484cd301d42ec0eb41056be68f00d02435937bd4db5424b424c4e4c3090590c67bfdab22bd8b6e720641fb27ab3255e8c468a7776788a8ce09cc3c7d8c4d2de96df192b93d74d011db48bc5422a6d8229f5871d69d002adb2e157da04f843d75c7c811577a58b0d2c375836dfaf6f0b85ae1d7c7875336085d4f00f411471b4bb5ff5e5379945280b02f7370f6e8a60dcdd7a090d47458203a871721e73598080d4a2e673e722182f9105e9f631da33030b0fb02d92df4d44690738c976c5682dc8757fa600a18b5b48d5b75c055af62ccaf52d3b69be5130e17ce6f7dc2aac83c1e9e95fbd1c1b82c3308909a9acb69817a6b2971b843ee4159e0ef60769af092d6938933cd841ef73064b3a1c768f9fedb0875c991c55c1be8e0adbfc16a4dfd6a8ad4aebaebcde8317e31eeefa7343648ec083911d0697a66af43804f5a5586be57bcef5abe11c528f9bcabf8cd8b87d5fa40940becf7c90aafa8f0056daedfa6e0f5856148b99c4233267e93bf3de86202ac78505eab29b35603ad7598e637ca4316a2120f95c92bc1a0a0c35031d2049f7438309df40845a98be5cbfca104aa98450affd202ff18689ea26f7514c35e2e6f5dc4050b2a99c26a2a16cfe2796f777e9c96cec655b779ec28376775f04b880792c69b904c3097ded3217b73b1e87814ff0b6db973278b8cebb172ce285078d55de5245695a63f8db72a007c56a731fac2cabc9939f1de977fa3f411c886578fb0c51f74b316506bbf8918101889d49662a4883833fd809c80448db6e931a46c58d1df8ddbfc9f3a9fc05838ef7345a981cfa546e9ae9547ef525dcfe8b092070223f7ca22b710cb3c795c5987731fc27b4d65c62f79473ec6fc82cd50b582121b3fd426ebba52c082c70596317552bd99b039d5488a73184b0795e57aa3d6941a12b92fe560f696c7908e59b50e8da746c220ec20d1bf1562a1c719a73526388f3832fe25433477de87b301fc3add8347bbc6a0e6b495881a08816e90d8cfe0687b00b27531dcd441575990208d96f16968e3afd9a14883aa3d427f4415e7a47c99badcd3cb307d8e5dd453677a6077d1e47ddef160957b6788d4a0dc7f065b3cb99ccbe69adb918869158fb7fe44550fc60355c989cdb854b0c4f3bf427d3b2accb16c7e83da4e4810a315fbc516ae9f9b6e09464c9ffd8381d02f15ccc3fdeb6a3fc04c3b4864ca5801ce477e8340945d1ae0ffe25a8db83403886f4a33d32fb427d2bc47b6d83efcb0c34c348d4a76f747d312dc75a8e3a2b8c600de9b3c54a99f95959053c799761af414f7d72d687518a17f35151bb6d65d8db06bfd770fc4700305c20cf67ff7d742b116190aa527764a8dd3341e02fa6e0f5357ccb65cbfcee3223d033c0feec7194d2357e1835abe02bcf4fc61cd15e353ddb97aba5879f55ef845dc0ac4466034fb70dc465356b5d06344ca1f3f1ef0dfb73321169a32d957f7ec2a6dbf7d400a55d3a84d4ccdf851a01cb64dd10e49370a8959954d7456cb05559c33193e729ae263605a484dc5515b40f78313082e5a2aeb6ba6e2a4c8532814cd10284bf157926e2ab62776392d98c8d51a92d243f9d79c56fee783c5108730336cc6a9a76282778770796cf72e81784877d9ba328725b9f846ad2f3e5b24bc48fd4241265f317a8361a732dca1cca4ab2891debdfe973b611c6f608829d60810b9afa33693ad61ff5690be999069d6b9b4cba0049ab0b8248f2d390878a705625d1feccc46d609db04e36b54a14088f6c421d216d2349f6bb8e5ba7036cb058661fc56eb768ad2af783b2ded66d9f026b930bf2c78fd6cbac50b703c9f42762d6bc274284fa44f30fa5d2f1dd2bd8b4b7bc44cd6518e6db7774deac5b48c37923f8b9fc251b7137838b77f5978e046faed848bcf242d50c15c3717d3ca6a9c98634718091cb17d95df002153b140863378ac58c537611da03234d1e82f3697ae73ca2de6531fad675ec04c8715bff0387cda22f1d534edd5c7c8dc2097b8cd149d88c150796c6bd8d6216c58cf9b0a0313a470a8b4b0b2e86780f395abb2c0c5a193a18284d531bdcd2ada136643ecd434a396af454f3dd1afcb71f2d7cd29892b72754a8ad0a09eecadfb70247f8440d75022fd85c20059f287997911333321edbbf458551927f8812fa6edda6cbe45a034431d0faf72a4c372eeb2e089f95db6c5a2a69c49b2ab3d2e279a2d01d3bd1cf8cd8bfe740c374b81c2a04915c9094652ca3f397c1fa09c237891e4a5bdccfbd57fd57ef4d1dd5cb5fb7e8bc0ea73484bdd7350b6b121b7624c288464d601e4cb00cd58bf29fb929079fefc3b8e77d1a88107ce35724d48d8757ed20b4da1f93dc598835a6c06064b8526fd6b4f4a39615abc0ebbe9c2db107e9f132c9c26acf0b810b8e61f09a101c76c52e28ada75d2e752c09cd28bf11c667da071d0e255a9d0b34f332e01245aebcc7e5f37d01ca175428638e738cc85e09eb9eb923c78a9b44e8c06ea2527cb937e58f43684f7e4971d1596ca61ad033a06dd0f89ec1744e5d82f90ee24c64fde38cd865c14c2c1c6da8a7e42d8a5e357cf2bfb50342619db4afa408294033a1b8265e5a03155515bdb02d9b972d46bca21d41cdf0786068c84e90660d0dfc5fb33d44806453a1ea8955ae75ac1b05787da0a5c89b66616e55c0a1a2555a084bcedaf808332d19b3b5db2d3674e696733dea41f8426947f3fb14b6cb6745f50fa589b3c3fdd220fb3e3136eec8a5203e2298e1a4a4d7ed2857d43ab968511dd082123d5c48b197414e795c52b1c68def3d61beed0cf2a655226044abc468b2d3626c1f2a062a10684f103328239c46e3d1c9ed23d40a30e174fe6cf125d16a9a97653eeebc20861651b2ecea0f7dc8db31fa7d365a46d2461442378e1afe275efffa8550fe1c65d142945a904e319dd82aa52a8b543d7762c83998922ffe91ca2acd59c79a9a63d51ee19199b11ff23af5edf9918568f220a0586a769433c623ea047c627130682ca8e58adb187fe7ea32ecd8dc0507a11986da0f3eeff2a8e89c72234bf748cf1eb1d95b3f7419a281d9843809fb6acd7ca7b6d63d938e5b5adf3c91100556600638d3ffc14d615305254c03cf5a30a"
+def __getattr__(name: str):
+    if name not in _NAMES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-hex_sig_2 = "5a408528b64f893f4d8ae48cab2b8c75ff6bf65c662fccbcae1adaadd2bff935f42346553db229b46cc78c1b6dd8a81e1da0bd801781ef013bdcdca457cfa5da1f7855277db49f49c267d2a997670e159dfdf68f761bba9ac28c6ed33e51e8a905206aa9d06471ea1abd7642390277b22be67ecad5c97bddd248b92a8401f2048bbe117861ed70b23cbca54fc662dab0e05bf8ec721dd7f5dcf8dfa714067fd9ea65320e8840151bac5394e64746ecc02ef7c25f5bc28b59a120402771daacb1056dee80e2ff011858e6cd11de804fdba0dd96a7c15fd1d8f4842dcb5f949db114a767b2505de61b8c5cfcea3d36b97b615983c2e5b02481837c48ad35734ac82a2ccc705cc90f2192ca9f9ab63dd6093f2d467247c9df0d232f4d661181c2cbdf827b6b22c3f29397baade9600fca25e1cb731899441a5d8590a0c20a772e234980a30b4ef963ae8ce60b9f42c1a0f6441c2590110a6dbe61b69407b6557921174f65cf71246d86e74556654c70eb72ab959e656f6af747ebc41706c6b5dd5c0e1cfb892670cae1e52076939ed984fb4824eeed5eb8353565b8f01ac08646aa360d33352bc1ea39c76bdf86d2de09dd610cf2943e92d18f6f228cd3af70a510cfdb7b086637c4884afbfeedb94bd1fd047f3bf901fc6d19e33a9791431ce6c3154afc302e83917139809fb244f255f44d086d266788f5543b4c0d8e8a42b6da5215d097970d53fe6ee29ffd1a5e08ddfa2b51ab204ff9b68e7c4077369be4e82159e709b45f284be88091b85a4d0c0b2309ff1364575b46d341e3df79abd7d700e2d372b87b92e549d97d7c7ad3a5cc96fcc60076cf90e6516f13624af3a8f1742f2642c541fdfcaf7e1fcf65187c6755b506c4ac0ff401892d64eafc4068bfe726f909d51013ba7e11084566aea6f086742503567bf9e18f4c34906c2a8fe19651d1313b566d9b025962b54a8a620fecea94bfa95f26d42339faff9a090fbf96b9e7571cfbf94ece27fe864d07cb9c83748fddf5816245186b51a7d13d69b43e1011835fb99bb5051797478d2bf2326a6257a88a2ba3078ea723f6f6a4d780834d44724adc591680e0ccfd53afca856696c615d3975411e4ebf0b6179ae2b9de8e58d03149f83c967fe86435949a685c2ebcb6b6dc504529d4613ceca8e8feb272ff3634b306cd5bcd08c4ff04dc478b22de27bda30e59bf2e0bd9fab971fad98fc37ba2d13233bf0228e697ae74388456421b00c2b1623a3950eb8e047b9e4caafb02b0c44e5bdb15e781d70c3325d79d01e8d3800489eb43503dd18835f48a245cdbca1e15f0a5ca6cea08cb74c1c9be873e2406ffa62cd6ebfd971f6033c8e8df24f9f4ee53ba89d0921e979d7b46a5cc9bf5c9a893490f81a728d814df6f46fda59b5b210a67dfb452584c3db26b5f710618322d2779929cdecd75389ad6045be9e4fdb4578a9f5fb55ef63a550d9c31c927009f21e3609bba7e26242c9b922205765eff319bd43c6a39ef30f657374b827e73c493ec352e84ca3bc9b50298daecf420143dd16c7ec2e2bf92fd30896e6d079d3033400d81a6ba30584f47f198e27797da288876ae1111ff06f07c5bac35bc7b88c41a11b072a8a7fe013c1aea53e6d19bc9b444cfaf35b80510850ff3645a7a0ee12b0f94b0af94e99012a9a1a8f6c21790e61d6cad5f92dd2635ee6e478d769a1e1700957936dd528aabf3ee1195d0ca1f455c518f0db9f8dfbcdfc46bc14c5dc75ebfe331e7195a3038f122fd12c9cc0f52081f6852494c30e7937ef7c10549ecfa42fdf82869d57d0b5a157a580e234d23199e4797744264490de492a74c87886b4c441bdf7dbf42101dce192392fc55f4a7a9f8177012e8e1106ba49ca0729844d72612980332939495a129dea4b574e4fe6b83cbe326a8e785afc9d6b7f99d96e598153368119c1c04131dfc4b19cf3074509ab55813f0c6c58065f56e2934c9334e1de7a6473bd535bd9ecdd8ade20215b062529e0da63148a40f8afc4e5725674686f6674df3f62ec758f8e6f41b253fd730ae813a447947f2007146c31da6db1dce482f8beaf7ac42da832223d4e184d2b16a4de2dd6166afe651a33a5eaaac6bf3a018064b34ef5fdb844896c22a319041e59bdcb32e2151f6f9002cdef4fcf90ea877f9167b62b0eab9f3d5e8540a562efa3a471f8c8436225b38d96640f5693ce65b32597d5c35a0635c3ab83123242853f626bf19225f71cdc1d6972ade904f15d44a609e53abbf0d879d66b9cfacdea10fa01fbb0ea14baa8537b3b774d92c03ccbbff66027f47b1125149ddf4576e51f5d9140a9e54752820db660dc1acecd20d182da4af5586765283e158a093471a6c2e000c84604bf8fed6440c4693dcbcefd80a8948d7ea4a5a7eb4e23dbb576023875ed8369b011d9198cbf80e87654db93a42d5d220304eebbc8240e20c3a608684d281aeb7af734539f9bac56b4b1633409db197213c7bd9bd09fa4b1c90156e24eb4f3ffc03b3b7e520ae577a20b2681436c3f3ee4f822e46950f588ddb6472aee094fb0919740278ec7394e5fb5c369a9f60112ef826ada6efe89347d8371f04b6dd81dd62abc95b02c5a973425f53703d18a9b90540d5525f4bded350c55a73446475dbf0a7c96f6c7f8693ed0ebd61b23cd64741f05038f853e84d8cdf2d9ed4e4d3b55bc6300971ffb0bcb66de5d5ca69b027fe45192e6a28c90eaca8ab776a42bf9149d3d6537e43fc0e81b7d2375c9ada4a15b64e331dd5b1d45a313a9503641749bfb84011c7e9b8ee815cede252ddb14dc9bc4f842d2ec83366eb559b16a7c984c518f5c2b70ce251da56a42f71add96957e1c96ce3ce0dba9b182a8a95a782b21f9051c07fd8033e81d6a3256880a2cd74b67c69a8b136e7055db59c7e516145b1290004610e6bd6d28a920ae1730363182637e4fd01dbeca422e8539af5c4d15e6f64606b16ea5ead1f5ad701f5bc8a019c582057ce43d791e137f2073755a0f10afec85114d57383759463d9ae427759a57a4f92ccf95df4d09c41330b3d1f0cae0872053ebb10c375201e79723b8bf1698315abc285caadbf21838a13645a2354fe847db17322c159460307db21c14d99bc27f58b9258b40376ca8e7ec11c87a069c917da7d86dc9f37ac2d3d33813ef5e148788eec2b9be2a2b222d9227ae0e59cc79d4863eddac1b4a2d6ae6b01478e36602b4386e3775063d32d69f365261e6d1247508b4458f058fa45c9630c2156d45ef4ad1c3ad5b530750ac024bae98e620e31ec0873ef2d270db2ae349c39ca84c8ba3adbba2ed317da8d2ff80546420b96bcb5abe747c75fa218b8c76714f411d5df23db7740bd8b91b16e41f0e8d3f268f875083c35582bfe261a5c3210bc85807cc41bd8aab10fd248c0928f7c081e1b83f9ffd1d13021a42b99bb7436b651da8b2605a98a07cb412a01083d4c90590d157a9285e25223a99f26d628acdb8414cfd33b54452b963eb0e479b7a783cc9240fbb4683fe527b63bb439ac212801522f8ee16ab2798d8e38f7881867ccf93314319d47f8f4db86857454b567e16fd661f3e006bd0020a35829035afd2b8df50d336e31100d05ca66802418160f2b81255ad96ce702e20cf07ce73cb207e241b89b53e86ba7ea3342b10638c2a5281f864642b917079b9aa8bb17e0d6d65253ff277b72cb4cae956ec513621675338e535fb1537deb913811a47e98be7033d4d60626b848745dbe7cc992e8546070fc4d2c46e0e21bcaa33dbae3744c4b4bb732b925815c12a9fe8eda11b42db91f12bccd5ab6e4e901de75a701910939df4d9fdbe8bc85567c77d30e8452326c1d39972756a3804c12516b75576364bb43b39bc4d368e270aec587b5a308601b79874a28549e2aa4b2270088976f02c27473d232c80b7a002c608b9e2ed84d6c0bb21a741844187fe2a86ca3c454ab6dc3f8c97ce25efa357ce831fc78829fe906371daf4a79963803b78efa67f3a341a2388e75704fa0d324f8c1fa624a3f69db47920abf3d3d53d837d380d15a75b7b5f136dc7f20b4f5c408976d08406f948c8b3d75156c9fde45b66f672cbd6516d0c218449e1ca3730c7b58c41bd3dc9e79b0423b5d39a1be7b3b8a22b044ebac99381c57380b88495770b722e46274dc3980db883173a54c5d785af472aa2e99da91d143a0111124d1bd59733532455e8e00a1488851d9b87088a52893e19455f52a54a59354f069525c53a552b7f7df1c7cdfc5aec3f0a3937d1ac70107e1a6599bbdef5425b974ec777e26942f388e83671dc01bd4da4bc2756f5696af5f10b16a529d1fcc765454ea0eef094a7094078a5f16ed7df2b3bd70713c520acd14f03d6b64f22deedbbf785d5508be978978eebeac00db5e5019856cd43e60ce4dfff4c6c48f9e2ea8404cb75cfd9588f710df4e7db6833cd0d54ab7d557cee39e8ef7fc68af44302b06b1c2c71d7c5881a43a69552e24df48fe21ee10fa64c5f9892b230f37cb02a89263016f7f4c1473d46cab4ef5050a66b09e5a0def8a2bb54bb56b2e0cce8b61f081a9abdae7f72657805b15b83437a7dca852dbebb67cc06be91db1ceffcc05fd8f661a973d5e4096bf87336e549a576a5f311edfd8b8da01d230514e2eeb5b743938cda95441e247f81a9e04e99920c175eea5c7f96a94ba62668697d21b82458c6386206b78e74bb02efc8191d012346ef2f26ff4381273206c733fcae99355174170a9f0f32279da9893b4ad461eaf3f6d5437acc6903ae3945c380ee2da712fe57da775f058a454a36f42b717e6ffc77352370c073107644e8e6a7689a088fcf9473823824e523f399c0a9b3b13c7aca9256bca5a2b40287cf7cde12f428ac066bdaa3b7b94eee2283efb17dc5ad8e75104a74a7936063285b4b7c850dc4d6f1c2c2bbdcfd91fe13e99013d176492c40b6faf818d646c890fda87137520adb32156304664accc926f10e7a23aa79bf61602c8465658b0d8cfda7823fa7296469d64c90ccf565cbb8265944349f31ef6bb27f0762ab781993c6923975c38af970c3d6ad465523a63ac73f587019cda67685cf7c1438a8bf1e51d55ebc11e11542bd68ff30c7888634acdf7a862d2b3a19fda8feb84f87ef11935df24cd434364c87f8677ec326d761d4fafbc943b961329cde5131224c2be197601b4b671c53df558a80a9ca07736433f4f2cce7f83ed5d6abf383609a895aa831695c6395ddd74bfca1b97181fdc0313bd8356abc2f0bccbbead6a04c4502d944b8fe332715633e8e551df8688d3b38a1802e6e8bd59798d867cd703fd517f861c33c6fe51c64744f775fd362fa9ae85a417cc8a18df3412473216243b4d8b9eca3ae50f70e9aa5496ecf3682630435cbdb0cab0b0eb41105115b43e992f96659e477c40d3d1a915b28f0c43bca5605d51b82ac29a8263bfd716cb0f5f4a23e7f72b6205157ad2003ed8574a9eabe57f1f22e391ac547e5afb052e4fd3fce7093a689855a013381a27fd3e9e69db63ce7cc74a2c9e142e6bd22d65837abcaec90ac476e3dc0eba6fe2598fd08ff9ae8918fb58b4c3f04f48bf05cd43de11cf34d11a6493992e328367fd9b87e5fe1bb3c2f361632c66ae62b61758907d724d9da366edb3d6e504f68c9e3a9ce534ff3dffc5e117e3642edc25be101c065fe1ecfd8302422bfdc9ca53908ecc1252cfe0cf0903978167f0f83cb5e742eed2f7b1828fd9c31cc997f2ddc5e9874249d1883f32a42db7551d0759612ba3cbf1371139259fe5d45e4ca595f963630513fd41fa6754bac782f631bc199c7887c7ca14764f1162cfdf534c47f2ff19dd1cde146cdc20aea027f8ffbcd52a76cfb40e78537fbd72f6be82f091cb00e58041374e4d9d3828ccafa6ef9df36ff7eafd77fb2255c3af42d003713c8910568105745a674b7d5d56d1ceaf230e4eb7604050311ee3a07af1da546315e1b257b996ca499dc8aae7e94d7909a62cd059fdfc2883992cea236a4d4a55a53209e22a7c9b94bf26b8fbac393dd4ba7f19fa95e2f4d25b348aa782a2835ec3433b583ba33d8c2dfbb611402484870af41c93f881cb50c8a994a03535dd583e31fdbb3dde336ce856d703abbb56c22cacc075a4977e96a42901ade9fd00ae21a4ff80f0e3183b7e2a32272d0ae2ebff94ccaa4a11af0caf2b1316906fbe37b613ed44463e2f68cb1cd43715fa8a5a33ee39a1c0d93144e7cb7112c14c3239aeeefbc7deb510d9276269c1bb1ae1e0d7e25cb7570d1783f9ea01cfa1a16348fa3e9c33973dc6eda0cb90d0ab3842d35a5e87e9bbddd8b477c6963d3803aa9f050c0963668e982e957640a645b806582274127e8d386b513e943efd243ff6debe14351d5bbc4feef23cd0afdbdcabb8f4557e6b3bc5db5f6d0f5a5b1cf3234da97827255d3f9c27ffed253d3f812e93858ef5571ec741a976ec6e21258513a3ae900e173584261717871cd9b5cd931cb666235a5b8181eaf2ca9a3f9d1bdc55ef8b0cb04e7e6428836360b481b1fa29d5300c03cd04b9d553b839b129045998484e7884ce25cf602fcebac591e9755bfd197572a22982ec1e422576162b5fab0a8928fccd1d6fb0ac14adb3eec786de58e3afa7a2b986c226a694cd1a64eae457a87dce6b4c9385f760aef5a62e72d83ad7dd53d17cca8d896b734a04a319c2330ec800f48554a8dd3cd19f0d7bab3bcba89ed4f509cf4c35094538bed27ba45d9abd4cf114ba2f1060fcf5f55e18cb2a08900370b135d3dae08991f72b27e1c1076824c32ebc3803c2f474d05dcefcff5b2e14e5c43ba35ca9ba12702383bac4eddb6c50517eedf172d0b73d110a809c79dba946d067b6e898f55afba000e4debdf1a24fc573ea4d9658936ae34be6ae7247bba099b8be154c89e4dd365b456ad3a83c229835fa4f01af5e96bf3c3fe5f411636d344bb5973f35900f644b35f69ace808bc886588ee03f2075134f0f1812348a5ab003a8860d9efa8c2aa2df54df8454d4c8a3e4c59114977f858d7ed5db034aaf892564f50378961bb23804d90c3210ae413fd6fc5610970bde04fdd60189c5d4ee76d795b5a4b6aa305c11d9a7c13c32f5b91a80fc5c3689fc4aba1f4aba0159e314a979a267b15c2cf0caf914c567cd3949f4b49f4d422516f34bba197f956ba144ae6f3f10aa3dd96fea1f90dcafd52b207132537003a3a94091108d61b15997acc63560f52ef6200edaf8f5a99664054f184a9bc0ba30216dd06925a71cffc3ad3b14f0f8d491c257d8dea797a3df396a746d503a0ea75b7522c416e5f36f4ee66f122d41b21a7d803f35422e8efe0edcf09e35431872605e944aeb9b6cc6e3988066ec7ff50a015729197546543064bc23f2c90e16d16d17b2e9728e5a10cc42b07d051fda1f852c6f6a3666f3ca50e7df7b56793000b154b7beb93799e36646d0857eabd6616a747293cfd5a832a726b4b62a7d733f6c45249ae931511e52b335e22d97ecbbe77c71128804f795a3b5bf47891693c57c1dc35ffdf91daa148e70fac32d40ce8ab29426cd6fe0618df9dde88e6aa1f9811d081d89346c05eea9d46466e10624bd1a38842dcf0f5c01bc77aaa133b04036931b4c035d885e117dd9d23adacf1f511c12c44a08312ad5791ea01478c790035b1e9a175da425f6944ce57a8951b644482b328c5edbff77690dd1db43281c9c586e2a888b56d60725c7308e5f98361fcaae6b40d8e50bbd0e6486e86c44db63c461bd19fd16145d6769ba57e21cd417be5e841c8b6f1b53938b4a431231d45e605cbd2c5e86cc9090e972a52a12a844e85835abfcc7b31331cdd6ae82b15386ffa6bd23653cf3aa84a8189afd15debbbe66c0ffc6f66a34bf130cc54594bdf4dc492b6c5174176d0ee1d3bdcc069a41da2803d6892be33e1db8dc181ffadf1f2e3ab38cd11281d42af4dd372406dc3ece7fd5a196153c4dfbd3d998d4bcd54b658c81f9f280ca362e594b4316b9620df02760b57a38c5922c37ed3b5c19a07eb5bdb931f0f5a86a1daa6066fd68b4bdd59572c173db28672b278f954724812a2e77b037def67d65a8354d7c50275c98c5b1942cc009e9033e0740103888413a317f386948b6539d32874fc1f5bac52d21760a141725a548b40b34162a0d810a3e00f92cd6408584eb81a8b0f2be18b6a4aeaba28b3ac503007862c6f0b8a603f7e37074fbe89e92da8dc9c900c512a125eb03e42c9fe18b60d1e928bbc4c7ed1953f60726946aec760ed461efcffc9233a83955453409f5d75ba8064f7481aed84dd6d66f930c434267db7680f6336bef8b2d1d5f10f2c52d64983334f23255d4ca50b9269063adcb0151f28727f7ac8fe4bdcebe816bc0f3f60cd37522775a7ee09c21fd7de83aac6146efc942d9be6d99bc143724c93760d7f369f0c9caed68ed762ae9484cd301d42ec0eb41056be67981c67f643ca865cecc35d4f35496a9cc8c0987da922257460ec21179577dda1725d044e1d8d908b2238f9e8dc58e90137979ee7666cb6e6577c23cee3aa53922a6d8229f5871d69d002adb2e157da04f843d75c7c811577a58b0d2c375836dfaf6f0b85ae1d7c7875336085d4f00f411471b4bb5ff5e5379945280b02f73700b251539c27607694c2eb663db456a9c13c40a043f50979a068341d7e0968afd631da33030b0fb02d92df4d44690738c976c5682dc8757fa600a18b5b48d5b75c055af62ccaf52d3b69be5130e17ce6f7dc2aac83c1e9e95fbd1c1b82c3308909a9acb69817a6b2971b843ee4159e0ef60769af092d6938933cd841ef73064b3d839a701daf0ecd18f992cff17e2f4a8d64159e519c4268df3a8e6b541b006164de2ba23a5189ee4d6e477f7464dd59e1910bcae491b49df7f085d16b6ee25cbabf8cd8b87d5fa40940becf7c90aafa8f0056daedfa6e0f5856148b99c423326cd6426e661547d1db7b7c6d3964a3ce16284d729252b4dac36f245543a5da7dda0c35031d2049f7438309df40845a98be5cbfca104aa98450affd202ff18689ea26f7514c35e2e6f5dc4050b2a99c26a2a16cfe2796f777e9c96cec655b779ec28376775f04b880792c69b904c3097ded3217b73b1e87814ff0b6db973278b8c9d12311e688255d32d00d8c0c36af4a8a5b9092efb1b23147b283c6bfe4723c47fa3f411c886578fb0c51f74b316506bbf8918101889d49662a4883833fd809c80448db6e931a46c58d1df8ddbfc9f3a9fc05838ef7345a981cfa546e9ae9547870a5766181012e78af1b93a4ae618629e916c29b2947426282c9e5bd4554f9ec6fc82cd50b582121b3fd426ebba52c082c70596317552bd99b039d5488a73184b0795e57aa3d6941a12b92fe560f696c7908e59b50e8da746c220ec20d1bf1562a1c719a73526388f3832fe25433477de87b301fc3add8347bbc6a0e6b495881a08816e90d8cfe0687b00b27531dcd441575990208d96f16968e3afd9a148831b0166887cbbdb215ef125d542387b0183324794bf9b3b742a4790f0bedee43b5642315e79d9cae1c9692860982840cb8e9b12b5e4bfae9b4531fbe5d8053c9954b0c4f3bf427d3b2accb16c7e83da4e4810a315fbc516ae9f9b6e09464c9ffd039db137376cb6fab697652f071d18451405528683d42d0e35bde063436610c9b83403886f4a33d32fb427d2bc47b6d83efcb0c34c348d4a76f747d312dc75a8e3a2b8c600de9b3c54a99f95959053c799761af414f7d72d687518a17f35151b38a2f7300c7a1828bce1f683539fad91963d767ce11364076e2702febe2728b302fa6e0f5357ccb65cbfcee3223d033c0feec7194d2357e1835abe02bcf4fc6124e29e9c123b3d50699d25074d21af2f3f1fa40da52a3ac232a6a5fd952a38255d994e2db847ea9c82901d1d5fc728aa49dfdd7b01f227c3682897eb27ba11cfd10e49370a8959954d7456cb05559c33193e729ae263605a484dc5515b40f78313082e5a2aeb6ba6e2a4c8532814cd10284bf157926e2ab62776392d98c8d51a724d15f6e0d37bb6a2e5f3ccec42c8f040e94a4d872787ba0dde616c4b1378689500b09637e5c37d5db706e69a3198b4fb41097a2118a6c38122294b16830fa991debdfe973b611c6f608829d60810b9afa33693ad61ff5690be999069d6b9b4f0e648ac4e232ac606b322a7896038be2769671ad4e4d7958bd48e513ebb66e621d216d2349f6bb8e5ba7036cb058661fc56eb768ad2af783b2ded66d9f026b996cdbd1d03b132261ed3be27e13b1a396355e10b35458248c21b4eea297b8f7fa9ffa412d6589d1b7f1a8809e701d15017085ce993e97459a41a51eef2ee6ae8848bcf242d50c15c3717d3ca6a9c98634718091cb17d95df002153b140863378cddc5b0fc48a8be921907d220e57bc15c79856e6cdaffcd4be90d0161229ff97acc234ed9583bcd06ee6a4bd36313881244154e73483dcdfcd1f478175971c357a4e40a43942e9436c0513c8ae34260951a691f5272bd75eacd8a8d29525a577a396af454f3dd1afcb71f2d7cd29892b72754a8ad0a09eecadfb70247f8440d75022fd85c20059f287997911333321edbbf458551927f8812fa6edda6cbe45a0adea69105f683fb8af36e6198c0f18a0f76c0e2262b86b50118522e6c04e1161f8cd8bfe740c374b81c2a04915c9094652ca3f397c1fa09c237891e4a5bdccfb30b0b547600556a39ddc3bd526e74adc3af75b7cb78f450b5928fb1dc27e4300cb00cd58bf29fb929079fefc3b8e77d1a88107ce35724d48d8757ed20b4da1f93dc598835a6c06064b8526fd6b4f4a39615abc0ebbe9c2db107e9f132c9c26ac1f75d2751b4e9e63ec64decad853dfcb2a2b0dde23d036ed5a13c56b0a695261e7bb201958c831ee7c0a056d0ce8a2f92c4cae950678b9fa8fd8eb02c2b8cd7c0993df96a7545d41fe38725bd2b9f17f88677eb19ff0059396965b3115d7ee97aeb6e01c9b84014b6ffe06c111832fa3389ce851c2dba002529339f51be547a619db4afa408294033a1b8265e5a03155515bdb02d9b972d46bca21d41cdf0786068c84e90660d0dfc5fb33d44806453a1ea8955ae75ac1b05787da0a5c89b66616e55c0a1a2555a084bcedaf808332d19b3b5db2d3674e696733dea41f8426947f3fb14b6cb6745f50fa589b3c3fdd220fb3e3136eec8a5203e2298e1a4a4d7ed2857d43ab968511dd082123d5c48b197414e795c52b1c68def3d61beed0cf2adb6f53fa7682174a7273f0072dc071060af8b3ba810f4edb45d2611a3bc7f6e7c8e29eca7aa89a6636f7e9c509a34e4b0e303b87ce66719edbe0bf8f9c5cd4e30835b62591854c8b7f7d1f550aa90ac4f585f18577135d8fe489828eaaa2317192138d179792d5ca91ac94551192fd5e4b479b42c9a46272211d308a5205eb52121e8eaa482479fddf33661be4378bbab0a9864fd28220356c1f4d37af07ddf4e812e1ab0a415ddf499d9aa53357bc030a0be62c2bc7849d6f387739736e3287d7ca7b6d63d938e5b5adf3c91100556600638d3ffc14d615305254c03cf5a30a"
+    from tp1.lamport import PublicKey, Sig
 
-hex_sig_3 = "386617e2d64edd0501bb0dbe0e2b84b0f0e20952d888c7f26de19ea05f6f89c9f42346553db229b46cc78c1b6dd8a81e1da0bd801781ef013bdcdca457cfa5da1f7855277db49f49c267d2a997670e159dfdf68f761bba9ac28c6ed33e51e8a9ab32c3edb55306861fb0f65308600a97ede5284ea843334e987250d6f73c6188d4f1a9275820e01deff95051025dd10a51d053deaad5be424b714a1dcbca90c8ea65320e8840151bac5394e64746ecc02ef7c25f5bc28b59a120402771daacb17d05f99ddd95cb7aa64b02bec93ce9d5743aba7223babbacc20a10c78c37bf0d14a767b2505de61b8c5cfcea3d36b97b615983c2e5b02481837c48ad35734ac82a2ccc705cc90f2192ca9f9ab63dd6093f2d467247c9df0d232f4d661181c2cbd35a3ca54d10f6e66d1b0683c89b3aa22a60f026428e246ce587b52c0cda82b51ca2ab63742aa85a4988b9bae51c2e420ad798cefd0d3e7238faf6f9f58fa5b33d2c560f7fa5d34885cb4ef8a1a81b7a20e6aede9a6af083ea02f1394d89ce880e1cfb892670cae1e52076939ed984fb4824eeed5eb8353565b8f01ac08646aa9937584085b4b1feae7c25b9f8a36ec8837f6611378b8c1aa8101d93e591a4a9cfdb7b086637c4884afbfeedb94bd1fd047f3bf901fc6d19e33a9791431ce6c3154afc302e83917139809fb244f255f44d086d266788f5543b4c0d8e8a42b6da5215d097970d53fe6ee29ffd1a5e08ddfa2b51ab204ff9b68e7c4077369be4e82159e709b45f284be88091b85a4d0c0b2309ff1364575b46d341e3df79abd7d700e2d372b87b92e549d97d7c7ad3a5cc96fcc60076cf90e6516f13624af3a8f1693a0e39ba947ad90646b85bdc53da8e7dc5852ee094d38b62c7ccb6df6d9a15cd0576b490b9ae4796d9faa27b2c1bc3d75787a42f285c243b87d8f8bf3b6bf9d19691f384bde587ab8e889a631a033ae0510862854337eacf108fc210192bbacb8c25a458d0b23afa593a981886483a6f3528953b3788fed0d0c1a49af2d0a33e1011835fb99bb5051797478d2bf2326a6257a88a2ba3078ea723f6f6a4d7806b852c8bbd8ed939c8d7ca61322d831915a5312285d96364d900806360c791f8de8e58d03149f83c967fe86435949a685c2ebcb6b6dc504529d4613ceca8e8fe290f2ddf262aa045c4815c71e69611d3c00bf64aa8d0aa4d34b0fc04ab65f4037e40a9afed0a213e0152bd089965955f3dada5f1eee4d07422c554d56cd0db3b3a2f032a56d1e409c06c44238e74a48cf1aad50c2941ea20d1f8fd9ee7d11bd99689de8178031ccbacba54ccd187a3e90ec32dc98bffc71f8e1c5c56efebb1a1ea15d6611bfaba222894ce8b4337db421450a47b2428fbcfbbee801ee0b46e4a0ab0ed4cb810263be5269c828c81a9cef4e8f6359c96857e2f3c683416b42d23d6045be9e4fdb4578a9f5fb55ef63a550d9c31c927009f21e3609bba7e26242ca32acc14457c846c0546ddb62ce387c96276fb602b155c0b7ee18a553bb604880298daecf420143dd16c7ec2e2bf92fd30896e6d079d3033400d81a6ba30584f47f198e27797da288876ae1111ff06f07c5bac35bc7b88c41a11b072a8a7fe013c1aea53e6d19bc9b444cfaf35b80510850ff3645a7a0ee12b0f94b0af94e990a5d5da1ca31d31d715b46c8884e2f99fd1f241f02bf7e2c1d6f152adec7a9ebeabf3ee1195d0ca1f455c518f0db9f8dfbcdfc46bc14c5dc75ebfe331e7195a3038f122fd12c9cc0f52081f6852494c30e7937ef7c10549ecfa42fdf82869d57d60c04062278908d17301a23175668a367ce1780213a0d6ab928bf2dc52af8b569dda3855c87e6d4653bd03b80a0b3c250db8778b7bdddd009ae17b6560307efa528645fbc05448206a18258ce081b0393c6f6840f9389d990ca8da12edfa26c11c04131dfc4b19cf3074509ab55813f0c6c58065f56e2934c9334e1de7a6473bd535bd9ecdd8ade20215b062529e0da63148a40f8afc4e5725674686f6674df3f62ec758f8e6f41b253fd730ae813a447947f2007146c31da6db1dce482f8beaf7ac42da832223d4e184d2b16a4de2dd6166afe651a33a5eaaac6bf3a018064b34ef5fdb844896c22a319041e59bdcb32e2151f6f9002cdef4fcf90ea877f91632085221437c138313721057b93411aa9ba1408c6177c8aa55dde6d6326276917000240eb5d1aa4aa4c0c49617df85f004c5ff05671626f42815cd254e4228a49e53abbf0d879d66b9cfacdea10fa01fbb0ea14baa8537b3b774d92c03ccbbff66027f47b1125149ddf4576e51f5d9140a9e54752820db660dc1acecd20d182d05c8c49b357d1097e32d9b614157bbb45d4709cc82199011961829827bea3c858e2e2e25486c3818356a7eb1124518eaa43ee4ceb84744f2c684733e7d0abd80d5d220304eebbc8240e20c3a608684d281aeb7af734539f9bac56b4b1633409d98e85347d535714a797da24d380e32a072444b7235e89fb52c6578d3a53a93bbc3f3ee4f822e46950f588ddb6472aee094fb0919740278ec7394e5fb5c369a9f4c79dc7d97f6991025d74e32febcc6cdc64581c3ad24a06ea28ee40998ac07b32df62471d46ed78dae8e15310b99edcdfd5dd37439d5d216a316fac18cbf11533cd64741f05038f853e84d8cdf2d9ed4e4d3b55bc6300971ffb0bcb66de5d5ca69b027fe45192e6a28c90eaca8ab776a42bf9149d3d6537e43fc0e81b7d2375cdf84eca5e2bb1015f98bb4bc1408036f348c24f98fe55866fc45e5d85b861fa8ddb14dc9bc4f842d2ec83366eb559b16a7c984c518f5c2b70ce251da56a42f718dd0bf6ce61959a48b3ffafee2de4b78615a50eff1c9eeba0d8f44bf86b92f17998daf7278f4fd48319115c36fb1286a55c9f90f6df7fc1d2f05e4168f8d5578730363182637e4fd01dbeca422e8539af5c4d15e6f64606b16ea5ead1f5ad701f5bc8a019c582057ce43d791e137f2073755a0f10afec85114d57383759463d9ae427759a57a4f92ccf95df4d09c41330b3d1f0cae0872053ebb10c375201e79723b8bf1698315abc285caadbf21838a13645a2354fe847db17322c159460307db21c14d99bc27f58b9258b40376ca8e7ec11c87a069c917da7d86dc9f37ac2d3d33813ef5e148788eec2b9be2a2b222d9227ae0e59cc79d4863eddac1b4a2d6ae6b01478e36602b4386e3775063d32d69f365261e6d1247508b4458f058fa45b3a3824a710fcdfd46fef850cec5a2ce62c914f7114571af775cd1c110ef733386e4915da882be1dcc3e3fef0b8424a99a9a03276b49a73e84d36b55d761b94851f4934d0ef6d5d70092b33efc7b0f918d5f37612c3519ffac48924cd1ea284b45d681666f86cfcb77cee63e6b99ea3cfa6cd092a2b54b2909fd66992164616999bb7436b651da8b2605a98a07cb412a01083d4c90590d157a9285e25223a99f26d628acdb8414cfd33b54452b963eb0e479b7a783cc9240fbb4683fe527b63bb439ac212801522f8ee16ab2798d8e38f7881867ccf93314319d47f8f4db8685ac3515f59d242621f9c0496d3c8c61a1892aab4cdf5461a7d676bdbcbde83f74802418160f2b81255ad96ce702e20cf07ce73cb207e241b89b53e86ba7ea3342c300eee953654dac293a669c739e55981ddd682711f6fce21b86f4bb8673a301c513621675338e535fb1537deb913811a47e98be7033d4d60626b848745dbe7c4e1ddd7510de0375b7265ac08ad024de1349ca6c78a1ab506885f03698fe8b879ae4cb585affadad19f47c9bb49cb473668d3bb663093e17e67af5429c7d8461953e029e05ef8843b07d9063f98a012543d29efaa9f519835f40fff5a9948ea2b5a308601b79874a28549e2aa4b2270088976f02c27473d232c80b7a002c608b9e2ed84d6c0bb21a741844187fe2a86ca3c454ab6dc3f8c97ce25efa357ce83165e93ddb69a8d1cf3f11e61137e86e6038857c8fac170d13332f8c9bfb20dcc4fa624a3f69db47920abf3d3d53d837d380d15a75b7b5f136dc7f20b4f5c40897996059446e45b55bbe6985e80857a45bbaa55f1fd271d90f502dfa94172a511c1bf48f28942ad32c83f19a68e114e7488f187f5e3d0332e7c21aee90aa22d4e022e46274dc3980db883173a54c5d785af472aa2e99da91d143a0111124d1bd59733532455e8e00a1488851d9b87088a52893e19455f52a54a59354f069525c53a552b7f7df1c7cdfc5aec3f0a3937d1ac70107e1a6599bbdef5425b974ec777e26942f388e83671dc01bd4da4bc2756f5696af5f10b16a529d1fcc765454ea0eef094a7094078a5f16ed7df2b3bd70713c520acd14f03d6b64f22deedbbf785d5e1f2c3cf1949eef798ced87f985603669d38e44c4eea3c69e0c3711e9313d3d5cfd9588f710df4e7db6833cd0d54ab7d557cee39e8ef7fc68af44302b06b1c2e3d960a7eebd339abaea0782f129dae782ede5810f7b5b3bcfeb5d40d084fff26f7f4c1473d46cab4ef5050a66b09e5a0def8a2bb54bb56b2e0cce8b61f081a926a0e2923f54dd9d31f4c8c92274674afa16c4e4d573724585cd94d137fcd9761a973d5e4096bf87336e549a576a5f311edfd8b8da01d230514e2eeb5b74393855c886e3524f1aaae1f109ac981824e83938827c739f5d8b82728e7d5792416986206b78e74bb02efc8191d012346ef2f26ff4381273206c733fcae993551741fdc8093d94b11e232cbbe1e931c45cf5f24a4cc0eaf80ff4d8082ea106cdc64c7da775f058a454a36f42b717e6ffc77352370c073107644e8e6a7689a088fcf95299805ac2eeec134057ebadf2eb8585c94c2fa210e745ad00d934220486ed76bdaa3b7b94eee2283efb17dc5ad8e75104a74a7936063285b4b7c850dc4d6f1c219cde30973f693291bb769c64a02dba8e420a699f65928abd6a742a7a7527dc56304664accc926f10e7a23aa79bf61602c8465658b0d8cfda7823fa7296469d64c90ccf565cbb8265944349f31ef6bb27f0762ab781993c6923975c38af970cd756bcfb81ad66870271f26d58d97f4fdb0ca2e75b5f4086bcf3c1aa6b870e5bd68ff30c7888634acdf7a862d2b3a19fda8feb84f87ef11935df24cd434364c8ede5e77d25f69fe73da9e4d999dae27334c6a5f0ed79545207009587a31ef3fce66c8f6bd1f0c30889c8c28b28c1ae785e19cf74118e98111f0688e529c9e4d5fc8b731a698c5676bffc259e8015af656f52756ecb2ffc1e0a32a1d0a56b1a532a7b943b76143d5237b7b66df360ffa47abeb8472096f582adb8f2ab65f4dbaf4f34abfd826eee40a04476d987278956849c29034e7d81dc0907146298b455845496ecf3682630435cbdb0cab0b0eb41105115b43e992f96659e477c40d3d1a934f791fb98558c48037e744c996318f6fc5de81b1ad78d77d8ddfbe4559e5b75003ed8574a9eabe57f1f22e391ac547e5afb052e4fd3fce7093a689855a013386c91ced0a1e53cae1230774a576d11e4e8b490d64e2320cb817edaa37eadc7a46fe2598fd08ff9ae8918fb58b4c3f04f48bf05cd43de11cf34d11a6493992e3237a97c7d546e1ac79470032a550cddea00603536656b9bec9cddc73f733a28483122918781ef3865962e25ed8af6d283d486becc2c4210acd520ec4d8d396dc7be07d8196eea87488179695b447c65ebac7f2bfc6ab29ddcd79354304f5e5827f2ddc5e9874249d1883f32a42db7551d0759612ba3cbf1371139259fe5d45e4ca595f963630513fd41fa6754bac782f631bc199c7887c7ca14764f1162cfdf534c47f2ff19dd1cde146cdc20aea027f8ffbcd52a76cfb40e78537fbd72f6be82f091cb00e58041374e4d9d3828ccafa6ef9df36ff7eafd77fb2255c3af42d003b20b72249d20e5cee98e7d38eb83fa5e2e5615768825bc94af23b9b7b1cfcb386315e1b257b996ca499dc8aae7e94d7909a62cd059fdfc2883992cea236a4d4a1a377cb181faa43b4e71c5be0d07ebd49aa3de714a87ec1c4b7791a538fb5bb8d25c97a6b91ac3e730c825d62b89ab2d6cee4913984218a0a32ec1a6f55414d1169f3149bf685510a48c29a07139cc93c3a6f0234d516694d6646448f4ce0db0ae21a4ff80f0e3183b7e2a32272d0ae2ebff94ccaa4a11af0caf2b1316906fbe37b613ed44463e2f68cb1cd43715fa8a5a33ee39a1c0d93144e7cb7112c14c32cebcc9b70698d9f9444a9cec72ca5cb40d2731280a0aab786d17bae06ca29c1b48fa3e9c33973dc6eda0cb90d0ab3842d35a5e87e9bbddd8b477c6963d3803aadb4d8e1fce43c432fb192b817b26f91f8599caffa43ee26e64b40de526e7023cdebe14351d5bbc4feef23cd0afdbdcabb8f4557e6b3bc5db5f6d0f5a5b1cf323cee0fd0a38c9555cd8c125e6b4e04d7dc27197c11d25476a3867f2d0074130f6113340791a6c3745530d29075fd02acc1f3205f056a1ce4e102e49865acd52cb55ef8b0cb04e7e6428836360b481b1fa29d5300c03cd04b9d553b839b129045998484e7884ce25cf602fcebac591e9755bfd197572a22982ec1e422576162b5f24b0341a59be3bfeba6247c3fae691b5be8cc3ff92bcf5327a0d0c6d0fdf9f6fe457a87dce6b4c9385f760aef5a62e72d83ad7dd53d17cca8d896b734a04a319c2330ec800f48554a8dd3cd19f0d7bab3bcba89ed4f509cf4c35094538bed27b8f5c062dc9adbfec2f2d39c276785fa722413cd939b344525adb591d83ee8efbe1c1076824c32ebc3803c2f474d05dcefcff5b2e14e5c43ba35ca9ba127023830b3a23580d287501e4661c38d3423402da21ef5f3ce4b0500e76a4d8bc5cb635f310cb9eaf68b284cf575512d063916e3fcaf42e7ad46dd9dffd4c511e44eda4ba3c16f72cf5c18ff245eaa3d22bbd393e0b9d14f2f5326089c1dedbb8492a43db73fdab4d9d62d0e4cae6bdb7f87e1af7a78c75509a6564e394ebb2208355dfdf54df8454d4c8a3e4c59114977f858d7ed5db034aaf892564f50378961bb2388a41966bbe95664707b06b8274889da316a0642cef9c43f80c2c5f4f0b614b4a11d9a7c13c32f5b91a80fc5c3689fc4aba1f4aba0159e314a979a267b15c2cf0caf914c567cd3949f4b49f4d422516f34bba197f956ba144ae6f3f10aa3dd96fea1f90dcafd52b207132537003a3a94091108d61b15997acc63560f52ef6200edaf8f5a99664054f184a9bc0ba30216dd06925a71cffc3ad3b14f0f8d491c257d8dea797a3df396a746d503a0ea75b7522c416e5f36f4ee66f122d41b21a7d806172a4554c243b2f041ef6f7e3dda80b5d4442160470a8fdf4a61311dcec793129197546543064bc23f2c90e16d16d17b2e9728e5a10cc42b07d051fda1f852c6f6a3666f3ca50e7df7b56793000b154b7beb93799e36646d0857eabd6616a747293cfd5a832a726b4b62a7d733f6c45249ae931511e52b335e22d97ecbbe77c71128804f795a3b5bf47891693c57c1dc35ffdf91daa148e70fac32d40ce8ab29426cd6fe0618df9dde88e6aa1f9811d081d89346c05eea9d46466e10624bd1a20637faa1e8a6adb1aa14eefda7873ad26a37aad426f36422f50be24e2ccf6dc12c44a08312ad5791ea01478c790035b1e9a175da425f6944ce57a8951b64448ac04f615645339fbef38f31184f9377a37664fdcb08f3986945fef9c230cb36379ebd00eadf53c5975bfc5fbd331dbbd266b402a24d7e9a87fbd9d7ac6c01f219d9c18484bf0e282e30302f11ce2c9187c480586f249db94a139fdff410460f45835abfcc7b31331cdd6ae82b15386ffa6bd23653cf3aa84a8189afd15debbbe66c0ffc6f66a34bf130cc54594bdf4dc492b6c5174176d0ee1d3bdcc069a41da2803d6892be33e1db8dc181ffadf1f2e3ab38cd11281d42af4dd372406dc3ece7ad0660d72e81413440bd76e02d8c77765f337470ffc1a516ed92ec49e70e25b786290e595ed3e2565e921fbfc300d101ae9b6306541d4bc91cba432e6e7c2ae500d0ce9a6c42280e9db54150bbebbaac14dde65d1386c4f2b32f9658736208ba67cbfd08aec59a1c57c88b4aeea7d8e2ea765bc338fba6579964fc8a383cdc101fbdb7ed55611a438ab245347d5baa4761e56351fa70dad8f59321719ba4869bfdf279a7e4647e4af944f3e03c46f59fd8a8a68dc8a1362e2977066285cd1fd440d662680b1eed483d3439caa9b73c439887038c8a869fc02fbfeb3841d340ce549a9f6fcdcf07bfacf3074210637ff3fa7fdd6ae9ee0a6b4653110f7b1eabc19c3fe4779e623cbca2c76e3702b3eefddaa8fef90ea1f0a6bdf2fa0b1c53a94e4bdcebe816bc0f3f60cd37522775a7ee09c21fd7de83aac6146efc942d9be6d99bc143724c93760d7f369f0c9caed68ed762ae9484cd301d42ec0eb41056be67981c67f643ca865cecc35d4f35496a9cc8c0987da922257460ec21179577ddaab3255e8c468a7776788a8ce09cc3c7d8c4d2de96df192b93d74d011db48bc5423678839543dd3eeac624a457ea4a97a88f7c0c27611183107f89fd6f634fa227e4aa5c059acd1e7b572f478f179e6d7e0fd7dc5435a459461782a93d3380760f6e8a60dcdd7a090d47458203a871721e73598080d4a2e673e722182f9105e9f8879d207efeec91d1a7200ccb4b6ffd595297489d2a42ea483c5c893dadc945ec055af62ccaf52d3b69be5130e17ce6f7dc2aac83c1e9e95fbd1c1b82c330890751939acf1881cbacbe3e9446f5d115da096f5773059ddf3069a93fdc9e57734a1c768f9fedb0875c991c55c1be8e0adbfc16a4dfd6a8ad4aebaebcde8317e31eeefa7343648ec083911d0697a66af43804f5a5586be57bcef5abe11c528f9bcf5c3727aa5b624a42a640e13460b6471e15baf3e77425122ebc52cf1cdcde1857e93bf3de86202ac78505eab29b35603ad7598e637ca4316a2120f95c92bc1a0a0c35031d2049f7438309df40845a98be5cbfca104aa98450affd202ff18689ea26f7514c35e2e6f5dc4050b2a99c26a2a16cfe2796f777e9c96cec655b779ec28376775f04b880792c69b904c3097ded3217b73b1e87814ff0b6db973278b8cebb172ce285078d55de5245695a63f8db72a007c56a731fac2cabc9939f1de97c9df6f89490b3d80baeae573cbe7abd0688b5fc2e92c69472efc7f91dcf6758e80448db6e931a46c58d1df8ddbfc9f3a9fc05838ef7345a981cfa546e9ae9547870a5766181012e78af1b93a4ae618629e916c29b2947426282c9e5bd4554f9ec6fc82cd50b582121b3fd426ebba52c082c70596317552bd99b039d5488a731812b2bcfbb74d8c128131fababd8cef2ca8ee5143b02102bdabe43829accc679562a1c719a73526388f3832fe25433477de87b301fc3add8347bbc6a0e6b495881a08816e90d8cfe0687b00b27531dcd441575990208d96f16968e3afd9a148831b0166887cbbdb215ef125d542387b0183324794bf9b3b742a4790f0bedee43b6788d4a0dc7f065b3cb99ccbe69adb918869158fb7fe44550fc60355c989cdb83841a0ed69427873a4e0b355d11b50779e70cdc438b6697c59d7a4d6282060dc039db137376cb6fab697652f071d18451405528683d42d0e35bde063436610c9b83403886f4a33d32fb427d2bc47b6d83efcb0c34c348d4a76f747d312dc75a8e3a2b8c600de9b3c54a99f95959053c799761af414f7d72d687518a17f35151b38a2f7300c7a1828bce1f683539fad91963d767ce11364076e2702febe2728b302fa6e0f5357ccb65cbfcee3223d033c0feec7194d2357e1835abe02bcf4fc61cd15e353ddb97aba5879f55ef845dc0ac4466034fb70dc465356b5d06344ca1f5d994e2db847ea9c82901d1d5fc728aa49dfdd7b01f227c3682897eb27ba11cf8f2d4e6cee3ca7d9d130d68aa529340d35b311f69cbdfcafa853828b52891a7813082e5a2aeb6ba6e2a4c8532814cd10284bf157926e2ab62776392d98c8d51a724d15f6e0d37bb6a2e5f3ccec42c8f040e94a4d872787ba0dde616c4b137868d9ba328725b9f846ad2f3e5b24bc48fd4241265f317a8361a732dca1cca4ab281dad932a3c3c132dea8fb2179ef7fda14826b2d27bb190fa893e098a7bf1a91acba0049ab0b8248f2d390878a705625d1feccc46d609db04e36b54a14088f6c421d216d2349f6bb8e5ba7036cb058661fc56eb768ad2af783b2ded66d9f026b996cdbd1d03b132261ed3be27e13b1a396355e10b35458248c21b4eea297b8f7fa9ffa412d6589d1b7f1a8809e701d15017085ce993e97459a41a51eef2ee6ae8d987a710da66d103852b300ceb108f180eb0d9b057fabd7fc7de2513523c9a61cddc5b0fc48a8be921907d220e57bc15c79856e6cdaffcd4be90d0161229ff97da22f1d534edd5c7c8dc2097b8cd149d88c150796c6bd8d6216c58cf9b0a0313a470a8b4b0b2e86780f395abb2c0c5a193a18284d531bdcd2ada136643ecd434a396af454f3dd1afcb71f2d7cd29892b72754a8ad0a09eecadfb70247f8440d7d3824090c283b741f28666ee5e3d99cb1b39cdf7043e5d831864144720604bfbadea69105f683fb8af36e6198c0f18a0f76c0e2262b86b50118522e6c04e1161f8cd8bfe740c374b81c2a04915c9094652ca3f397c1fa09c237891e4a5bdccfbd57fd57ef4d1dd5cb5fb7e8bc0ea73484bdd7350b6b121b7624c288464d601e46916ac705d8120b1ef3f85e34dc41da9a1728c13f1523e61506345c1b1f7b8a5b0932d4438ea80262fe2c1f97e9814bbdb939e55d887f2ab240194c17bffea661f75d2751b4e9e63ec64decad853dfcb2a2b0dde23d036ed5a13c56b0a695261e7bb201958c831ee7c0a056d0ce8a2f92c4cae950678b9fa8fd8eb02c2b8cd7ca9b44e8c06ea2527cb937e58f43684f7e4971d1596ca61ad033a06dd0f89ec1744e5d82f90ee24c64fde38cd865c14c2c1c6da8a7e42d8a5e357cf2bfb50342619db4afa408294033a1b8265e5a03155515bdb02d9b972d46bca21d41cdf078625caf26dd5e6ccd068660315bcfa388060a4d8f773893a221f9b1755e15257db16e55c0a1a2555a084bcedaf808332d19b3b5db2d3674e696733dea41f8426947f3fb14b6cb6745f50fa589b3c3fdd220fb3e3136eec8a5203e2298e1a4a4d7eedaf88cf94bc3da7e17d18bbbc1a74c0e42b16d83a2001d463757592609e96d3655226044abc468b2d3626c1f2a062a10684f103328239c46e3d1c9ed23d40a30e174fe6cf125d16a9a97653eeebc20861651b2ecea0f7dc8db31fa7d365a46d2461442378e1afe275efffa8550fe1c65d142945a904e319dd82aa52a8b543d7762c83998922ffe91ca2acd59c79a9a63d51ee19199b11ff23af5edf9918568f121e8eaa482479fddf33661be4378bbab0a9864fd28220356c1f4d37af07ddf411986da0f3eeff2a8e89c72234bf748cf1eb1d95b3f7419a281d9843809fb6acaa4ef238207439e8d0e7e7ccb41a11a5f0f4a40f82ca6bd151c93ea6314f2e04"
+    value: str | PublicKey | Sig
+    if name.startswith("hex_"):
+        value = _span(name.removeprefix("hex_")).hex()
+    elif name == "pub_key":
+        value = PublicKey.from_buffer(_span(name))
+    else:
+        value = Sig.from_buffer(_span(name))
+    # L'attribut du module est créé : __getattr__ n'est plus appelé pour ce nom.
+    globals()[name] = value
+    return value
 
-hex_sig_4 = "386617e2d64edd0501bb0dbe0e2b84b0f0e20952d888c7f26de19ea05f6f89c9f42346553db229b46cc78c1b6dd8a81e1da0bd801781ef013bdcdca457cfa5da1f7855277db49f49c267d2a997670e159dfdf68f761bba9ac28c6ed33e51e8a9ab32c3edb55306861fb0f65308600a97ede5284ea843334e987250d6f73c6188d4f1a9275820e01deff95051025dd10a51d053deaad5be424b714a1dcbca90c81841a512a85fa02e42f8f0f5ee4dd07d3286ea39c00f6acee15ba16c8ebc8bd47d05f99ddd95cb7aa64b02bec93ce9d5743aba7223babbacc20a10c78c37bf0daeac589aad857fd20c3e8262158e1ebbff0f5574f0ad81cee46ddc0a4c43490c2a2ccc705cc90f2192ca9f9ab63dd6093f2d467247c9df0d232f4d661181c2cbd35a3ca54d10f6e66d1b0683c89b3aa22a60f026428e246ce587b52c0cda82b54980a30b4ef963ae8ce60b9f42c1a0f6441c2590110a6dbe61b69407b65579213d2c560f7fa5d34885cb4ef8a1a81b7a20e6aede9a6af083ea02f1394d89ce880e1cfb892670cae1e52076939ed984fb4824eeed5eb8353565b8f01ac08646aa360d33352bc1ea39c76bdf86d2de09dd610cf2943e92d18f6f228cd3af70a510cfdb7b086637c4884afbfeedb94bd1fd047f3bf901fc6d19e33a9791431ce6c325cc5bf9d8c4066516a277fb53ab0afa9c40a9d62cb3570ba15c83a8cee0ca5e5215d097970d53fe6ee29ffd1a5e08ddfa2b51ab204ff9b68e7c4077369be4e82159e709b45f284be88091b85a4d0c0b2309ff1364575b46d341e3df79abd7d7689d09be6dc0a24847e1d65e6471ed03f63bcfeb6122ed060d296a17114d52f8742f2642c541fdfcaf7e1fcf65187c6755b506c4ac0ff401892d64eafc4068bfcd0576b490b9ae4796d9faa27b2c1bc3d75787a42f285c243b87d8f8bf3b6bf99651d1313b566d9b025962b54a8a620fecea94bfa95f26d42339faff9a090fbf96b9e7571cfbf94ece27fe864d07cb9c83748fddf5816245186b51a7d13d69b4ed453c36738c7a8cbaec31191e15c4253578012aa7c1933dc478550c4427ef40834d44724adc591680e0ccfd53afca856696c615d3975411e4ebf0b6179ae2b947ccac162615645dd8176f922f84ac7b5901b7a4e66a87cdeb3436d08d81236eb272ff3634b306cd5bcd08c4ff04dc478b22de27bda30e59bf2e0bd9fab971fad98fc37ba2d13233bf0228e697ae74388456421b00c2b1623a3950eb8e047b9e3a2f032a56d1e409c06c44238e74a48cf1aad50c2941ea20d1f8fd9ee7d11bd99689de8178031ccbacba54ccd187a3e90ec32dc98bffc71f8e1c5c56efebb1a1c8e8df24f9f4ee53ba89d0921e979d7b46a5cc9bf5c9a893490f81a728d814df0ab0ed4cb810263be5269c828c81a9cef4e8f6359c96857e2f3c683416b42d2313ec3ef9b2b434f882bc898b8c713e2f0ccbf0e874a9d10cc787d4d0c3bbd3fca32acc14457c846c0546ddb62ce387c96276fb602b155c0b7ee18a553bb6048805a8fc60efd81b4fb45b82070e27ccf90286a2468fe50dcd4cf1751feed19c6f33b6931b799e785f07e387caaff7e6a81553a547a37a021ddcd37b73c46272a33c1aea53e6d19bc9b444cfaf35b80510850ff3645a7a0ee12b0f94b0af94e99012a9a1a8f6c21790e61d6cad5f92dd2635ee6e478d769a1e1700957936dd528af64f00f1a6fb637a8f37c6049cd66ce18bc4791bdb281241db6b8dee5db0fede38f122fd12c9cc0f52081f6852494c30e7937ef7c10549ecfa42fdf82869d57d60c04062278908d17301a23175668a367ce1780213a0d6ab928bf2dc52af8b56101dce192392fc55f4a7a9f8177012e8e1106ba49ca0729844d72612980332939495a129dea4b574e4fe6b83cbe326a8e785afc9d6b7f99d96e598153368119c1c04131dfc4b19cf3074509ab55813f0c6c58065f56e2934c9334e1de7a6473bd535bd9ecdd8ade20215b062529e0da63148a40f8afc4e5725674686f6674df3f62ec758f8e6f41b253fd730ae813a447947f2007146c31da6db1dce482f8bea49d52fbe1da559982abc87b9d6d8e3f7297db878be4c472bef2f92ee0faa98b5cbd826ae388aecc05ad2c4b0fbb49cdb8fb2f0495e983145fce1cd549a0266027b62b0eab9f3d5e8540a562efa3a471f8c8436225b38d96640f5693ce65b32597d5c35a0635c3ab83123242853f626bf19225f71cdc1d6972ade904f15d44a609e53abbf0d879d66b9cfacdea10fa01fbb0ea14baa8537b3b774d92c03ccbbff66027f47b1125149ddf4576e51f5d9140a9e54752820db660dc1acecd20d182d05c8c49b357d1097e32d9b614157bbb45d4709cc82199011961829827bea3c858948d7ea4a5a7eb4e23dbb576023875ed8369b011d9198cbf80e87654db93a42d5d220304eebbc8240e20c3a608684d281aeb7af734539f9bac56b4b1633409d98e85347d535714a797da24d380e32a072444b7235e89fb52c6578d3a53a93bbc3f3ee4f822e46950f588ddb6472aee094fb0919740278ec7394e5fb5c369a9f60112ef826ada6efe89347d8371f04b6dd81dd62abc95b02c5a973425f53703d2df62471d46ed78dae8e15310b99edcdfd5dd37439d5d216a316fac18cbf11533cd64741f05038f853e84d8cdf2d9ed4e4d3b55bc6300971ffb0bcb66de5d5cac42bc0803cd2978ca099df182a4bb81289693d56e78b2061630c53e270366c639ada4a15b64e331dd5b1d45a313a9503641749bfb84011c7e9b8ee815cede252ddb14dc9bc4f842d2ec83366eb559b16a7c984c518f5c2b70ce251da56a42f71add96957e1c96ce3ce0dba9b182a8a95a782b21f9051c07fd8033e81d6a32568998daf7278f4fd48319115c36fb1286a55c9f90f6df7fc1d2f05e4168f8d55784e8ceb00715292269a4493e68a750a9fd343926db5231add4cf511c276869b51025f75c89e71ed88f0ae2be48f40be02433bcdf72cf67dfeb3681d617a81ac304c5e7521539be45b20e9454743cee2c97dad154fd70fd9bac673f8e9c4c87dda75efa39ee47707c51685d22f7669831ec96924c3d7ec35bd9b2848bc2a086e85c8563927258640ee4ca7720351739f7f39581a7a6a89de5553b153205e33d2da3d33813ef5e148788eec2b9be2a2b222d9227ae0e59cc79d4863eddac1b4a2d6ae6b01478e36602b4386e3775063d32d69f365261e6d1247508b4458f058fa45c9630c2156d45ef4ad1c3ad5b530750ac024bae98e620e31ec0873ef2d270db286e4915da882be1dcc3e3fef0b8424a99a9a03276b49a73e84d36b55d761b948b8c76714f411d5df23db7740bd8b91b16e41f0e8d3f268f875083c35582bfe2645d681666f86cfcb77cee63e6b99ea3cfa6cd092a2b54b2909fd66992164616999bb7436b651da8b2605a98a07cb412a01083d4c90590d157a9285e25223a99f26d628acdb8414cfd33b54452b963eb0e479b7a783cc9240fbb4683fe527b63bb439ac212801522f8ee16ab2798d8e38f7881867ccf93314319d47f8f4db86857454b567e16fd661f3e006bd0020a35829035afd2b8df50d336e31100d05ca664098a7cae586064b39abec289aa905271d434e9af6e7fcfc3241be5a060a811bc300eee953654dac293a669c739e55981ddd682711f6fce21b86f4bb8673a301c513621675338e535fb1537deb913811a47e98be7033d4d60626b848745dbe7c4e1ddd7510de0375b7265ac08ad024de1349ca6c78a1ab506885f03698fe8b87da11b42db91f12bccd5ab6e4e901de75a701910939df4d9fdbe8bc85567c77d30e8452326c1d39972756a3804c12516b75576364bb43b39bc4d368e270aec587b5a308601b79874a28549e2aa4b2270088976f02c27473d232c80b7a002c608bcc81c8268a98432fbc337566c1eb14aeb90404b3e9fced2017b79fc2d9a01eccfc78829fe906371daf4a79963803b78efa67f3a341a2388e75704fa0d324f8c1fa624a3f69db47920abf3d3d53d837d380d15a75b7b5f136dc7f20b4f5c40897996059446e45b55bbe6985e80857a45bbaa55f1fd271d90f502dfa94172a511c1bf48f28942ad32c83f19a68e114e7488f187f5e3d0332e7c21aee90aa22d4e0bcf119e5e0a51cbdb840cf6437aac7775878fd89575bc2f993ec5e9ea17e502e8d10c8de3f8a1248e51f51d8c420e98e6a96401545959a77683a85cf88b91a6d4c9c7a1837e00d6c586a6ba015656492471d41b750013f31502b5b338169547826942f388e83671dc01bd4da4bc2756f5696af5f10b16a529d1fcc765454ea0e5bfdee13cc9e9c3798371d8f39a6ef6098edd3294a300ca09efa481292fe39015e1f2c3cf1949eef798ced87f985603669d38e44c4eea3c69e0c3711e9313d3d5cfd9588f710df4e7db6833cd0d54ab7d557cee39e8ef7fc68af44302b06b1c2c71d7c5881a43a69552e24df48fe21ee10fa64c5f9892b230f37cb02a89263016f7f4c1473d46cab4ef5050a66b09e5a0def8a2bb54bb56b2e0cce8b61f081a9abdae7f72657805b15b83437a7dca852dbebb67cc06be91db1ceffcc05fd8f661afcb06a0869a0ce6f64afe48f76e63838e7340028d972a00853a34a6a9d075755c886e3524f1aaae1f109ac981824e83938827c739f5d8b82728e7d57924169eca1d929616ee5543e2cfb89a59596234ef318b0084b63199dd90ce380b89042fdc8093d94b11e232cbbe1e931c45cf5f24a4cc0eaf80ff4d8082ea106cdc64c4e613624481ea23007eebcc1eb40b61e7d7608e33f7f65f6178fcb926bd199415299805ac2eeec134057ebadf2eb8585c94c2fa210e745ad00d934220486ed7645e3c6d4f9bc4dcb2ae15a49178117192882d0f9e39cf2220bcd5c39422a05ae219cde30973f693291bb769c64a02dba8e420a699f65928abd6a742a7a7527dcb21777d7bae8a4df10dddb752fef8a1c636781c984da5a244d5ac66e72971f76041c1b3ac62bea0318ea9613d6ffb4880800c49ac2ca1ef99f13a61ed76a872f3d6ad465523a63ac73f587019cda67685cf7c1438a8bf1e51d55ebc11e11542b2e5fc4fd24c378ae647ccc62b0e418c66cb76232e69c9a4d2f65bb536e0fa9577f8677ec326d761d4fafbc943b961329cde5131224c2be197601b4b671c53df558a80a9ca07736433f4f2cce7f83ed5d6abf383609a895aa831695c6395ddd74bfca1b97181fdc0313bd8356abc2f0bccbbead6a04c4502d944b8fe332715633e8e551df8688d3b38a1802e6e8bd59798d867cd703fd517f861c33c6fe51c64744f775fd362fa9ae85a417cc8a18df3412473216243b4d8b9eca3ae50f70e9aa5496ecf3682630435cbdb0cab0b0eb41105115b43e992f96659e477c40d3d1a915b28f0c43bca5605d51b82ac29a8263bfd716cb0f5f4a23e7f72b6205157ad2003ed8574a9eabe57f1f22e391ac547e5afb052e4fd3fce7093a689855a013381a27fd3e9e69db63ce7cc74a2c9e142e6bd22d65837abcaec90ac476e3dc0eba6fe2598fd08ff9ae8918fb58b4c3f04f48bf05cd43de11cf34d11a6493992e328367fd9b87e5fe1bb3c2f361632c66ae62b61758907d724d9da366edb3d6e504f68c9e3a9ce534ff3dffc5e117e3642edc25be101c065fe1ecfd8302422bfdc9ca53908ecc1252cfe0cf0903978167f0f83cb5e742eed2f7b1828fd9c31cc997cce4889486f0e6f69e0b87659a3da60863edc471bcebf6841c3b9c224ae15556467e6766da2a8bac1e66fdaa1014112174a3efe98dace6d4d4753372e7e4fbf24c47f2ff19dd1cde146cdc20aea027f8ffbcd52a76cfb40e78537fbd72f6be821dcfb8236ced40ee3450a52481b62b7290dbf02c21c4fc92eddbbf9f0bce4b39b20b72249d20e5cee98e7d38eb83fa5e2e5615768825bc94af23b9b7b1cfcb386315e1b257b996ca499dc8aae7e94d7909a62cd059fdfc2883992cea236a4d4a1a377cb181faa43b4e71c5be0d07ebd49aa3de714a87ec1c4b7791a538fb5bb85ec3433b583ba33d8c2dfbb611402484870af41c93f881cb50c8a994a03535dd169f3149bf685510a48c29a07139cc93c3a6f0234d516694d6646448f4ce0db0ae21a4ff80f0e3183b7e2a32272d0ae2ebff94ccaa4a11af0caf2b1316906fbef5928afdeb65955704f51e89fab939e291930327894a3fe090e2d66744fc9f7039aeeefbc7deb510d9276269c1bb1ae1e0d7e25cb7570d1783f9ea01cfa1a16348fa3e9c33973dc6eda0cb90d0ab3842d35a5e87e9bbddd8b477c6963d3803aadb4d8e1fce43c432fb192b817b26f91f8599caffa43ee26e64b40de526e7023cb10812f04ecb72448b7f54783fe5cf7f3df18d4f627d3791b9599e4a81e6fd8f4da97827255d3f9c27ffed253d3f812e93858ef5571ec741a976ec6e21258513113340791a6c3745530d29075fd02acc1f3205f056a1ce4e102e49865acd52cb55ef8b0cb04e7e6428836360b481b1fa29d5300c03cd04b9d553b839b129045998484e7884ce25cf602fcebac591e9755bfd197572a22982ec1e422576162b5f24b0341a59be3bfeba6247c3fae691b5be8cc3ff92bcf5327a0d0c6d0fdf9f6fe457a87dce6b4c9385f760aef5a62e72d83ad7dd53d17cca8d896b734a04a319c2330ec800f48554a8dd3cd19f0d7bab3bcba89ed4f509cf4c35094538bed27b8f5c062dc9adbfec2f2d39c276785fa722413cd939b344525adb591d83ee8efbce9785b3bade91c5d51485822190618c4e33675792fcc8976fd5f0453b2aa7fdbac4eddb6c50517eedf172d0b73d110a809c79dba946d067b6e898f55afba000e4debdf1a24fc573ea4d9658936ae34be6ae7247bba099b8be154c89e4dd365b456ad3a83c229835fa4f01af5e96bf3c3fe5f411636d344bb5973f35900f644b35f69ace808bc886588ee03f2075134f0f1812348a5ab003a8860d9efa8c2aa2df54df8454d4c8a3e4c59114977f858d7ed5db034aaf892564f50378961bb2388a41966bbe95664707b06b8274889da316a0642cef9c43f80c2c5f4f0b614b4a11d9a7c13c32f5b91a80fc5c3689fc4aba1f4aba0159e314a979a267b15c2cf0661e882f7601c1c91a6208b8349dd4fef64e1524e9cd3d8817c533b43bc3aaa5f10e2c9ae730030e3e32f396730863e8f8e0dcdf222da78f89ffaa51a3f45c34daf8f5a99664054f184a9bc0ba30216dd06925a71cffc3ad3b14f0f8d491c25704694f1e602381ef3f9b0fad7b46bf4fadc1d8ed791eb7fdc7d8e30855fe63753f35422e8efe0edcf09e35431872605e944aeb9b6cc6e3988066ec7ff50a015729197546543064bc23f2c90e16d16d17b2e9728e5a10cc42b07d051fda1f852c392b02aa8f7a941e06aee5dc09dd75c7568fb6d6daabd18e6605cdbb89ac6bec7293cfd5a832a726b4b62a7d733f6c45249ae931511e52b335e22d97ecbbe77c5e1bfed03c05fbd375408ebecc5fc23358d727d5275bdf91dec6e065578f59ca9a3900cccfad87047dd34e4ecb421acaf690280243982a683617d5856af33a5320637faa1e8a6adb1aa14eefda7873ad26a37aad426f36422f50be24e2ccf6dcd561d2d9db941ff8e75b2453ce703841a58b650592d2acb1987112ee0e53c282ac04f615645339fbef38f31184f9377a37664fdcb08f3986945fef9c230cb36379ebd00eadf53c5975bfc5fbd331dbbd266b402a24d7e9a87fbd9d7ac6c01f215e841c8b6f1b53938b4a431231d45e605cbd2c5e86cc9090e972a52a12a844e8ec1eb91b8452a4cec986837d9efd6fa9ceb73b72af3c7d0bdf9b82a89edaaff105ea65f45911a84378358024ef57d6c10e4ca25d2893bdeed3d8d9ce8f270e521e6a433c45a6f72ecd81ffd1b4bfe555423ea359474691af024f4e088bd2675d7ad0660d72e81413440bd76e02d8c77765f337470ffc1a516ed92ec49e70e25b2760b57a38c5922c37ed3b5c19a07eb5bdb931f0f5a86a1daa6066fd68b4bdd59572c173db28672b278f954724812a2e77b037def67d65a8354d7c50275c98c5a67cbfd08aec59a1c57c88b4aeea7d8e2ea765bc338fba6579964fc8a383cdc1760a141725a548b40b34162a0d810a3e00f92cd6408584eb81a8b0f2be18b6a4aeaba28b3ac503007862c6f0b8a603f7e37074fbe89e92da8dc9c900c512a125440d662680b1eed483d3439caa9b73c439887038c8a869fc02fbfeb3841d340ce549a9f6fcdcf07bfacf3074210637ff3fa7fdd6ae9ee0a6b4653110f7b1eabc8b2d1d5f10f2c52d64983334f23255d4ca50b9269063adcb0151f28727f7ac8fe4bdcebe816bc0f3f60cd37522775a7ee09c21fd7de83aac6146efc942d9be6d3b222cf002759ba7bfd10226fc1de1030f633ce214cc01c9b084ab7217916e6a7981c67f643ca865cecc35d4f35496a9cc8c0987da922257460ec21179577dda1725d044e1d8d908b2238f9e8dc58e90137979ee7666cb6e6577c23cee3aa53922a6d8229f5871d69d002adb2e157da04f843d75c7c811577a58b0d2c375836dfaf6f0b85ae1d7c7875336085d4f00f411471b4bb5ff5e5379945280b02f73700b251539c27607694c2eb663db456a9c13c40a043f50979a068341d7e0968afd631da33030b0fb02d92df4d44690738c976c5682dc8757fa600a18b5b48d5b75b564e5a71ac120baa36083b3df40d6902d08e4edb5e2e9eec299cebfd4e575bc9a9acb69817a6b2971b843ee4159e0ef60769af092d6938933cd841ef73064b3a1c768f9fedb0875c991c55c1be8e0adbfc16a4dfd6a8ad4aebaebcde8317e314de2ba23a5189ee4d6e477f7464dd59e1910bcae491b49df7f085d16b6ee25cbabf8cd8b87d5fa40940becf7c90aafa8f0056daedfa6e0f5856148b99c423326cd6426e661547d1db7b7c6d3964a3ce16284d729252b4dac36f245543a5da7dd8c61da0daf1cb9e5e866b3ea3496ae5082c8f7f0fd0e582596e675a0c654784ea26f7514c35e2e6f5dc4050b2a99c26a2a16cfe2796f777e9c96cec655b779ec0c5f4fb77888d430469f91e1fea079c7b7ba14e380573ab95d96db3663aae226ebb172ce285078d55de5245695a63f8db72a007c56a731fac2cabc9939f1de977fa3f411c886578fb0c51f74b316506bbf8918101889d49662a4883833fd809cca8944de2984b22889fb99d08518151cfeef30d197a9484a32818154a86685b5ef525dcfe8b092070223f7ca22b710cb3c795c5987731fc27b4d65c62f79473e598c50ddf856dacae055508decf945f6f6ac9bdd20a0f51a1b48bc267092884412b2bcfbb74d8c128131fababd8cef2ca8ee5143b02102bdabe43829accc679562a1c719a73526388f3832fe25433477de87b301fc3add8347bbc6a0e6b49588a6c75f7fded5c996b8ae6875b088af8269cd474dfb55b07bd1a479d0e5c9a8201b0166887cbbdb215ef125d542387b0183324794bf9b3b742a4790f0bedee43b6788d4a0dc7f065b3cb99ccbe69adb918869158fb7fe44550fc60355c989cdb854b0c4f3bf427d3b2accb16c7e83da4e4810a315fbc516ae9f9b6e09464c9ffd8381d02f15ccc3fdeb6a3fc04c3b4864ca5801ce477e8340945d1ae0ffe25a8d99cfe3195d63b11c860eac06cb7599f06a3703959fce9f96511dbebfe45be3e15041ff5830d0d07ac975db54257f2079aaab4f28fb06a59eb223d55e19c1d2deb6d65d8db06bfd770fc4700305c20cf67ff7d742b116190aa527764a8dd3341e02fa6e0f5357ccb65cbfcee3223d033c0feec7194d2357e1835abe02bcf4fc6124e29e9c123b3d50699d25074d21af2f3f1fa40da52a3ac232a6a5fd952a38253f1ef0dfb73321169a32d957f7ec2a6dbf7d400a55d3a84d4ccdf851a01cb64dd10e49370a8959954d7456cb05559c33193e729ae263605a484dc5515b40f78313082e5a2aeb6ba6e2a4c8532814cd10284bf157926e2ab62776392d98c8d51a92d243f9d79c56fee783c5108730336cc6a9a76282778770796cf72e817848779500b09637e5c37d5db706e69a3198b4fb41097a2118a6c38122294b16830fa991debdfe973b611c6f608829d60810b9afa33693ad61ff5690be999069d6b9b4cba0049ab0b8248f2d390878a705625d1feccc46d609db04e36b54a14088f6c421d216d2349f6bb8e5ba7036cb058661fc56eb768ad2af783b2ded66d9f026b996cdbd1d03b132261ed3be27e13b1a396355e10b35458248c21b4eea297b8f7fa9ffa412d6589d1b7f1a8809e701d15017085ce993e97459a41a51eef2ee6ae8848bcf242d50c15c3717d3ca6a9c98634718091cb17d95df002153b140863378cddc5b0fc48a8be921907d220e57bc15c79856e6cdaffcd4be90d0161229ff97acc234ed9583bcd06ee6a4bd36313881244154e73483dcdfcd1f478175971c35a470a8b4b0b2e86780f395abb2c0c5a193a18284d531bdcd2ada136643ecd4345fe8d2bc49762d22c6703f6da6bfbc257faf7066566cb8281d34acb0db198f325022fd85c20059f287997911333321edbbf458551927f8812fa6edda6cbe45a0adea69105f683fb8af36e6198c0f18a0f76c0e2262b86b50118522e6c04e11610446b8aca0460f68c662f82d159f9e2729766fb9d7d93c96f67baa6b0d0b05fb30b0b547600556a39ddc3bd526e74adc3af75b7cb78f450b5928fb1dc27e4300cb00cd58bf29fb929079fefc3b8e77d1a88107ce35724d48d8757ed20b4da1f9b0932d4438ea80262fe2c1f97e9814bbdb939e55d887f2ab240194c17bffea661f75d2751b4e9e63ec64decad853dfcb2a2b0dde23d036ed5a13c56b0a695261e7bb201958c831ee7c0a056d0ce8a2f92c4cae950678b9fa8fd8eb02c2b8cd7c0993df96a7545d41fe38725bd2b9f17f88677eb19ff0059396965b3115d7ee9744e5d82f90ee24c64fde38cd865c14c2c1c6da8a7e42d8a5e357cf2bfb50342619db4afa408294033a1b8265e5a03155515bdb02d9b972d46bca21d41cdf078625caf26dd5e6ccd068660315bcfa388060a4d8f773893a221f9b1755e15257db16e55c0a1a2555a084bcedaf808332d19b3b5db2d3674e696733dea41f8426947f3fb14b6cb6745f50fa589b3c3fdd220fb3e3136eec8a5203e2298e1a4a4d7eedaf88cf94bc3da7e17d18bbbc1a74c0e42b16d83a2001d463757592609e96d3db6f53fa7682174a7273f0072dc071060af8b3ba810f4edb45d2611a3bc7f6e70e174fe6cf125d16a9a97653eeebc20861651b2ecea0f7dc8db31fa7d365a46d2461442378e1afe275efffa8550fe1c65d142945a904e319dd82aa52a8b543d7762c83998922ffe91ca2acd59c79a9a63d51ee19199b11ff23af5edf9918568f220a0586a769433c623ea047c627130682ca8e58adb187fe7ea32ecd8dc0507a11986da0f3eeff2a8e89c72234bf748cf1eb1d95b3f7419a281d9843809fb6acaa4ef238207439e8d0e7e7ccb41a11a5f0f4a40f82ca6bd151c93ea6314f2e04"
 
-hex_sig_5 = "5a408528b64f893f4d8ae48cab2b8c75ff6bf65c662fccbcae1adaadd2bff935f42346553db229b46cc78c1b6dd8a81e1da0bd801781ef013bdcdca457cfa5da1f35e09f726ad5640d41d8417c902ef6f633d397c25f6e3afe0d8bef82f827a8ab32c3edb55306861fb0f65308600a97ede5284ea843334e987250d6f73c6188d4f1a9275820e01deff95051025dd10a51d053deaad5be424b714a1dcbca90c8ea65320e8840151bac5394e64746ecc02ef7c25f5bc28b59a120402771daacb17d05f99ddd95cb7aa64b02bec93ce9d5743aba7223babbacc20a10c78c37bf0daeac589aad857fd20c3e8262158e1ebbff0f5574f0ad81cee46ddc0a4c43490c2a2ccc705cc90f2192ca9f9ab63dd6093f2d467247c9df0d232f4d661181c2cbd35a3ca54d10f6e66d1b0683c89b3aa22a60f026428e246ce587b52c0cda82b54980a30b4ef963ae8ce60b9f42c1a0f6441c2590110a6dbe61b69407b65579213d2c560f7fa5d34885cb4ef8a1a81b7a20e6aede9a6af083ea02f1394d89ce887366b25912e16a120fd898832738484afd0136cd6ff10e8e34ca488485948fb19937584085b4b1feae7c25b9f8a36ec8837f6611378b8c1aa8101d93e591a4a95f4e2aa452ce58090643324467a441d7043635c4c8618378b23291066674173d154afc302e83917139809fb244f255f44d086d266788f5543b4c0d8e8a42b6da5215d097970d53fe6ee29ffd1a5e08ddfa2b51ab204ff9b68e7c4077369be4e8d7d2b64b9e22999b87ca2fb5f6fab3aeaa3c88dfce3fcff1dd9dbd053254856700e2d372b87b92e549d97d7c7ad3a5cc96fcc60076cf90e6516f13624af3a8f1742f2642c541fdfcaf7e1fcf65187c6755b506c4ac0ff401892d64eafc4068bfcd0576b490b9ae4796d9faa27b2c1bc3d75787a42f285c243b87d8f8bf3b6bf9d19691f384bde587ab8e889a631a033ae0510862854337eacf108fc210192bba96b9e7571cfbf94ece27fe864d07cb9c83748fddf5816245186b51a7d13d69b43e1011835fb99bb5051797478d2bf2326a6257a88a2ba3078ea723f6f6a4d780834d44724adc591680e0ccfd53afca856696c615d3975411e4ebf0b6179ae2b947ccac162615645dd8176f922f84ac7b5901b7a4e66a87cdeb3436d08d81236eb272ff3634b306cd5bcd08c4ff04dc478b22de27bda30e59bf2e0bd9fab971fad98fc37ba2d13233bf0228e697ae74388456421b00c2b1623a3950eb8e047b9e4caafb02b0c44e5bdb15e781d70c3325d79d01e8d3800489eb43503dd18835f49689de8178031ccbacba54ccd187a3e90ec32dc98bffc71f8e1c5c56efebb1a1ea15d6611bfaba222894ce8b4337db421450a47b2428fbcfbbee801ee0b46e4a0ab0ed4cb810263be5269c828c81a9cef4e8f6359c96857e2f3c683416b42d2313ec3ef9b2b434f882bc898b8c713e2f0ccbf0e874a9d10cc787d4d0c3bbd3fca32acc14457c846c0546ddb62ce387c96276fb602b155c0b7ee18a553bb604880298daecf420143dd16c7ec2e2bf92fd30896e6d079d3033400d81a6ba30584f47f198e27797da288876ae1111ff06f07c5bac35bc7b88c41a11b072a8a7fe013c1aea53e6d19bc9b444cfaf35b80510850ff3645a7a0ee12b0f94b0af94e990a5d5da1ca31d31d715b46c8884e2f99fd1f241f02bf7e2c1d6f152adec7a9ebeabf3ee1195d0ca1f455c518f0db9f8dfbcdfc46bc14c5dc75ebfe331e7195a3001bd7e96d65d6751cae23d3590cac3fe28d525e7b6300fe548b415ecc291320a0b5a157a580e234d23199e4797744264490de492a74c87886b4c441bdf7dbf42101dce192392fc55f4a7a9f8177012e8e1106ba49ca0729844d7261298033293528645fbc05448206a18258ce081b0393c6f6840f9389d990ca8da12edfa26c11c04131dfc4b19cf3074509ab55813f0c6c58065f56e2934c9334e1de7a6473bd535bd9ecdd8ade20215b062529e0da63148a40f8afc4e5725674686f6674df3eba4506f902b8782fa00369615041435fb256504f64fd6200ac21c47f12a04fcf7ac42da832223d4e184d2b16a4de2dd6166afe651a33a5eaaac6bf3a018064bcbd826ae388aecc05ad2c4b0fbb49cdb8fb2f0495e983145fce1cd549a02660232085221437c138313721057b93411aa9ba1408c6177c8aa55dde6d6326276917d5c35a0635c3ab83123242853f626bf19225f71cdc1d6972ade904f15d44a609e53abbf0d879d66b9cfacdea10fa01fbb0ea14baa8537b3b774d92c03ccbbff66027f47b1125149ddf4576e51f5d9140a9e54752820db660dc1acecd20d182da4af5586765283e158a093471a6c2e000c84604bf8fed6440c4693dcbcefd80a8948d7ea4a5a7eb4e23dbb576023875ed8369b011d9198cbf80e87654db93a428a040c145efff9b466fbd56072827da788ed850e2b63ed444e98c12766ff6b1eb197213c7bd9bd09fa4b1c90156e24eb4f3ffc03b3b7e520ae577a20b26814369714fa9548d79fc87be57c766f15c9e3a14b821b4eb2fb6eec44400e8d0247bb4c79dc7d97f6991025d74e32febcc6cdc64581c3ad24a06ea28ee40998ac07b318a9b90540d5525f4bded350c55a73446475dbf0a7c96f6c7f8693ed0ebd61b23cd64741f05038f853e84d8cdf2d9ed4e4d3b55bc6300971ffb0bcb66de5d5ca69b027fe45192e6a28c90eaca8ab776a42bf9149d3d6537e43fc0e81b7d2375cdf84eca5e2bb1015f98bb4bc1408036f348c24f98fe55866fc45e5d85b861fa8ddb14dc9bc4f842d2ec83366eb559b16a7c984c518f5c2b70ce251da56a42f718dd0bf6ce61959a48b3ffafee2de4b78615a50eff1c9eeba0d8f44bf86b92f1780a2cd74b67c69a8b136e7055db59c7e516145b1290004610e6bd6d28a920ae14e8ceb00715292269a4493e68a750a9fd343926db5231add4cf511c276869b51f5bc8a019c582057ce43d791e137f2073755a0f10afec85114d57383759463d9ae427759a57a4f92ccf95df4d09c41330b3d1f0cae0872053ebb10c375201e7975efa39ee47707c51685d22f7669831ec96924c3d7ec35bd9b2848bc2a086e85db21c14d99bc27f58b9258b40376ca8e7ec11c87a069c917da7d86dc9f37ac2df13bdd212afc4c3b683f5b93bd51c0cd409081a4ba06a2025134166e489bb555ae6b01478e36602b4386e3775063d32d69f365261e6d1247508b4458f058fa45b3a3824a710fcdfd46fef850cec5a2ce62c914f7114571af775cd1c110ef733386e4915da882be1dcc3e3fef0b8424a99a9a03276b49a73e84d36b55d761b94851f4934d0ef6d5d70092b33efc7b0f918d5f37612c3519ffac48924cd1ea284b1a5c3210bc85807cc41bd8aab10fd248c0928f7c081e1b83f9ffd1d13021a42b52220d1fd1ab3391a0d65663c2cfc60b0240a6f98ea8eb959c453e421d55f9b6a26cc5518bfd8273522e2ac8bbaa243c4b0915bddcc624116536d9b1d3332d600820ebeccbe79019a24a71481f36a3078785b708e0b635e29235b59251544e8bac3515f59d242621f9c0496d3c8c61a1892aab4cdf5461a7d676bdbcbde83f74802418160f2b81255ad96ce702e20cf07ce73cb207e241b89b53e86ba7ea3342b10638c2a5281f864642b917079b9aa8bb17e0d6d65253ff277b72cb4cae956ebefaad70f41556858b6bee65089ca250f4ad52ce6f35978f2dabe6119fcecbdc4e1ddd7510de0375b7265ac08ad024de1349ca6c78a1ab506885f03698fe8b879ae4cb585affadad19f47c9bb49cb473668d3bb663093e17e67af5429c7d84610e8452326c1d39972756a3804c12516b75576364bb43b39bc4d368e270aec587b5a308601b79874a28549e2aa4b2270088976f02c27473d232c80b7a002c608b9e2ed84d6c0bb21a741844187fe2a86ca3c454ab6dc3f8c97ce25efa357ce831fc78829fe906371daf4a79963803b78efa67f3a341a2388e75704fa0d324f8c1fa624a3f69db47920abf3d3d53d837d380d15a75b7b5f136dc7f20b4f5c40897996059446e45b55bbe6985e80857a45bbaa55f1fd271d90f502dfa94172a511c1bf48f28942ad32c83f19a68e114e7488f187f5e3d0332e7c21aee90aa22d4e022e46274dc3980db883173a54c5d785af472aa2e99da91d143a0111124d1bd598d10c8de3f8a1248e51f51d8c420e98e6a96401545959a77683a85cf88b91a6da552b7f7df1c7cdfc5aec3f0a3937d1ac70107e1a6599bbdef5425b974ec777e26942f388e83671dc01bd4da4bc2756f5696af5f10b16a529d1fcc765454ea0eef094a7094078a5f16ed7df2b3bd70713c520acd14f03d6b64f22deedbbf785d5e1f2c3cf1949eef798ced87f985603669d38e44c4eea3c69e0c3711e9313d3d1a9f74e6a72aa1f295a2036b7a69945aad68a0a4635eb633bb64f814f51f2534c71d7c5881a43a69552e24df48fe21ee10fa64c5f9892b230f37cb02a8926301574e6efa98d8b936b7f6032e697b8e7c870443e3ad1b7aa9b94c105ff38805aa26a0e2923f54dd9d31f4c8c92274674afa16c4e4d573724585cd94d137fcd9761afcb06a0869a0ce6f64afe48f76e63838e7340028d972a00853a34a6a9d0757cda95441e247f81a9e04e99920c175eea5c7f96a94ba62668697d21b82458c63eca1d929616ee5543e2cfb89a59596234ef318b0084b63199dd90ce380b89042fdc8093d94b11e232cbbe1e931c45cf5f24a4cc0eaf80ff4d8082ea106cdc64c7da775f058a454a36f42b717e6ffc77352370c073107644e8e6a7689a088fcf95299805ac2eeec134057ebadf2eb8585c94c2fa210e745ad00d934220486ed76bdaa3b7b94eee2283efb17dc5ad8e75104a74a7936063285b4b7c850dc4d6f1c2c2bbdcfd91fe13e99013d176492c40b6faf818d646c890fda87137520adb32156304664accc926f10e7a23aa79bf61602c8465658b0d8cfda7823fa7296469d64c90ccf565cbb8265944349f31ef6bb27f0762ab781993c6923975c38af970c3d6ad465523a63ac73f587019cda67685cf7c1438a8bf1e51d55ebc11e11542b2e5fc4fd24c378ae647ccc62b0e418c66cb76232e69c9a4d2f65bb536e0fa9577f8677ec326d761d4fafbc943b961329cde5131224c2be197601b4b671c53df5e66c8f6bd1f0c30889c8c28b28c1ae785e19cf74118e98111f0688e529c9e4d5bfca1b97181fdc0313bd8356abc2f0bccbbead6a04c4502d944b8fe332715633e8e551df8688d3b38a1802e6e8bd59798d867cd703fd517f861c33c6fe51c64744f775fd362fa9ae85a417cc8a18df3412473216243b4d8b9eca3ae50f70e9aad807358a4f4a02d5e131b0fb9c4523fc17a73c3136d704b1bd08167ab51d605115b28f0c43bca5605d51b82ac29a8263bfd716cb0f5f4a23e7f72b6205157ad24f2a3804654e192c76c755fa65d383e821e02599770d72b7312e624e5617f2d76c91ced0a1e53cae1230774a576d11e4e8b490d64e2320cb817edaa37eadc7a46fe2598fd08ff9ae8918fb58b4c3f04f48bf05cd43de11cf34d11a6493992e328367fd9b87e5fe1bb3c2f361632c66ae62b61758907d724d9da366edb3d6e504f68c9e3a9ce534ff3dffc5e117e3642edc25be101c065fe1ecfd8302422bfdc9be07d8196eea87488179695b447c65ebac7f2bfc6ab29ddcd79354304f5e5827f2ddc5e9874249d1883f32a42db7551d0759612ba3cbf1371139259fe5d45e4c467e6766da2a8bac1e66fdaa1014112174a3efe98dace6d4d4753372e7e4fbf24c47f2ff19dd1cde146cdc20aea027f8ffbcd52a76cfb40e78537fbd72f6be82f091cb00e58041374e4d9d3828ccafa6ef9df36ff7eafd77fb2255c3af42d003b20b72249d20e5cee98e7d38eb83fa5e2e5615768825bc94af23b9b7b1cfcb389c6267acbdee0c7629fd8631cf85255f599c1e29a21607b809c3416f394f437755a53209e22a7c9b94bf26b8fbac393dd4ba7f19fa95e2f4d25b348aa782a283d25c97a6b91ac3e730c825d62b89ab2d6cee4913984218a0a32ec1a6f55414d1169f3149bf685510a48c29a07139cc93c3a6f0234d516694d6646448f4ce0db053205ed62e5e38966297907934d52d660a078d08fbf8f2b19ae206c58dcde66b37b613ed44463e2f68cb1cd43715fa8a5a33ee39a1c0d93144e7cb7112c14c3239aeeefbc7deb510d9276269c1bb1ae1e0d7e25cb7570d1783f9ea01cfa1a16348fa3e9c33973dc6eda0cb90d0ab3842d35a5e87e9bbddd8b477c6963d3803aa9f050c0963668e982e957640a645b806582274127e8d386b513e943efd243ff6debe14351d5bbc4feef23cd0afdbdcabb8f4557e6b3bc5db5f6d0f5a5b1cf323cee0fd0a38c9555cd8c125e6b4e04d7dc27197c11d25476a3867f2d0074130f6113340791a6c3745530d29075fd02acc1f3205f056a1ce4e102e49865acd52cb55ef8b0cb04e7e6428836360b481b1fa29d5300c03cd04b9d553b839b129045998484e7884ce25cf602fcebac591e9755bfd197572a22982ec1e422576162b5f24b0341a59be3bfeba6247c3fae691b5be8cc3ff92bcf5327a0d0c6d0fdf9f6fe457a87dce6b4c9385f760aef5a62e72d83ad7dd53d17cca8d896b734a04a319c2330ec800f48554a8dd3cd19f0d7bab3bcba89ed4f509cf4c35094538bed27b8f5c062dc9adbfec2f2d39c276785fa722413cd939b344525adb591d83ee8efbe1c1076824c32ebc3803c2f474d05dcefcff5b2e14e5c43ba35ca9ba127023830b3a23580d287501e4661c38d3423402da21ef5f3ce4b0500e76a4d8bc5cb635f310cb9eaf68b284cf575512d063916e3fcaf42e7ad46dd9dffd4c511e44eda4ba3c16f72cf5c18ff245eaa3d22bbd393e0b9d14f2f5326089c1dedbb8492a43db73fdab4d9d62d0e4cae6bdb7f87e1af7a78c75509a6564e394ebb2208355dfdf54df8454d4c8a3e4c59114977f858d7ed5db034aaf892564f50378961bb2388a41966bbe95664707b06b8274889da316a0642cef9c43f80c2c5f4f0b614b4a11d9a7c13c32f5b91a80fc5c3689fc4aba1f4aba0159e314a979a267b15c2cf0661e882f7601c1c91a6208b8349dd4fef64e1524e9cd3d8817c533b43bc3aaa5ea1f90dcafd52b207132537003a3a94091108d61b15997acc63560f52ef6200e4e339d8903cc4539637b0857e38c626f8b8f04e19ac51013d6c112e7bd4c5f6604694f1e602381ef3f9b0fad7b46bf4fadc1d8ed791eb7fdc7d8e30855fe63753f35422e8efe0edcf09e35431872605e944aeb9b6cc6e3988066ec7ff50a015729197546543064bc23f2c90e16d16d17b2e9728e5a10cc42b07d051fda1f852c392b02aa8f7a941e06aee5dc09dd75c7568fb6d6daabd18e6605cdbb89ac6bec29407deff9907ac0f43b4fe46a80a4afee08fa6aae4c8bb4133254874a68549b71128804f795a3b5bf47891693c57c1dc35ffdf91daa148e70fac32d40ce8ab29a3900cccfad87047dd34e4ecb421acaf690280243982a683617d5856af33a5320637faa1e8a6adb1aa14eefda7873ad26a37aad426f36422f50be24e2ccf6dcd561d2d9db941ff8e75b2453ce703841a58b650592d2acb1987112ee0e53c282ac04f615645339fbef38f31184f9377a37664fdcb08f3986945fef9c230cb363ae6b40d8e50bbd0e6486e86c44db63c461bd19fd16145d6769ba57e21cd417be9d9c18484bf0e282e30302f11ce2c9187c480586f249db94a139fdff410460f45835abfcc7b31331cdd6ae82b15386ffa6bd23653cf3aa84a8189afd15debbbe05ea65f45911a84378358024ef57d6c10e4ca25d2893bdeed3d8d9ce8f270e521e6a433c45a6f72ecd81ffd1b4bfe555423ea359474691af024f4e088bd2675d7ad0660d72e81413440bd76e02d8c77765f337470ffc1a516ed92ec49e70e25b2760b57a38c5922c37ed3b5c19a07eb5bdb931f0f5a86a1daa6066fd68b4bdd5500d0ce9a6c42280e9db54150bbebbaac14dde65d1386c4f2b32f9658736208bb1942cc009e9033e0740103888413a317f386948b6539d32874fc1f5bac52d21760a141725a548b40b34162a0d810a3e00f92cd6408584eb81a8b0f2be18b6a4bfdf279a7e4647e4af944f3e03c46f59fd8a8a68dc8a1362e2977066285cd1fdeb03e42c9fe18b60d1e928bbc4c7ed1953f60726946aec760ed461efcffc9233a83955453409f5d75ba8064f7481aed84dd6d66f930c434267db7680f6336bef8b2d1d5f10f2c52d64983334f23255d4ca50b9269063adcb0151f28727f7ac8f9604883eb3fbeff6f1ce2da34a292de035461cf82b81969f193dd5233c13809b99bc143724c93760d7f369f0c9caed68ed762ae9484cd301d42ec0eb41056be68f00d02435937bd4db5424b424c4e4c3090590c67bfdab22bd8b6e720641fb27ab3255e8c468a7776788a8ce09cc3c7d8c4d2de96df192b93d74d011db48bc5423678839543dd3eeac624a457ea4a97a88f7c0c27611183107f89fd6f634fa227e4aa5c059acd1e7b572f478f179e6d7e0fd7dc5435a459461782a93d3380760f6e8a60dcdd7a090d47458203a871721e73598080d4a2e673e722182f9105e9f631da33030b0fb02d92df4d44690738c976c5682dc8757fa600a18b5b48d5b75b564e5a71ac120baa36083b3df40d6902d08e4edb5e2e9eec299cebfd4e575bc751939acf1881cbacbe3e9446f5d115da096f5773059ddf3069a93fdc9e57734d839a701daf0ecd18f992cff17e2f4a8d64159e519c4268df3a8e6b541b006164de2ba23a5189ee4d6e477f7464dd59e1910bcae491b49df7f085d16b6ee25cbf5c3727aa5b624a42a640e13460b6471e15baf3e77425122ebc52cf1cdcde185cd6426e661547d1db7b7c6d3964a3ce16284d729252b4dac36f245543a5da7dda0c35031d2049f7438309df40845a98be5cbfca104aa98450affd202ff18689ed2c71e570f91d203d98cc6173061d72f1aedfecd0681d817d2cc6e2a2b1b29490c5f4fb77888d430469f91e1fea079c7b7ba14e380573ab95d96db3663aae226ebb172ce285078d55de5245695a63f8db72a007c56a731fac2cabc9939f1de97c9df6f89490b3d80baeae573cbe7abd0688b5fc2e92c69472efc7f91dcf6758eca8944de2984b22889fb99d08518151cfeef30d197a9484a32818154a86685b5ef525dcfe8b092070223f7ca22b710cb3c795c5987731fc27b4d65c62f79473ec6fc82cd50b582121b3fd426ebba52c082c70596317552bd99b039d5488a731812b2bcfbb74d8c128131fababd8cef2ca8ee5143b02102bdabe43829accc67958d926f0cb69d7d016c8cb3223d66bb2f724d9857ca8080028530109765e0370ba6c75f7fded5c996b8ae6875b088af8269cd474dfb55b07bd1a479d0e5c9a820aa3d427f4415e7a47c99badcd3cb307d8e5dd453677a6077d1e47ddef160957b5642315e79d9cae1c9692860982840cb8e9b12b5e4bfae9b4531fbe5d8053c993841a0ed69427873a4e0b355d11b50779e70cdc438b6697c59d7a4d6282060dc039db137376cb6fab697652f071d18451405528683d42d0e35bde063436610c9b83403886f4a33d32fb427d2bc47b6d83efcb0c34c348d4a76f747d312dc75a85041ff5830d0d07ac975db54257f2079aaab4f28fb06a59eb223d55e19c1d2de38a2f7300c7a1828bce1f683539fad91963d767ce11364076e2702febe2728b302fa6e0f5357ccb65cbfcee3223d033c0feec7194d2357e1835abe02bcf4fc61cd15e353ddb97aba5879f55ef845dc0ac4466034fb70dc465356b5d06344ca1f3f1ef0dfb73321169a32d957f7ec2a6dbf7d400a55d3a84d4ccdf851a01cb64d8f2d4e6cee3ca7d9d130d68aa529340d35b311f69cbdfcafa853828b52891a7813082e5a2aeb6ba6e2a4c8532814cd10284bf157926e2ab62776392d98c8d51a92d243f9d79c56fee783c5108730336cc6a9a76282778770796cf72e81784877d9ba328725b9f846ad2f3e5b24bc48fd4241265f317a8361a732dca1cca4ab281dad932a3c3c132dea8fb2179ef7fda14826b2d27bb190fa893e098a7bf1a91af0e648ac4e232ac606b322a7896038be2769671ad4e4d7958bd48e513ebb66e621d216d2349f6bb8e5ba7036cb058661fc56eb768ad2af783b2ded66d9f026b996cdbd1d03b132261ed3be27e13b1a396355e10b35458248c21b4eea297b8f7fc44cd6518e6db7774deac5b48c37923f8b9fc251b7137838b77f5978e046faed848bcf242d50c15c3717d3ca6a9c98634718091cb17d95df002153b140863378cddc5b0fc48a8be921907d220e57bc15c79856e6cdaffcd4be90d0161229ff97acc234ed9583bcd06ee6a4bd36313881244154e73483dcdfcd1f478175971c35a470a8b4b0b2e86780f395abb2c0c5a193a18284d531bdcd2ada136643ecd434a396af454f3dd1afcb71f2d7cd29892b72754a8ad0a09eecadfb70247f8440d7d3824090c283b741f28666ee5e3d99cb1b39cdf7043e5d831864144720604bfb34431d0faf72a4c372eeb2e089f95db6c5a2a69c49b2ab3d2e279a2d01d3bd1c0446b8aca0460f68c662f82d159f9e2729766fb9d7d93c96f67baa6b0d0b05fbd57fd57ef4d1dd5cb5fb7e8bc0ea73484bdd7350b6b121b7624c288464d601e4cb00cd58bf29fb929079fefc3b8e77d1a88107ce35724d48d8757ed20b4da1f93dc598835a6c06064b8526fd6b4f4a39615abc0ebbe9c2db107e9f132c9c26ac1f75d2751b4e9e63ec64decad853dfcb2a2b0dde23d036ed5a13c56b0a695261a9d0b34f332e01245aebcc7e5f37d01ca175428638e738cc85e09eb9eb923c780993df96a7545d41fe38725bd2b9f17f88677eb19ff0059396965b3115d7ee97aeb6e01c9b84014b6ffe06c111832fa3389ce851c2dba002529339f51be547a62e3ef462eb9899eeeca3f4a19e7137171b6e1dfc7777fa332901a77bb59e814c068c84e90660d0dfc5fb33d44806453a1ea8955ae75ac1b05787da0a5c89b66616e55c0a1a2555a084bcedaf808332d19b3b5db2d3674e696733dea41f8426947f3fb14b6cb6745f50fa589b3c3fdd220fb3e3136eec8a5203e2298e1a4a4d7eedaf88cf94bc3da7e17d18bbbc1a74c0e42b16d83a2001d463757592609e96d3db6f53fa7682174a7273f0072dc071060af8b3ba810f4edb45d2611a3bc7f6e70e174fe6cf125d16a9a97653eeebc20861651b2ecea0f7dc8db31fa7d365a46d0835b62591854c8b7f7d1f550aa90ac4f585f18577135d8fe489828eaaa23171762c83998922ffe91ca2acd59c79a9a63d51ee19199b11ff23af5edf9918568f121e8eaa482479fddf33661be4378bbab0a9864fd28220356c1f4d37af07ddf4e812e1ab0a415ddf499d9aa53357bc030a0be62c2bc7849d6f387739736e3287d7ca7b6d63d938e5b5adf3c91100556600638d3ffc14d615305254c03cf5a30a"
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_NAMES))
@@ -0,0 +1,145 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Chemin vectorisé facultatif, avec NumPy, pour signer et vérifier en masse.
+
+Une clé est un tableau uint8 de forme (2, 256, 32) : ligne 0 pour les bits à 0, ligne 1 pour
+les bits à 1. Un lot de N signatures est un tableau (N, 256, 32) et un lot de N hachages de
+messages un tableau (N, 32). Les bits des messages sont extraits avec np.unpackbits (ordre
+gros-boutiste, comme dans lamport.py) et les blocs attendus de la clé publique sont choisis
+par indexation avancée, sans boucle Python sur les bits. Seul le hachage des blocs reste
+fait bloc par bloc (par lamport.hash_blocks), puisque hashlib ne travaille que sur un message
+à la fois.
+
+Mémoire : vérifier un lot de N signatures alloue les N * 8 Kio des signatures hachées et les
+N * 8 Kio des blocs attendus ; verify_many, qui empile aussi une clé publique par signature
+(N * 16 Kio), limite N à `chunk_size` en découpant le flux.
+
+NumPy n'est pas une dépendance de tp1 : ce module lève ImportError s'il est absent.
+Il figure dans requirements.txt pour que les tests et mypy couvrent ce module.
+Utilisation :
+    pk_array = key_array(pk)
+    ok = verify_batch(digests, pk_array, sigs)   # tableau de N booléens
+"""
+
+from typing import Iterable, Iterator
+
+import itertools
+
+import numpy as np
+
+from tp1.hashes import SHA256, HashBackend
+from tp1.lamport import (
+    BLOCK_SIZE,
+    N_BITS,
+    BlockTable,
+    ExtendedSig,
+    Lamport,
+    Message,
+    PublicKey,
+    PublicKeyFingerprint,
+    Sig,
+    hash_blocks,
+)
+
+_POSITIONS = np.arange(N_BITS)
+
+
+def key_array(key: BlockTable) -> np.ndarray:
+    """
+    Retourne une vue (sans copie) des blocs d'une clé ou d'une signature,
+    de forme (lignes, 256, 32).
+    """
+    return np.frombuffer(key._view, dtype=np.uint8).reshape(
+        key.ROWS, N_BITS, BLOCK_SIZE
+    )
+
+
+def message_bits(digests) -> np.ndarray:
+    """
+    Retourne les bits des hachages de messages, de forme (N, 256), à partir d'un tableau
+    (N, 32) ou d'une suite de hachages de 32 octets.
+    """
+    if not isinstance(digests, np.ndarray):
+        digests = np.frombuffer(b"".join(bytes(d) for d in digests), dtype=np.uint8)
+    return np.unpackbits(digests.reshape(-1, BLOCK_SIZE), axis=1)
+
+
+def sign_array(digest: bytes, sk: np.ndarray) -> np.ndarray:
+    """
+    Retourne la signature (256, 32) du hachage `digest` avec la clé secrète `sk` (2, 256, 32).
+    """
+    return sk[message_bits([digest])[0], _POSITIONS]
+
+
+def hash_array(blocks: np.ndarray, backend: HashBackend = SHA256) -> np.ndarray:
+    """
+    Retourne le hachage de chacun des blocs de 32 octets d'un tableau, avec la même forme.
+    """
+    blocks = np.ascontiguousarray(blocks, dtype=np.uint8)
+    hashed = np.frombuffer(hash_blocks(blocks, backend), dtype=np.uint8)
+    return hashed.reshape(blocks.shape)
+
+
+def verify_batch(
+    digests, pk: np.ndarray, sigs: np.ndarray, backend: HashBackend = SHA256
+) -> np.ndarray:
+    """
+    Vérifie N signatures (N, 256, 32) des hachages `digests` (tableau (N, 32)
+    ou suite de hachages).
+    `pk` est soit une seule clé publique (2, 256, 32), partagée par tout le lot,
+    soit une clé par signature (N, 2, 256, 32).
+    Retourne un tableau de N booléens.
+    """
+    sigs = np.asarray(sigs, dtype=np.uint8).reshape(-1, N_BITS, BLOCK_SIZE)
+    bits = message_bits(digests)
+    if len(bits) != len(sigs):
+        raise ValueError(f"{len(bits)} messages pour {len(sigs)} signatures.")
+
+    if pk.ndim == 3:
+        expected = pk[bits, _POSITIONS]
+    else:
+        expected = pk[np.arange(len(sigs))[:, None], bits, _POSITIONS]
+
+    return (hash_array(sigs, backend) == expected).all(axis=(1, 2))
+
+
+def verify_many(
+    items: Iterable[
+        tuple[Message, PublicKey | PublicKeyFingerprint, Sig | ExtendedSig]
+    ],
+    chunk_size: int = 256,
+) -> Iterator[bool]:
+    """
+    Équivalent vectorisé de Lamport.verify_many dans le processus courant : vérifie les
+    triplets (message, clé publique, signature) par paquets de `chunk_size` et produit
+    le résultat de chacun, dans l'ordre d'entrée.
+    Comme pour Lamport.verify, une signature étendue est ramenée à sa signature ordinaire,
+    et une empreinte est vérifiée en reconstruisant la clé publique complète.
+    """
+    items = iter(items)
+    while chunk := list(itertools.islice(items, chunk_size)):
+        results: list[bool] = [False] * len(chunk)
+        batch = []
+        for i, (msg, pk, sig) in enumerate(chunk):
+            if isinstance(pk, PublicKeyFingerprint):
+                results[i] = Lamport.verify(msg, pk, sig)
+            elif pk.backend is sig.backend:
+                if isinstance(sig, ExtendedSig):
+                    sig = sig.sig()
+                batch.append((i, msg, pk, sig))
+
+        backends = {pk.backend for _, _, pk, _ in batch}
+        if len(backends) > 1:
+            # Fonctions de hachage mélangées : chaque triplet est vérifié avec la sienne.
+            for i, msg, pk, sig in batch:
+                ok = verify_batch([msg.data], key_array(pk), key_array(sig), pk.backend)
+                results[i] = bool(ok[0])
+        elif batch:
+            digests = [msg.data for _, msg, _, _ in batch]
+            pks = np.stack([key_array(pk) for _, _, pk, _ in batch])
+            sigs = np.concatenate([key_array(sig) for _, _, _, sig in batch])
+            oks = verify_batch(digests, pks, sigs, backends.pop())
+            for (i, _, _, _), ok in zip(batch, oks):
+                results[i] = bool(ok)
+        yield from results
@@ -0,0 +1,223 @@
+"""
+Travail Pratique 1 : Signatures basées sur le hachage
+
+Dans ce module, nous implémentons le schéma de signature à usage unique de Winternitz (W-OTS),
+une alternative à Lamport qui échange de la taille contre du temps de calcul.
+
+Le hachage du message (un Message, comme pour Lamport) est découpé en chiffres de log2(w) bits,
+lus du bit le plus significatif au bit le moins significatif (la même orientation gros-boutiste
+que dans forge.py). On y ajoute une somme de contrôle, elle aussi découpée en chiffres, qui empêche
+un attaquant d'avancer les chaînes pour signer un autre message.
+
+Chaque chiffre d correspond à une chaîne de hachage de longueur w - 1 : la clé secrète est le début
+de la chaîne, la clé publique sa fin, et la signature révèle l'élément d de la chaîne. Le vérificateur
+hache alors w - 1 - d fois pour retrouver la clé publique.
+
+Avec w = 16, une signature fait 67 blocs au lieu de 256 ; avec w = 256, 34 blocs.
+Exécutez `python -m tp1.winternitz` pour afficher le tableau des tailles et des temps.
+"""
+
+from typing import Self
+
+import hashlib
+import secrets
+import time
+
+from tp1.lamport import BLOCK_SIZE, N_BITS, Lamport, Message
+
+# Valeurs de w acceptées : chaque chiffre du message doit tenir dans un nombre entier de bits
+# qui divise 8, pour ne jamais chevaucher deux octets.
+SUPPORTED_W = (2, 4, 16, 256)
+
+
+def lengths(w: int) -> tuple[int, int]:
+    """
+    Retourne le nombre de chiffres du message et le nombre de chiffres de la somme de contrôle.
+    """
+    if w not in SUPPORTED_W:
+        raise ValueError(
+            f"Paramètre de Winternitz {w} invalide, choisir parmi {SUPPORTED_W}."
+        )
+    bits = w.bit_length() - 1
+    len1 = N_BITS // bits
+    # La somme de contrôle vaut au plus len1 * (w - 1).
+    len2 = 1
+    while w**len2 <= len1 * (w - 1):
+        len2 += 1
+    return len1, len2
+
+
+def digits(data: bytes, w: int) -> list[int]:
+    """
+    Retourne les chiffres en base w du hachage `data` suivis de ceux de sa somme de contrôle,
+    du plus significatif au moins significatif.
+    """
+    len1, len2 = lengths(w)
+    bits = w.bit_length() - 1
+    per_byte = 8 // bits
+    result = [
+        data[i // per_byte] >> (8 - bits * (i % per_byte + 1)) & (w - 1)
+        for i in range(len1)
+    ]
+    checksum = sum(w - 1 - d for d in result)
+    result.extend(checksum // w ** (len2 - 1 - j) % w for j in range(len2))
+    return result
+
+
+def _chain(x: bytes, steps: int) -> bytes:
+    """
+    Applique `steps` fois sha256 à partir de x.
+    """
+    for _ in range(steps):
+        x = hashlib.sha256(x).digest()
+    return x
+
+
+class ChainTable:
+    """
+    Base commune des clés et signatures de Winternitz : une suite de blocs de 32 octets,
+    un par chaîne, dans un seul tampon contigu, avec le paramètre w qui les a produits.
+    """
+
+    def __init__(self, w: int, buffer=None):
+        len1, len2 = lengths(w)
+        self.w = w
+        self.count = len1 + len2
+        if buffer is None:
+            buffer = bytearray(self.count * BLOCK_SIZE)
+        if len(buffer) != self.count * BLOCK_SIZE:
+            raise ValueError(
+                f"{type(self).__name__} de longueur {len(buffer)}, "
+                f"au lieu de {self.count * BLOCK_SIZE}."
+            )
+        self._buffer = buffer
+        self._view = memoryview(buffer)
+
+    def block(self, i: int) -> memoryview:
+        """
+        Retourne une vue (sans copie) sur le bloc de la chaîne i.
+        """
+        return self._view[BLOCK_SIZE * i : BLOCK_SIZE * (i + 1)]
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> Self:
+        """
+        Retourne un objet à partir de sa forme binaire (voir to_bytes).
+        """
+        if not data:
+            raise ValueError(f"{cls.__name__} vide.")
+        return cls(1 << data[0], bytearray(data[1:]))
+
+    def to_bytes(self) -> bytes:
+        """
+        Retourne la forme binaire de l'objet : log2(w) sur un octet, puis les blocs dans l'ordre.
+        """
+        return bytes([self.w.bit_length() - 1]) + self._view.tobytes()
+
+    @classmethod
+    def from_hex(cls, s: str) -> Self:
+        """
+        Prend une chaîne de to_hex() et la transforme en objet.
+        """
+        return cls.from_bytes(bytes.fromhex(s))
+
+    def to_hex(self) -> str:
+        """
+        Retourne une chaîne hexadécimale de l'objet.
+        """
+        return self.to_bytes().hex()
+
+
+class WinternitzSecretKey(ChainTable):
+    pass
+
+
+class WinternitzPublicKey(ChainTable):
+    pass
+
+
+class WinternitzSig(ChainTable):
+    pass
+
+
+class Winternitz:
+    @classmethod
+    def generate_keys(
+        cls, w: int = 16
+    ) -> tuple[WinternitzSecretKey, WinternitzPublicKey]:
+        len1, len2 = lengths(w)
+        sk = WinternitzSecretKey(
+            w, bytearray(secrets.token_bytes((len1 + len2) * BLOCK_SIZE))
+        )
+        pk = WinternitzPublicKey(w)
+
+        for i in range(sk.count):
+            pk.block(i)[:] = _chain(sk.block(i), w - 1)
+
+        return sk, pk
+
+    @classmethod
+    def sign(cls, msg: Message, sk: WinternitzSecretKey) -> WinternitzSig:
+        sig = WinternitzSig(sk.w)
+
+        for i, d in enumerate(digits(msg.data, sk.w)):
+            sig.block(i)[:] = _chain(sk.block(i), d)
+
+        return sig
+
+    @classmethod
+    def verify(cls, msg: Message, pk: WinternitzPublicKey, sig: WinternitzSig) -> bool:
+        if pk.w != sig.w:
+            return False
+
+        w = pk.w
+        computed = b"".join(
+            _chain(sig.block(i), w - 1 - d) for i, d in enumerate(digits(msg.data, w))
+        )
+        return secrets.compare_digest(computed, pk._view.tobytes())
+
+
+def _time_ms(f, repeat: int = 20) -> float:
+    """
+    Retourne la durée moyenne d'un appel à f, en millisecondes.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        f()
+    return (time.perf_counter() - start) * 1000 / repeat
+
+
+if __name__ == "__main__":
+    msg = Message.from_str("Chaîne de blocs")
+
+    table_headers = (
+        "Schéma        | Clé publique (Ko) | Signature (Ko) "
+        "| Génération (ms) | Signature (ms) | Vérification (ms)"
+    )
+    print("-" * len(table_headers))
+    print(table_headers)
+    print("-" * len(table_headers))
+
+    sk, pk = Lamport.generate_keys()
+    sig = Lamport.sign(msg, sk)
+    print(
+        f"{'Lamport':^14}|"
+        f"{len(pk.to_bytes()) / 1000:^19.2f}|"
+        f"{len(sig.to_bytes()) / 1000:^16.2f}|"
+        f"{_time_ms(Lamport.generate_keys):^17.2f}|"
+        f"{_time_ms(lambda: Lamport.sign(msg, sk)):^16.2f}|"
+        f"{_time_ms(lambda: Lamport.verify(msg, pk, sig)):^18.2f}"
+    )
+
+    for w in SUPPORTED_W:
+        sk, pk = Winternitz.generate_keys(w)
+        sig = Winternitz.sign(msg, sk)
+        print(
+            f"{f'W-OTS w={w}':^14}|"
+            f"{len(pk.to_bytes()) / 1000:^19.2f}|"
+            f"{len(sig.to_bytes()) / 1000:^16.2f}|"
+            f"{_time_ms(lambda: Winternitz.generate_keys(w)):^17.2f}|"
+            f"{_time_ms(lambda: Winternitz.sign(msg, sk)):^16.2f}|"
+            f"{_time_ms(lambda: Winternitz.verify(msg, pk, sig)):^18.2f}"
+        )
+    print("-" * len(table_headers))